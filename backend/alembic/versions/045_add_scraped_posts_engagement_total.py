@@ -0,0 +1,42 @@
+"""add generated engagement_total column and ranking indexes to scraped_posts
+
+Revision ID: 045
+Revises: 044
+Create Date: 2026-10-17
+
+engagement_total is a STORED generated column so viral-post ranking can
+read it from an index instead of summing three columns per row.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '045'
+down_revision = '044'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE scraped_posts ADD COLUMN IF NOT EXISTS engagement_total INTEGER "
+        "GENERATED ALWAYS AS (COALESCE(reaction_count, 0) + COALESCE(comment_count, 0) "
+        "+ COALESCE(share_count, 0)) STORED"
+    )
+    op.create_index(
+        "ix_scraped_posts_job_engagement",
+        "scraped_posts",
+        ["job_id", sa.text("engagement_total DESC")],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_scraped_posts_tenant_created",
+        "scraped_posts",
+        ["tenant_id", "created_time"],
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_scraped_posts_tenant_created", table_name="scraped_posts")
+    op.drop_index("ix_scraped_posts_job_engagement", table_name="scraped_posts")
+    op.drop_column("scraped_posts", "engagement_total")
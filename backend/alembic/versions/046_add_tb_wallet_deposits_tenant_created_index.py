@@ -0,0 +1,27 @@
+"""add (tenant_id, created_at) index to traffic_bot_wallet_deposits
+
+Revision ID: 046
+Revises: 045
+Create Date: 2026-10-17
+
+Backs keyset pagination of a tenant's deposit history.
+"""
+from alembic import op
+
+revision = '046'
+down_revision = '045'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_tb_wallet_deposits_tenant_created",
+        "traffic_bot_wallet_deposits",
+        ["tenant_id", "created_at"],
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_tb_wallet_deposits_tenant_created", table_name="traffic_bot_wallet_deposits")
@@ -0,0 +1,33 @@
+"""server-side now() defaults for credit and fan analysis timestamps
+
+Revision ID: 047
+Revises: 046
+Create Date: 2026-10-17
+
+The models now rely on the database to fill these timestamps instead of
+sending a Python-generated value with every INSERT/UPDATE.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '047'
+down_revision = '046'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = [
+    ("credit_packages", "created_at"),
+    ("credit_balances", "updated_at"),
+    ("credit_transactions", "created_at"),
+    ("fan_analysis_cache", "created_at"),
+]
+
+
+def upgrade():
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade():
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=None)
@@ -0,0 +1,39 @@
+"""replace credit_transactions created_at index with (tenant_id, created_at)
+
+Revision ID: 048
+Revises: 047
+Create Date: 2026-10-17
+
+Every ledger query is scoped to a tenant, so the standalone created_at
+index is superseded by the composite one.
+"""
+from alembic import op
+
+revision = '048'
+down_revision = '047'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_credit_tx_tenant_created",
+        "credit_transactions",
+        ["tenant_id", "created_at"],
+        if_not_exists=True,
+    )
+    op.drop_index(
+        "ix_credit_transactions_created_at",
+        table_name="credit_transactions",
+        if_exists=True,
+    )
+
+
+def downgrade():
+    op.create_index(
+        "ix_credit_transactions_created_at",
+        "credit_transactions",
+        ["created_at"],
+        if_not_exists=True,
+    )
+    op.drop_index("ix_credit_tx_tenant_created", table_name="credit_transactions")
@@ -0,0 +1,58 @@
+"""server-side now() defaults for Facebook Ads and scraping job timestamps
+
+Revision ID: 050
+Revises: 048
+Create Date: 2026-10-17
+
+The models now rely on the database to fill these timestamps instead of
+sending a Python-generated value with every INSERT/UPDATE.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '050'
+down_revision = '048'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = [
+    ("fb_connections", "connected_at"),
+    ("fb_connections", "created_at"),
+    ("fb_connections", "updated_at"),
+    ("fb_ad_accounts", "created_at"),
+    ("fb_ad_accounts", "updated_at"),
+    ("fb_pages", "created_at"),
+    ("fb_pixels", "created_at"),
+    ("fb_campaigns", "synced_at"),
+    ("fb_campaigns", "created_at"),
+    ("fb_adsets", "synced_at"),
+    ("fb_adsets", "created_at"),
+    ("fb_ads", "synced_at"),
+    ("fb_ads", "created_at"),
+    ("fb_insights", "synced_at"),
+    ("fb_insights", "created_at"),
+    ("fb_insight_scores", "scored_at"),
+    ("fb_insight_scores", "created_at"),
+    ("fb_winning_ads", "detected_at"),
+    ("fb_winning_ads", "created_at"),
+    ("ai_campaigns", "created_at"),
+    ("ai_campaigns", "updated_at"),
+    ("ai_campaign_adsets", "created_at"),
+    ("ai_campaign_ads", "created_at"),
+    ("scraping_jobs", "created_at"),
+    ("scraping_jobs", "updated_at"),
+    ("scraped_profiles", "created_at"),
+    ("extracted_comments", "created_at"),
+    ("scraped_posts", "created_at"),
+    ("page_author_profiles", "created_at"),
+]
+
+
+def upgrade():
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade():
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=None)
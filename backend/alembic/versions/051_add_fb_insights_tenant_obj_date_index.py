@@ -0,0 +1,36 @@
+"""replace fb_insights object_id/date indexes with a composite covering index
+
+Revision ID: 051
+Revises: 050
+Create Date: 2026-10-17
+
+Insight reads always filter (tenant_id, object_type, object_id) over a
+date range, so the single-column tenant_id, object_id and date indexes
+are superseded by the composite one.
+"""
+from alembic import op
+
+revision = '051'
+down_revision = '050'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_fb_insights_tenant_obj_date",
+        "fb_insights",
+        ["tenant_id", "object_type", "object_id", "date"],
+        postgresql_include=["spend", "impressions", "clicks", "results", "purchase_value"],
+        if_not_exists=True,
+    )
+    op.drop_index("ix_fb_insights_object_id", table_name="fb_insights", if_exists=True)
+    op.drop_index("ix_fb_insights_date", table_name="fb_insights", if_exists=True)
+    op.drop_index("ix_fb_insights_tenant_id", table_name="fb_insights", if_exists=True)
+
+
+def downgrade():
+    op.create_index("ix_fb_insights_tenant_id", "fb_insights", ["tenant_id"], if_not_exists=True)
+    op.create_index("ix_fb_insights_date", "fb_insights", ["date"], if_not_exists=True)
+    op.create_index("ix_fb_insights_object_id", "fb_insights", ["object_id"], if_not_exists=True)
+    op.drop_index("ix_fb_insights_tenant_obj_date", table_name="fb_insights")
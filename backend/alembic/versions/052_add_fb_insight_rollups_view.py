@@ -0,0 +1,38 @@
+"""add fb_insight_rollups materialized view
+
+Revision ID: 052
+Revises: 051
+Create Date: 2026-10-17
+
+Per-object insight totals, used by winning-ad detection instead of
+re-aggregating fb_insights on each run. The unique index is required for
+REFRESH MATERIALIZED VIEW CONCURRENTLY.
+"""
+from alembic import op
+
+revision = '052'
+down_revision = '051'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE MATERIALIZED VIEW IF NOT EXISTS fb_insight_rollups AS "
+        "SELECT tenant_id, object_type, object_id, "
+        "SUM(spend)::bigint AS spend, "
+        "SUM(impressions)::bigint AS impressions, "
+        "SUM(clicks)::bigint AS clicks, "
+        "SUM(results)::bigint AS results, "
+        "SUM(purchase_value)::bigint AS purchase_value "
+        "FROM fb_insights "
+        "GROUP BY tenant_id, object_type, object_id"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_fb_insight_rollups_object "
+        "ON fb_insight_rollups (tenant_id, object_type, object_id)"
+    )
+
+
+def downgrade():
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS fb_insight_rollups")
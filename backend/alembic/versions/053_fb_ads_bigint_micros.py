@@ -0,0 +1,79 @@
+"""store FB insight ratios and scores as BIGINT millionths
+
+Revision ID: 053
+Revises: 052
+Create Date: 2026-10-17
+
+ctr/roas/score move from numeric to int8 fixed-point (value * 1e6, see
+app.models.fb_ads.Micros), and the summed money columns widen to BIGINT.
+fb_insight_rollups reads fb_insights.spend/purchase_value, so it is
+dropped and recreated around the type change.
+"""
+from alembic import op
+
+revision = '053'
+down_revision = '052'
+branch_labels = None
+depends_on = None
+
+_MICROS_COLUMNS = [
+    ("fb_insights", "ctr"),
+    ("fb_insights", "roas"),
+    ("fb_insight_scores", "score"),
+    ("fb_winning_ads", "score"),
+    ("fb_winning_ads", "roas"),
+    ("fb_winning_ads", "ctr"),
+]
+
+_BIGINT_COLUMNS = [
+    ("fb_insights", "spend"),
+    ("fb_insights", "purchase_value"),
+    ("fb_winning_ads", "total_spend"),
+]
+
+_NUMERIC_TYPES = {"score": "NUMERIC(4, 2)"}
+
+_ROLLUPS_SQL = (
+    "CREATE MATERIALIZED VIEW IF NOT EXISTS fb_insight_rollups AS "
+    "SELECT tenant_id, object_type, object_id, "
+    "SUM(spend)::bigint AS spend, "
+    "SUM(impressions)::bigint AS impressions, "
+    "SUM(clicks)::bigint AS clicks, "
+    "SUM(results)::bigint AS results, "
+    "SUM(purchase_value)::bigint AS purchase_value "
+    "FROM fb_insights "
+    "GROUP BY tenant_id, object_type, object_id"
+)
+
+
+def _recreate_rollups():
+    op.execute(_ROLLUPS_SQL)
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_fb_insight_rollups_object "
+        "ON fb_insight_rollups (tenant_id, object_type, object_id)"
+    )
+
+
+def upgrade():
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS fb_insight_rollups")
+    for table, column in _MICROS_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE BIGINT "
+            f"USING round({column} * 1000000)::bigint"
+        )
+    for table, column in _BIGINT_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE BIGINT")
+    _recreate_rollups()
+
+
+def downgrade():
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS fb_insight_rollups")
+    for table, column in _BIGINT_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE INTEGER")
+    for table, column in _MICROS_COLUMNS:
+        numeric_type = _NUMERIC_TYPES.get(column, "NUMERIC(8, 4)")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {numeric_type} "
+            f"USING ({column}::numeric / 1000000)"
+        )
+    _recreate_rollups()
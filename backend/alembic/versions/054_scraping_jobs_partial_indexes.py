@@ -0,0 +1,44 @@
+"""replace scraping_jobs status/scheduled_at/celery_task_id indexes with partial ones
+
+Revision ID: 054
+Revises: 053
+Create Date: 2026-10-17
+
+Completed jobs dominate the table but are never looked up by status or
+schedule, so the active-job index only covers in-flight rows.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '054'
+down_revision = '053'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_scraping_jobs_active",
+        "scraping_jobs",
+        ["status", "scheduled_at"],
+        postgresql_where=sa.text("status IN ('pending', 'scheduled', 'queued', 'running')"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_scraping_jobs_celery_active",
+        "scraping_jobs",
+        ["celery_task_id"],
+        postgresql_where=sa.text("celery_task_id IS NOT NULL"),
+        if_not_exists=True,
+    )
+    op.drop_index("ix_scraping_jobs_status", table_name="scraping_jobs", if_exists=True)
+    op.drop_index("ix_scraping_jobs_scheduled_at", table_name="scraping_jobs", if_exists=True)
+    op.drop_index("ix_scraping_jobs_celery_task_id", table_name="scraping_jobs", if_exists=True)
+
+
+def downgrade():
+    op.create_index("ix_scraping_jobs_celery_task_id", "scraping_jobs", ["celery_task_id"], if_not_exists=True)
+    op.create_index("ix_scraping_jobs_scheduled_at", "scraping_jobs", ["scheduled_at"], if_not_exists=True)
+    op.create_index("ix_scraping_jobs_status", "scraping_jobs", ["status"], if_not_exists=True)
+    op.drop_index("ix_scraping_jobs_celery_active", table_name="scraping_jobs")
+    op.drop_index("ix_scraping_jobs_active", table_name="scraping_jobs")
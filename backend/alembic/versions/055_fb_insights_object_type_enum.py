@@ -0,0 +1,59 @@
+"""store fb_insights.object_type as the fb_object_type enum
+
+Revision ID: 055
+Revises: 054
+Create Date: 2026-10-17
+
+fb_insight_rollups groups by object_type, so it is dropped and recreated
+around the type change.
+"""
+from alembic import op
+
+revision = '055'
+down_revision = '054'
+branch_labels = None
+depends_on = None
+
+_ROLLUPS_SQL = (
+    "CREATE MATERIALIZED VIEW IF NOT EXISTS fb_insight_rollups AS "
+    "SELECT tenant_id, object_type, object_id, "
+    "SUM(spend)::bigint AS spend, "
+    "SUM(impressions)::bigint AS impressions, "
+    "SUM(clicks)::bigint AS clicks, "
+    "SUM(results)::bigint AS results, "
+    "SUM(purchase_value)::bigint AS purchase_value "
+    "FROM fb_insights "
+    "GROUP BY tenant_id, object_type, object_id"
+)
+
+
+def _recreate_rollups():
+    op.execute(_ROLLUPS_SQL)
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_fb_insight_rollups_object "
+        "ON fb_insight_rollups (tenant_id, object_type, object_id)"
+    )
+
+
+def upgrade():
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS fb_insight_rollups")
+    op.execute(
+        "DO $$ BEGIN "
+        "CREATE TYPE fb_object_type AS ENUM ('campaign', 'adset', 'ad'); "
+        "EXCEPTION WHEN duplicate_object THEN NULL; END $$"
+    )
+    op.execute(
+        "ALTER TABLE fb_insights ALTER COLUMN object_type TYPE fb_object_type "
+        "USING object_type::fb_object_type"
+    )
+    _recreate_rollups()
+
+
+def downgrade():
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS fb_insight_rollups")
+    op.execute(
+        "ALTER TABLE fb_insights ALTER COLUMN object_type TYPE VARCHAR(20) "
+        "USING object_type::text"
+    )
+    op.execute("DROP TYPE IF EXISTS fb_object_type")
+    _recreate_rollups()
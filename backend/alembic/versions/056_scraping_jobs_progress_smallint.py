@@ -0,0 +1,28 @@
+"""store scraping_jobs.progress_pct as SMALLINT hundredths of a percent
+
+Revision ID: 056
+Revises: 055
+Create Date: 2026-10-17
+
+0-100.00 becomes 0-10000 (see app.models.types.BasisPoints).
+"""
+from alembic import op
+
+revision = '056'
+down_revision = '055'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE scraping_jobs ALTER COLUMN progress_pct TYPE SMALLINT "
+        "USING round(progress_pct * 100)::smallint"
+    )
+
+
+def downgrade():
+    op.execute(
+        "ALTER TABLE scraping_jobs ALTER COLUMN progress_pct TYPE NUMERIC(5, 2) "
+        "USING (progress_pct::numeric / 100)"
+    )
@@ -0,0 +1,110 @@
+"""partition fb_insights by month on date
+
+Revision ID: 057
+Revises: 056
+Create Date: 2026-10-17
+
+The table is rebuilt as PARTITION BY RANGE (date) with one partition per
+month (fb_insights_pYYYYMM) plus a default partition, and the existing
+rows are copied across. The primary key becomes (id, date) because
+PostgreSQL requires the partition key in every unique constraint.
+Partitions for upcoming months are created by
+app.scraping.fb_sync_tasks.ensure_insight_partitions.
+"""
+from alembic import op
+
+revision = '057'
+down_revision = '056'
+branch_labels = None
+depends_on = None
+
+_ROLLUPS_SQL = (
+    "CREATE MATERIALIZED VIEW IF NOT EXISTS fb_insight_rollups AS "
+    "SELECT tenant_id, object_type, object_id, "
+    "SUM(spend)::bigint AS spend, "
+    "SUM(impressions)::bigint AS impressions, "
+    "SUM(clicks)::bigint AS clicks, "
+    "SUM(results)::bigint AS results, "
+    "SUM(purchase_value)::bigint AS purchase_value "
+    "FROM fb_insights "
+    "GROUP BY tenant_id, object_type, object_id"
+)
+
+
+def _recreate_rollups():
+    op.execute(_ROLLUPS_SQL)
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_fb_insight_rollups_object "
+        "ON fb_insight_rollups (tenant_id, object_type, object_id)"
+    )
+
+
+def _add_constraints_and_indexes(primary_key: str):
+    op.execute(f"ALTER TABLE fb_insights ADD CONSTRAINT fb_insights_pkey PRIMARY KEY ({primary_key})")
+    op.execute(
+        "ALTER TABLE fb_insights ADD CONSTRAINT uq_fb_insight_object_date "
+        "UNIQUE (object_type, object_id, date)"
+    )
+    op.execute(
+        "ALTER TABLE fb_insights ADD FOREIGN KEY (tenant_id) "
+        "REFERENCES tenants (id) ON DELETE CASCADE"
+    )
+    op.execute(
+        "CREATE INDEX ix_fb_insights_tenant_obj_date ON fb_insights "
+        "(tenant_id, object_type, object_id, date) "
+        "INCLUDE (spend, impressions, clicks, results, purchase_value)"
+    )
+
+
+def _detach_old_table():
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS fb_insight_rollups")
+    op.execute("ALTER TABLE fb_insights RENAME TO fb_insights_old")
+    op.execute("ALTER TABLE fb_insights_old DROP CONSTRAINT IF EXISTS uq_fb_insight_object_date")
+    op.execute("ALTER TABLE fb_insights_old DROP CONSTRAINT IF EXISTS fb_insights_pkey")
+    op.execute("DROP INDEX IF EXISTS ix_fb_insights_tenant_obj_date")
+
+
+def upgrade():
+    _detach_old_table()
+    op.execute(
+        "CREATE TABLE fb_insights (LIKE fb_insights_old INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (date)"
+    )
+    _add_constraints_and_indexes("id, date")
+
+    # One partition per month from the oldest stored row through three
+    # months ahead; anything outside falls into the default partition
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month_start date := date_trunc('month', COALESCE(
+                (SELECT min(date) FROM fb_insights_old), current_date))::date;
+            last_month date := (date_trunc('month', current_date) + interval '3 months')::date;
+        BEGIN
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF fb_insights FOR VALUES FROM (%L) TO (%L)',
+                    'fb_insights_p' || to_char(month_start, 'YYYYMM'),
+                    month_start,
+                    (month_start + interval '1 month')::date
+                );
+                month_start := (month_start + interval '1 month')::date;
+            END LOOP;
+        END $$
+        """
+    )
+    op.execute("CREATE TABLE IF NOT EXISTS fb_insights_default PARTITION OF fb_insights DEFAULT")
+
+    op.execute("INSERT INTO fb_insights SELECT * FROM fb_insights_old")
+    op.execute("DROP TABLE fb_insights_old")
+    _recreate_rollups()
+
+
+def downgrade():
+    _detach_old_table()
+    op.execute("CREATE TABLE fb_insights (LIKE fb_insights_old INCLUDING DEFAULTS)")
+    _add_constraints_and_indexes("id")
+    op.execute("INSERT INTO fb_insights SELECT * FROM fb_insights_old")
+    op.execute("DROP TABLE fb_insights_old CASCADE")
+    _recreate_rollups()
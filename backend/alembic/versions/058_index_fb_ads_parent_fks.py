@@ -0,0 +1,32 @@
+"""index the parent FKs of fb_campaigns, fb_adsets and fb_ads
+
+Revision ID: 058
+Revises: 057
+Create Date: 2026-10-17
+
+Child rows are listed by their parent's internal id (campaigns per ad
+account, ad sets per campaign, ads per ad set) and ON DELETE CASCADE
+looks them up the same way; none of these FKs were indexed.
+"""
+from alembic import op
+
+revision = '058'
+down_revision = '057'
+branch_labels = None
+depends_on = None
+
+_INDEXES = [
+    ("ix_fb_campaigns_ad_account_id", "fb_campaigns", "ad_account_id"),
+    ("ix_fb_adsets_campaign_id", "fb_adsets", "campaign_id"),
+    ("ix_fb_ads_adset_id", "fb_ads", "adset_id"),
+]
+
+
+def upgrade():
+    for name, table, column in _INDEXES:
+        op.create_index(name, table, [column], if_not_exists=True)
+
+
+def downgrade():
+    for name, table, _ in _INDEXES:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,26 @@
+"""drop the standalone tenant_id indexes on fb_adsets and fb_ads
+
+Revision ID: 059
+Revises: 058
+Create Date: 2026-10-17
+
+Ad sets and ads are only ever looked up by id or by parent FK, with
+tenant_id as an extra guard on the already-selected rows, so the
+single-column tenant indexes are never chosen by the planner.
+"""
+from alembic import op
+
+revision = '059'
+down_revision = '058'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index("ix_fb_adsets_tenant_id", table_name="fb_adsets", if_exists=True)
+    op.drop_index("ix_fb_ads_tenant_id", table_name="fb_ads", if_exists=True)
+
+
+def downgrade():
+    op.create_index("ix_fb_adsets_tenant_id", "fb_adsets", ["tenant_id"], if_not_exists=True)
+    op.create_index("ix_fb_ads_tenant_id", "fb_ads", ["tenant_id"], if_not_exists=True)
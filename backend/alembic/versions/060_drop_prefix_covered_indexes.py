@@ -0,0 +1,37 @@
+"""drop single-column indexes already covered by a composite prefix
+
+Revision ID: 060
+Revises: 059
+Create Date: 2026-10-17
+
+Each of these columns is the leading column of a composite index or
+unique constraint on the same table, which serves equality lookups on
+it just as well.
+"""
+from alembic import op
+
+revision = '060'
+down_revision = '059'
+branch_labels = None
+depends_on = None
+
+_INDEXES = [
+    # covered by ix_scraped_posts_job_engagement (job_id, engagement_total DESC)
+    ("ix_scraped_posts_job_id", "scraped_posts", "job_id"),
+    # covered by ix_credit_tx_tenant_created (tenant_id, created_at)
+    ("ix_credit_transactions_tenant_id", "credit_transactions", "tenant_id"),
+    # covered by ix_tb_wallet_deposits_tenant_created (tenant_id, created_at)
+    ("ix_traffic_bot_wallet_deposits_tenant_id", "traffic_bot_wallet_deposits", "tenant_id"),
+    # covered by uq_competitor_tenant_page (tenant_id, page_id)
+    ("ix_competitor_pages_tenant_id", "competitor_pages", "tenant_id"),
+]
+
+
+def upgrade():
+    for name, table, _ in _INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def downgrade():
+    for name, table, column in _INDEXES:
+        op.create_index(name, table, [column], if_not_exists=True)
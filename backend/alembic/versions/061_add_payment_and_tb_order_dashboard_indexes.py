@@ -0,0 +1,50 @@
+"""add composite indexes for admin payment and traffic bot order queries
+
+Revision ID: 061
+Revises: 060
+Create Date: 2026-10-17
+
+Built CONCURRENTLY so the payments and orders tables stay writable while
+the indexes are created. The single-column payments.tenant_id index is
+covered by ix_payments_tenant_status_created and is dropped.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '061'
+down_revision = '060'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_payments_status_created", "payments", ["status", "created_at"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            "ix_payments_tenant_status_created", "payments", ["tenant_id", "status", "created_at"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            "ix_payments_completed_amount", "payments", ["amount_cents"],
+            postgresql_where=sa.text("status = 'completed'"),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            "ix_tb_orders_status_created", "traffic_bot_orders", ["status", "created_at"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_payments_tenant_id", table_name="payments",
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+
+def downgrade():
+    op.create_index("ix_payments_tenant_id", "payments", ["tenant_id"], if_not_exists=True)
+    op.drop_index("ix_tb_orders_status_created", table_name="traffic_bot_orders")
+    op.drop_index("ix_payments_completed_amount", table_name="payments")
+    op.drop_index("ix_payments_tenant_status_created", table_name="payments")
+    op.drop_index("ix_payments_status_created", table_name="payments")
@@ -0,0 +1,37 @@
+"""store traffic bot wallet balance and ledger amounts as BIGINT ten-thousandths
+
+Revision ID: 062
+Revises: 061
+Create Date: 2026-10-17
+
+NUMERIC(12, 4) becomes an integer count of 1/10000 units (see
+app.models.types.Money). The non-negative balance check holds unchanged.
+"""
+from alembic import op
+
+revision = '062'
+down_revision = '061'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = [
+    ("traffic_bot_wallets", "balance"),
+    ("traffic_bot_transactions", "amount"),
+    ("traffic_bot_transactions", "balance_after"),
+]
+
+
+def upgrade():
+    for table, column in _COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE BIGINT "
+            f"USING round({column} * 10000)::bigint"
+        )
+
+
+def downgrade():
+    for table, column in _COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE NUMERIC(12, 4) "
+            f"USING ({column}::numeric / 10000)"
+        )
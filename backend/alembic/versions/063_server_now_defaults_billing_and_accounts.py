@@ -0,0 +1,44 @@
+"""server-side now() defaults for account, billing and traffic bot timestamps
+
+Revision ID: 063
+Revises: 062
+Create Date: 2026-10-17
+
+Same change as 050 for the remaining models that generated timestamps in
+Python on every INSERT/UPDATE.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '063'
+down_revision = '062'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = [
+    ("tenants", "created_at"),
+    ("tenants", "updated_at"),
+    ("users", "created_at"),
+    ("users", "updated_at"),
+    ("payments", "created_at"),
+    ("payments", "updated_at"),
+    ("platforms", "created_at"),
+    ("system_settings", "updated_at"),
+    ("traffic_bot_wallets", "updated_at"),
+    ("traffic_bot_transactions", "created_at"),
+    ("traffic_bot_services", "created_at"),
+    ("traffic_bot_services", "updated_at"),
+    ("traffic_bot_orders", "created_at"),
+    ("traffic_bot_orders", "updated_at"),
+    ("traffic_bot_wallet_deposits", "created_at"),
+]
+
+
+def upgrade():
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade():
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=None)
@@ -0,0 +1,35 @@
+"""add generated job-limit columns to tenants
+
+Revision ID: 064
+Revises: 063
+Create Date: 2026-10-17
+
+max_concurrent_jobs, daily_job_limit and monthly_credit_limit are STORED
+generated columns over tenants.settings, with the same defaults the job
+submission path applied in Python (3, 0 and 0).
+"""
+from alembic import op
+
+revision = '064'
+down_revision = '063'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = [
+    ("max_concurrent_jobs", 3),
+    ("daily_job_limit", 0),
+    ("monthly_credit_limit", 0),
+]
+
+
+def upgrade():
+    for column, default in _COLUMNS:
+        op.execute(
+            f"ALTER TABLE tenants ADD COLUMN IF NOT EXISTS {column} INTEGER "
+            f"GENERATED ALWAYS AS (COALESCE(CAST(settings ->> '{column}' AS INTEGER), {default})) STORED"
+        )
+
+
+def downgrade():
+    for column, _ in reversed(_COLUMNS):
+        op.drop_column("tenants", column)
@@ -0,0 +1,25 @@
+"""make users.email case-insensitive (citext)
+
+Revision ID: 065
+Revises: 064
+Create Date: 2026-10-17
+
+The existing unique index becomes case-insensitive, so lookups no longer
+need lower(email) (which could not use the index). Fails if two accounts
+differ only by email case; those must be merged first.
+"""
+from alembic import op
+
+revision = '065'
+down_revision = '064'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE citext")
+
+
+def downgrade():
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE VARCHAR(255)")
@@ -0,0 +1,58 @@
+"""store payment method/status and traffic bot transaction type as enums
+
+Revision ID: 066
+Revises: 065
+Create Date: 2026-10-17
+
+ix_payments_completed_amount is dropped and recreated around the type
+change: its predicate would otherwise keep comparing status as text and
+stop matching enum comparisons.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '066'
+down_revision = '065'
+branch_labels = None
+depends_on = None
+
+_ENUMS = [
+    # (type name, values, table, column, previous type)
+    ("payment_method", ("stripe", "bank_transfer"), "payments", "method", "VARCHAR(30)"),
+    ("payment_status", ("pending", "completed", "failed", "refunded"), "payments", "status", "VARCHAR(30)"),
+    ("tb_transaction_type", ("deposit", "order_payment", "refund"), "traffic_bot_transactions", "type", "VARCHAR(30)"),
+]
+
+
+def _create_completed_amount_index():
+    op.create_index(
+        "ix_payments_completed_amount", "payments", ["amount_cents"],
+        postgresql_where=sa.text("status = 'completed'"), if_not_exists=True,
+    )
+
+
+def upgrade():
+    op.drop_index("ix_payments_completed_amount", table_name="payments", if_exists=True)
+    for name, values, table, column, _ in _ENUMS:
+        labels = ", ".join(f"'{v}'" for v in values)
+        op.execute(
+            "DO $$ BEGIN "
+            f"CREATE TYPE {name} AS ENUM ({labels}); "
+            "EXCEPTION WHEN duplicate_object THEN NULL; END $$"
+        )
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {name} "
+            f"USING {column}::{name}"
+        )
+    _create_completed_amount_index()
+
+
+def downgrade():
+    op.drop_index("ix_payments_completed_amount", table_name="payments", if_exists=True)
+    for name, _, table, column, previous in _ENUMS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {previous} "
+            f"USING {column}::text"
+        )
+        op.execute(f"DROP TYPE IF EXISTS {name}")
+    _create_completed_amount_index()
@@ -0,0 +1,30 @@
+"""drop payments.updated_at
+
+Revision ID: 067
+Revises: 066
+Create Date: 2026-10-17
+
+Nothing reads it: completed_at and refunded_at record the transitions and
+rejections are in the audit log.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '067'
+down_revision = '066'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("ALTER TABLE payments DROP COLUMN IF EXISTS updated_at")
+
+
+def downgrade():
+    op.add_column(
+        "payments",
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True),
+            server_default=sa.func.now(), nullable=False,
+        ),
+    )
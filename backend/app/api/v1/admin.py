@@ -8,10 +8,12 @@ from app.dependencies import get_super_admin
 from app.models.user import User
 from app.models.tenant import Tenant
 from app.models.job import ScrapingJob
-from app.models.payment import Payment
+from app.models.payment import Payment, PaymentStatus
 from app.models.credit import CreditBalance, CreditPackage, CreditTransaction
 from app.models.audit import AuditLog
 from app.models.system import SystemSetting
+from app.services import cache
+from app.services.system_settings import setting_cache_key
 from app.services.whatsapp_notify import notify_payment_approved, notify_refund_processed
 from pydantic import BaseModel, Field
 from app.schemas.admin import (
@@ -36,49 +38,38 @@ from app.schemas.payment import PaymentResponse
 
 router = APIRouter()
 
+DASHBOARD_CACHE_KEY = "admin:dashboard"
+# Platform-wide totals; a few seconds stale is fine for the admin overview
+DASHBOARD_CACHE_TTL = 30
+
 
 @router.get("/dashboard", response_model=AdminDashboardResponse)
 async def admin_dashboard(
     admin: User = Depends(get_super_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    total_users = (await db.execute(select(func.count(User.id)))).scalar() or 0
-    total_tenants = (await db.execute(select(func.count(Tenant.id)))).scalar() or 0
-    total_jobs = (await db.execute(select(func.count(ScrapingJob.id)))).scalar() or 0
-    active_jobs = (
-        await db.execute(
-            select(func.count(ScrapingJob.id)).where(ScrapingJob.status.in_(["queued", "running"]))
-        )
-    ).scalar() or 0
-
-    total_revenue = (
-        await db.execute(
-            select(func.coalesce(func.sum(Payment.amount_cents), 0)).where(Payment.status == "completed")
-        )
-    ).scalar() or 0
-
-    total_credits_sold = (
-        await db.execute(
+    async def _load() -> dict:
+        today_start = datetime.combine(date.today(), datetime.min.time(), tzinfo=timezone.utc)
+        # All seven aggregates as scalar subqueries of one statement
+        row = (await db.execute(select(
+            select(func.count(User.id)).scalar_subquery().label("total_users"),
+            select(func.count(Tenant.id)).scalar_subquery().label("total_tenants"),
+            select(func.count(ScrapingJob.id)).scalar_subquery().label("total_jobs"),
             select(func.coalesce(func.sum(CreditBalance.lifetime_purchased), 0))
-        )
-    ).scalar() or 0
-
-    today_start = datetime.combine(date.today(), datetime.min.time(), tzinfo=timezone.utc)
-    jobs_today = (
-        await db.execute(
-            select(func.count(ScrapingJob.id)).where(ScrapingJob.created_at >= today_start)
-        )
-    ).scalar() or 0
-
-    return AdminDashboardResponse(
-        total_users=total_users,
-        total_tenants=total_tenants,
-        total_jobs=total_jobs,
-        total_credits_sold=total_credits_sold,
-        total_revenue_cents=total_revenue,
-        active_jobs=active_jobs,
-        jobs_today=jobs_today,
-    )
+            .scalar_subquery().label("total_credits_sold"),
+            select(func.coalesce(func.sum(Payment.amount_cents), 0))
+            .where(Payment.status == "completed")
+            .scalar_subquery().label("total_revenue_cents"),
+            select(func.count(ScrapingJob.id))
+            .where(ScrapingJob.status.in_(["queued", "running"]))
+            .scalar_subquery().label("active_jobs"),
+            select(func.count(ScrapingJob.id))
+            .where(ScrapingJob.created_at >= today_start)
+            .scalar_subquery().label("jobs_today"),
+        ))).one()
+        return AdminDashboardResponse.model_validate(row._mapping).model_dump(mode="json")
+
+    return await cache.get_or_set(DASHBOARD_CACHE_KEY, _load, ttl=DASHBOARD_CACHE_TTL)
 
 
 @router.get("/users", response_model=list[UserResponse])
@@ -130,16 +121,18 @@ async def update_user(
 async def list_payments(
     admin: User = Depends(get_super_admin),
     db: AsyncSession = Depends(get_db),
-    status_filter: str | None = Query(None, alias="status"),
+    status_filter: PaymentStatus | None = Query(None, alias="status"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
 ):
-    query = select(Payment).order_by(Payment.created_at.desc())
+    # Only the response columns, as plain rows — no ORM instances to build
+    query = select(*(getattr(Payment, f) for f in PaymentResponse.model_fields))
+    query = query.order_by(Payment.created_at.desc())
     if status_filter:
         query = query.where(Payment.status == status_filter)
     query = query.offset((page - 1) * page_size).limit(page_size)
     result = await db.execute(query)
-    return result.scalars().all()
+    return result.mappings().all()
 
 
 @router.post("/payments/{payment_id}/approve", response_model=PaymentResponse)
@@ -514,11 +507,12 @@ async def get_tenant_concurrency(
     admin: User = Depends(get_super_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Tenant).where(Tenant.id == tenant_id))
-    tenant = result.scalar_one_or_none()
-    if not tenant:
+    max_concurrent = (await db.execute(
+        select(Tenant.max_concurrent_jobs).where(Tenant.id == tenant_id)
+    )).scalar_one_or_none()
+    if max_concurrent is None:
         raise HTTPException(status_code=404, detail="Tenant not found")
-    return {"max_concurrent_jobs": (tenant.settings or {}).get("max_concurrent_jobs", 3)}
+    return {"max_concurrent_jobs": max_concurrent}
 
 
 @router.put("/tenants/{tenant_id}/concurrency")
@@ -965,6 +959,7 @@ async def update_feature_flag(
         db.add(setting)
 
     await db.commit()
+    await cache.invalidate(setting_cache_key(db_key))
 
     from app.services.audit_service import write_audit
     await write_audit(db, "feature_flag.updated", user=admin,
@@ -9,6 +9,7 @@ from app.database import get_db
 from app.dependencies import get_current_admin
 from app.models.user import User
 from app.models.traffic_bot import TrafficBotService, TrafficBotWalletDeposit
+from app.services import cache
 from app.services import traffic_bot_service as svc
 from app.services import traffic_bot_api
 from app.schemas.traffic_bot import (
@@ -31,6 +32,9 @@ async def sync_services(
         count = await svc.sync_services(db)
     except Exception as exc:
         raise HTTPException(500, f"Sync failed: {exc}")
+    # Commit before invalidating so a concurrent read can't re-cache old rows
+    await db.commit()
+    await cache.invalidate_prefix(svc.SERVICES_CACHE_PREFIX)
     return {"synced": count}
 
 
@@ -59,7 +63,8 @@ async def update_service(
         service.is_enabled = body.is_enabled
     if body.sort_order is not None:
         service.sort_order = body.sort_order
-    await db.flush()
+    await db.commit()
+    await cache.invalidate_prefix(svc.SERVICES_CACHE_PREFIX)
     return service
 
 
@@ -74,7 +79,8 @@ async def bulk_update_fee(
         .where(TrafficBotService.category == body.category)
         .values(fee_pct=body.fee_pct)
     )
-    await db.flush()
+    await db.commit()
+    await cache.invalidate_prefix(svc.SERVICES_CACHE_PREFIX)
     return {"updated": result.rowcount}
 
 
@@ -89,12 +95,7 @@ async def list_all_orders(
     db: AsyncSession = Depends(get_db),
 ):
     orders, total = await svc.list_all_orders(db, status, limit, offset)
-    items = []
-    for o in orders:
-        resp = OrderResponse.model_validate(o)
-        if o.service:
-            resp.service_name = o.service.name
-        items.append(resp)
+    items = [OrderResponse.model_validate(o) for o in orders]
     return OrderListResponse(items=items, total=total, limit=limit, offset=offset)
 
 
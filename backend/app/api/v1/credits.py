@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.database import get_db
+from app.database import get_db, get_readonly_db
 from app.dependencies import get_current_user
 from app.models.user import User
 from app.models.credit import CreditBalance, CreditTransaction, CreditPackage
@@ -47,7 +47,7 @@ async def get_history(
 
 
 @router.get("/packages", response_model=list[CreditPackageResponse])
-async def get_packages(db: AsyncSession = Depends(get_db)):
+async def get_packages(db: AsyncSession = Depends(get_readonly_db)):
     result = await db.execute(
         select(CreditPackage)
         .where(CreditPackage.is_active == True)
@@ -108,7 +108,7 @@ async def get_credit_costs(
 
 
 @router.get("/public-config")
-async def get_public_config(db: AsyncSession = Depends(get_db)):
+async def get_public_config(db: AsyncSession = Depends(get_readonly_db)):
     """Public endpoint: returns payment model setting for landing page."""
     result = await db.execute(
         select(SystemSetting).where(SystemSetting.key == "payment_settings")
@@ -119,7 +119,7 @@ async def get_public_config(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/whatsapp-contact")
-async def get_whatsapp_contact(db: AsyncSession = Depends(get_db)):
+async def get_whatsapp_contact(db: AsyncSession = Depends(get_readonly_db)):
     """Public endpoint: returns WhatsApp contact number for tenant floating button."""
     result = await db.execute(
         select(SystemSetting).where(SystemSetting.key == "whatsapp_settings")
@@ -133,7 +133,7 @@ async def get_whatsapp_contact(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/tutorial-videos")
-async def get_tutorial_videos(db: AsyncSession = Depends(get_db)):
+async def get_tutorial_videos(db: AsyncSession = Depends(get_readonly_db)):
     """Public endpoint: returns tutorial video URLs for scrape type cards."""
     result = await db.execute(
         select(SystemSetting).where(SystemSetting.key == "tutorial_videos")
@@ -147,7 +147,7 @@ async def get_tutorial_videos(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/messenger-templates")
-async def get_messenger_templates(db: AsyncSession = Depends(get_db)):
+async def get_messenger_templates(db: AsyncSession = Depends(get_readonly_db)):
     """Public endpoint: returns messenger templates for profile outreach."""
     result = await db.execute(
         select(SystemSetting).where(SystemSetting.key == "messenger_templates")
@@ -159,7 +159,7 @@ async def get_messenger_templates(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/promo-banners")
-async def get_promo_banners(db: AsyncSession = Depends(get_db)):
+async def get_promo_banners(db: AsyncSession = Depends(get_readonly_db)):
     """Public endpoint: returns active promo banners for dashboard display."""
     result = await db.execute(
         select(SystemSetting).where(SystemSetting.key == "promo_banners")
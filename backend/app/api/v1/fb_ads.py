@@ -10,6 +10,7 @@ from fastapi.responses import RedirectResponse
 from pydantic import BaseModel
 from sqlalchemy import select, update, func, case
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.config import get_settings
 from app.database import get_db
@@ -1276,41 +1277,22 @@ async def trigger_sync(
         campaigns = await meta.list_campaigns(token, account.account_id)
         logger.info("Fetched %d campaigns from Meta for account %s", len(campaigns), account.account_id)
 
-        campaign_map: dict[str, FBCampaign] = {}  # campaign_id → DB obj
-        for c in campaigns:
-            existing = await db.execute(
-                select(FBCampaign).where(
-                    FBCampaign.tenant_id == user.tenant_id,
-                    FBCampaign.campaign_id == c["campaign_id"],
-                )
-            )
-            camp = existing.scalar_one_or_none()
-            if camp:
-                camp.name = c["name"]
-                camp.objective = c["objective"]
-                camp.status = c["status"]
-                camp.daily_budget = c["daily_budget"]
-                camp.lifetime_budget = c["lifetime_budget"]
-                camp.buying_type = c["buying_type"]
-                camp.raw_data = c["raw_data"]
-                camp.synced_at = datetime.now(timezone.utc)
-            else:
-                camp = FBCampaign(
-                    tenant_id=user.tenant_id,
-                    ad_account_id=account.id,
-                    campaign_id=c["campaign_id"],
-                    name=c["name"],
-                    objective=c["objective"],
-                    status=c["status"],
-                    daily_budget=c["daily_budget"],
-                    lifetime_budget=c["lifetime_budget"],
-                    buying_type=c["buying_type"],
-                    raw_data=c["raw_data"],
-                )
-                db.add(camp)
-                await db.flush()
-            campaign_map[c["campaign_id"]] = camp
-            stats["campaigns"] += 1
+        campaign_map = await FBCampaign.bulk_upsert_by_external_id(db, [
+            {
+                "tenant_id": user.tenant_id,
+                "ad_account_id": account.id,
+                "campaign_id": c["campaign_id"],
+                "name": c["name"],
+                "objective": c["objective"],
+                "status": c["status"],
+                "daily_budget": c["daily_budget"],
+                "lifetime_budget": c["lifetime_budget"],
+                "buying_type": c["buying_type"],
+                "raw_data": c["raw_data"],
+            }
+            for c in campaigns
+        ])  # campaign_id → DB id
+        stats["campaigns"] = len(campaign_map)
 
         # Commit campaigns immediately so they appear in the table
         conn.last_synced_at = datetime.now(timezone.utc)
@@ -1318,81 +1300,56 @@ async def trigger_sync(
         logger.info("Phase 1 committed: %d campaigns", stats["campaigns"])
 
         # ── Phase 2: Ad Sets + Ads ────────────────────────────────────────
+        # Rows are collected per level and written in one upsert each; on a
+        # rate limit whatever was fetched so far is still saved.
+        adset_rows: list[dict] = []
+        ad_rows: list[dict] = []
+        adset_map: dict[str, uuid.UUID] = {}
         try:
             for c in campaigns:
-                camp = campaign_map.get(c["campaign_id"])
-                if not camp:
+                camp_id = campaign_map.get(c["campaign_id"])
+                if not camp_id:
                     continue
-                adsets = await meta.list_adsets(token, c["campaign_id"])
-                for a in adsets:
-                    existing = await db.execute(
-                        select(FBAdSet).where(
-                            FBAdSet.tenant_id == user.tenant_id,
-                            FBAdSet.adset_id == a["adset_id"],
-                        )
-                    )
-                    adset = existing.scalar_one_or_none()
-                    if adset:
-                        adset.name = a["name"]
-                        adset.status = a["status"]
-                        adset.daily_budget = a["daily_budget"]
-                        adset.targeting = a["targeting"]
-                        adset.optimization_goal = a["optimization_goal"]
-                        adset.billing_event = a["billing_event"]
-                        adset.bid_strategy = a["bid_strategy"]
-                        adset.raw_data = a["raw_data"]
-                        adset.synced_at = datetime.now(timezone.utc)
-                    else:
-                        adset = FBAdSet(
-                            tenant_id=user.tenant_id,
-                            campaign_id=camp.id,
-                            adset_id=a["adset_id"],
-                            name=a["name"],
-                            status=a["status"],
-                            daily_budget=a["daily_budget"],
-                            targeting=a["targeting"],
-                            optimization_goal=a["optimization_goal"],
-                            billing_event=a["billing_event"],
-                            bid_strategy=a["bid_strategy"],
-                            raw_data=a["raw_data"],
-                        )
-                        db.add(adset)
-                        await db.flush()
-                    stats["adsets"] += 1
-
-                    ads = await meta.list_ads(token, a["adset_id"])
-                    for ad_data in ads:
-                        existing = await db.execute(
-                            select(FBAd).where(
-                                FBAd.tenant_id == user.tenant_id,
-                                FBAd.ad_id == ad_data["ad_id"],
-                            )
-                        )
-                        ad = existing.scalar_one_or_none()
-                        if ad:
-                            ad.name = ad_data["name"]
-                            ad.status = ad_data["status"]
-                            ad.creative_id = ad_data["creative_id"]
-                            ad.creative_data = ad_data["creative_data"]
-                            ad.raw_data = ad_data["raw_data"]
-                            ad.synced_at = datetime.now(timezone.utc)
-                        else:
-                            db.add(FBAd(
-                                tenant_id=user.tenant_id,
-                                adset_id=adset.id,
-                                ad_id=ad_data["ad_id"],
-                                name=ad_data["name"],
-                                status=ad_data["status"],
-                                creative_id=ad_data["creative_id"],
-                                creative_data=ad_data["creative_data"],
-                                raw_data=ad_data["raw_data"],
-                            ))
-                        stats["ads"] += 1
+                for a in await meta.list_adsets(token, c["campaign_id"]):
+                    adset_rows.append({
+                        "tenant_id": user.tenant_id,
+                        "campaign_id": camp_id,
+                        "adset_id": a["adset_id"],
+                        "name": a["name"],
+                        "status": a["status"],
+                        "daily_budget": a["daily_budget"],
+                        "targeting": a["targeting"],
+                        "optimization_goal": a["optimization_goal"],
+                        "billing_event": a["billing_event"],
+                        "bid_strategy": a["bid_strategy"],
+                        "raw_data": a["raw_data"],
+                    })
+            adset_map = await FBAdSet.bulk_upsert_by_external_id(db, adset_rows)
+
+            for adset_id, adset_pk in adset_map.items():
+                for ad_data in await meta.list_ads(token, adset_id):
+                    ad_rows.append({
+                        "tenant_id": user.tenant_id,
+                        "adset_id": adset_pk,
+                        "ad_id": ad_data["ad_id"],
+                        "name": ad_data["name"],
+                        "status": ad_data["status"],
+                        "creative_id": ad_data["creative_id"],
+                        "creative_data": ad_data["creative_data"],
+                        "raw_data": ad_data["raw_data"],
+                    })
+            stats["adsets"] = len(adset_map)
+            stats["ads"] = len(await FBAd.bulk_upsert_by_external_id(db, ad_rows))
             await db.commit()
             logger.info("Phase 2 committed: %d adsets, %d ads", stats["adsets"], stats["ads"])
         except httpx.HTTPStatusError as e:
             logger.warning("Rate limit during adsets/ads sync: %s", e)
-            await db.commit()  # save whatever we got so far
+            # save whatever we got so far
+            if not adset_map:
+                adset_map = await FBAdSet.bulk_upsert_by_external_id(db, adset_rows)
+            stats["adsets"] = len(adset_map)
+            stats["ads"] = len(await FBAd.bulk_upsert_by_external_id(db, ad_rows))
+            await db.commit()
             warnings.append("Ad sets/ads partially synced (rate limit). Try again in a few minutes.")
 
         # ── Phase 3: Insights ─────────────────────────────────────────────
@@ -1406,49 +1363,9 @@ async def trigger_sync(
                         token, account.account_id, date_from, date_to, level=level
                     )
                     logger.info("Fetched %d %s-level insight rows", len(rows), level)
-                    for row in rows:
-                        row_date = date.fromisoformat(row["date"]) if isinstance(row["date"], str) else row["date"]
-                        existing = await db.execute(
-                            select(FBInsight).where(
-                                FBInsight.tenant_id == user.tenant_id,
-                                FBInsight.object_type == row["object_type"],
-                                FBInsight.object_id == row["object_id"],
-                                FBInsight.date == row_date,
-                            )
-                        )
-                        insight = existing.scalar_one_or_none()
-                        if insight:
-                            insight.spend = row["spend"]
-                            insight.impressions = row["impressions"]
-                            insight.clicks = row["clicks"]
-                            insight.ctr = row["ctr"]
-                            insight.cpc = row["cpc"]
-                            insight.cpm = row["cpm"]
-                            insight.results = row["results"]
-                            insight.cost_per_result = row["cost_per_result"]
-                            insight.purchase_value = row["purchase_value"]
-                            insight.roas = row["roas"]
-                            insight.actions = row["actions"]
-                            insight.synced_at = datetime.now(timezone.utc)
-                        else:
-                            db.add(FBInsight(
-                                tenant_id=user.tenant_id,
-                                object_type=row["object_type"],
-                                object_id=row["object_id"],
-                                date=row_date,
-                                spend=row["spend"],
-                                impressions=row["impressions"],
-                                clicks=row["clicks"],
-                                ctr=row["ctr"],
-                                cpc=row["cpc"],
-                                cpm=row["cpm"],
-                                results=row["results"],
-                                cost_per_result=row["cost_per_result"],
-                                purchase_value=row["purchase_value"],
-                                roas=row["roas"],
-                                actions=row["actions"],
-                            ))
-                        stats["insights"] += 1
+                    stats["insights"] += await FBInsight.bulk_upsert(
+                        db, [{**row, "tenant_id": user.tenant_id} for row in rows]
+                    )
                     await db.commit()
                     logger.info("Phase 3 committed %s-level: %d total insights so far", level, stats["insights"])
                 except httpx.HTTPStatusError as e:
@@ -1458,6 +1375,14 @@ async def trigger_sync(
 
         logger.info("Sync complete for tenant %s: %s", user.tenant_id, stats)
 
+        # Rollups are refreshed by a debounced background task, not here:
+        # the refresh re-aggregates every tenant's insights. Winning-ad
+        # detection therefore sees this sync's insights up to
+        # ROLLUP_REFRESH_DEBOUNCE seconds (plus queue time) after it returns
+        if stats["insights"]:
+            from app.scraping.fb_sync_tasks import schedule_rollup_refresh
+            schedule_rollup_refresh()
+
     except httpx.HTTPStatusError as e:
         logger.error("Meta API error during sync for tenant %s: %s — %s", user.tenant_id, e.response.status_code, e.response.text)
         await db.rollback()
@@ -2123,13 +2048,12 @@ def _build_campaign_response(campaign: AICampaign, adsets: list | None = None) -
 async def _load_campaign_adsets(db: AsyncSession, campaign_id) -> list[AICampaignAdSetResponse]:
     """Load ad sets and ads for a campaign."""
     adsets_r = await db.execute(
-        select(AICampaignAdSet).where(AICampaignAdSet.campaign_id == campaign_id)
+        select(AICampaignAdSet)
+        .where(AICampaignAdSet.campaign_id == campaign_id)
+        .options(selectinload(AICampaignAdSet.ads), raiseload("*"))
     )
     adsets = []
     for adset in adsets_r.scalars().all():
-        ads_r = await db.execute(
-            select(AICampaignAd).where(AICampaignAd.adset_id == adset.id)
-        )
         ads = [
             AICampaignAdResponse(
                 id=str(ad.id),
@@ -2141,7 +2065,7 @@ async def _load_campaign_adsets(db: AsyncSession, campaign_id) -> list[AICampaig
                 cta_type=ad.cta_type,
                 destination_url=ad.destination_url,
             )
-            for ad in ads_r.scalars().all()
+            for ad in adset.ads
         ]
         adsets.append(AICampaignAdSetResponse(
             id=str(adset.id),
@@ -2646,32 +2570,29 @@ async def duplicate_ai_campaign(
 
     # Copy ad sets and ads
     adsets_r = await db.execute(
-        select(AICampaignAdSet).where(AICampaignAdSet.campaign_id == source.id)
+        select(AICampaignAdSet)
+        .where(AICampaignAdSet.campaign_id == source.id)
+        .options(selectinload(AICampaignAdSet.ads))
     )
     for src_adset in adsets_r.scalars().all():
-        new_adset = AICampaignAdSet(
+        db.add(AICampaignAdSet(
             campaign_id=new_campaign.id,
             name=src_adset.name,
             targeting=src_adset.targeting,
             daily_budget=src_adset.daily_budget,
-        )
-        db.add(new_adset)
-        await db.flush()
-
-        ads_r = await db.execute(
-            select(AICampaignAd).where(AICampaignAd.adset_id == src_adset.id)
-        )
-        for src_ad in ads_r.scalars().all():
-            db.add(AICampaignAd(
-                adset_id=new_adset.id,
-                name=src_ad.name,
-                headline=src_ad.headline,
-                primary_text=src_ad.primary_text,
-                description=src_ad.description,
-                creative_source=src_ad.creative_source,
-                cta_type=src_ad.cta_type,
-                destination_url=src_ad.destination_url,
-            ))
+            ads=[
+                AICampaignAd(
+                    name=src_ad.name,
+                    headline=src_ad.headline,
+                    primary_text=src_ad.primary_text,
+                    description=src_ad.description,
+                    creative_source=src_ad.creative_source,
+                    cta_type=src_ad.cta_type,
+                    destination_url=src_ad.destination_url,
+                )
+                for src_ad in src_adset.ads
+            ],
+        ))
 
     await db.commit()
     await db.refresh(new_campaign)
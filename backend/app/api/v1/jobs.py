@@ -10,7 +10,8 @@ from app.models.user import User
 from app.models.tenant import Tenant
 from app.models.job import ScrapingJob, ScrapedProfile, ExtractedComment, ScrapedPost, PageAuthorProfile
 from app.models.platform import Platform
-from app.models.system import SystemSetting
+from app.services import cache
+from app.services.system_settings import get_system_setting
 from app.schemas.job import (
     CreateJobRequest,
     ResumeJobRequest,
@@ -40,13 +41,9 @@ async def get_public_feature_flags(
     """Get feature flags relevant to job creation (any authenticated user)."""
     flags = {}
     for key, default_enabled in FEATURE_FLAG_DEFAULTS.items():
-        db_key = f"feature_flag_{key}"
-        result = await db.execute(
-            select(SystemSetting).where(SystemSetting.key == db_key)
-        )
-        setting = result.scalar_one_or_none()
-        if setting:
-            flags[key] = setting.value.get("enabled", default_enabled)
+        value = await get_system_setting(db, f"feature_flag_{key}")
+        if value:
+            flags[key] = value.get("enabled", default_enabled)
         else:
             flags[key] = default_enabled
     return {"flags": flags}
@@ -146,9 +143,11 @@ async def create_job(
         raise HTTPException(status_code=400, detail=f"Platform '{data.platform}' not found or disabled")
 
     # Concurrent job limit check
-    tenant_result = await db.execute(select(Tenant).where(Tenant.id == user.tenant_id))
-    tenant = tenant_result.scalar_one_or_none()
-    max_concurrent = (tenant.settings or {}).get("max_concurrent_jobs", 3) if tenant else 3
+    limits = (await db.execute(
+        select(Tenant.max_concurrent_jobs, Tenant.daily_job_limit, Tenant.monthly_credit_limit)
+        .where(Tenant.id == user.tenant_id)
+    )).one_or_none()
+    max_concurrent = limits.max_concurrent_jobs if limits else 3
 
     running_count_result = await db.execute(
         select(func.count(ScrapingJob.id)).where(
@@ -166,8 +165,7 @@ async def create_job(
         )
 
     # Daily job limit check
-    tenant_settings = tenant.settings or {} if tenant else {}
-    daily_job_limit = tenant_settings.get("daily_job_limit", 0)
+    daily_job_limit = limits.daily_job_limit if limits else 0
     if daily_job_limit > 0:
         today_start = datetime.combine(date.today(), datetime.min.time(), tzinfo=timezone.utc)
         daily_count = (await db.execute(
@@ -183,7 +181,7 @@ async def create_job(
             )
 
     # Monthly credit limit check
-    monthly_credit_limit = tenant_settings.get("monthly_credit_limit", 0)
+    monthly_credit_limit = limits.monthly_credit_limit if limits else 0
     if monthly_credit_limit > 0:
         month_start = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
         monthly_usage = (await db.execute(
@@ -232,6 +230,13 @@ async def create_job(
                       details={"job_type": data.job_type, "input": data.input_value,
                                "scheduled": bool(data.scheduled_at)})
 
+    if data.job_type == "post_discovery":
+        # Invalidate only once committed, or a concurrent read could re-cache
+        # the source pages without this job
+        await db.commit()
+        from app.api.v1.trends import source_pages_cache_key
+        await cache.invalidate(source_pages_cache_key(user.tenant_id))
+
     return job
 
 
@@ -461,6 +466,8 @@ async def resume_job(
     await db.commit()
 
     if original_job.job_type == "post_discovery":
+        from app.api.v1.trends import source_pages_cache_key
+        await cache.invalidate(source_pages_cache_key(new_job.tenant_id))
         from app.scraping.tasks import run_post_discovery_pipeline
         task = run_post_discovery_pipeline.delay(str(new_job.id))
     else:
@@ -410,10 +410,10 @@ async def payment_history(
     page_size: int = Query(20, ge=1, le=100),
 ):
     result = await db.execute(
-        select(Payment)
+        select(*(getattr(Payment, f) for f in PaymentResponse.model_fields))
         .where(Payment.tenant_id == user.tenant_id)
         .order_by(Payment.created_at.desc())
         .offset((page - 1) * page_size)
         .limit(page_size)
     )
-    return result.scalars().all()
+    return result.mappings().all()
@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel
 from uuid import UUID
-from app.database import get_db
+from app.database import get_readonly_db
 from app.models.platform import Platform
 
 router = APIRouter()
@@ -22,7 +22,7 @@ class PlatformResponse(BaseModel):
 
 
 @router.get("", response_model=list[PlatformResponse])
-async def list_platforms(db: AsyncSession = Depends(get_db)):
+async def list_platforms(db: AsyncSession = Depends(get_readonly_db)):
     result = await db.execute(
         select(Platform).where(Platform.is_enabled == True).order_by(Platform.name)
     )
@@ -18,6 +18,7 @@ from app.config import get_settings
 import redis.asyncio as aioredis
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 router = APIRouter()
 
 
@@ -103,8 +104,6 @@ async def stream_job_progress(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    settings = get_settings()
-
     async def event_generator():
         r = aioredis.from_url(settings.redis_url)
         pubsub = r.pubsub()
@@ -228,8 +227,6 @@ async def stream_live_comments(
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    settings = get_settings()
-
     async def event_generator():
         r = aioredis.from_url(settings.redis_url)
         pubsub = r.pubsub()
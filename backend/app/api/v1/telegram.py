@@ -12,6 +12,7 @@ from app.dependencies import get_current_user
 from app.models.user import User
 from app.services.telegram_notify import get_telegram_bot_token
 
+settings = get_settings()
 router = APIRouter()
 
 
@@ -20,7 +21,6 @@ async def generate_telegram_link_token(
     user: User = Depends(get_current_user),
 ):
     """Generate a short-lived token for linking Telegram account."""
-    settings = get_settings()
     bot_token = await get_telegram_bot_token()
     if not bot_token:
         return {"error": "Telegram bot is not configured"}
@@ -1,5 +1,6 @@
 """Tenant-level dashboard API — aggregate stats for the current tenant."""
-from datetime import datetime, timezone, date
+from datetime import datetime, timedelta, timezone, date
+from functools import lru_cache
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
@@ -12,6 +13,21 @@ from app.models.credit import CreditBalance, CreditTransaction
 router = APIRouter()
 
 
+@lru_cache(maxsize=4)
+def _period_starts(today: date) -> tuple[datetime, datetime]:
+    """Return (month_start, week_start) at 00:00 UTC for the given day.
+
+    Keyed by the date so the result is reused for every dashboard poll
+    within the same day and naturally rolls over at midnight.
+    """
+    month_start = datetime.combine(today.replace(day=1), datetime.min.time(), tzinfo=timezone.utc)
+    # Go back to Monday
+    week_start = datetime.combine(
+        today - timedelta(days=today.weekday()), datetime.min.time(), tzinfo=timezone.utc,
+    )
+    return month_start, week_start
+
+
 @router.get("/stats")
 async def tenant_stats(
     user: User = Depends(get_current_user),
@@ -58,8 +74,9 @@ async def tenant_stats(
     )
     bal = bal_result.scalar_one_or_none()
 
+    month_start, week_start = _period_starts(date.today())
+
     # Credits used this month
-    month_start = datetime.combine(date.today().replace(day=1), datetime.min.time(), tzinfo=timezone.utc)
     credits_this_month = (await db.execute(
         select(func.coalesce(func.sum(CreditTransaction.amount), 0)).where(
             CreditTransaction.tenant_id == tid,
@@ -69,11 +86,6 @@ async def tenant_stats(
     )).scalar() or 0
 
     # Jobs this week
-    today = date.today()
-    week_start = datetime.combine(today, datetime.min.time(), tzinfo=timezone.utc)
-    # Go back to Monday
-    from datetime import timedelta
-    week_start -= timedelta(days=today.weekday())
     jobs_this_week = (await db.execute(
         select(func.count(ScrapingJob.id)).where(
             ScrapingJob.tenant_id == tid,
@@ -81,14 +93,21 @@ async def tenant_stats(
         )
     )).scalar() or 0
 
-    # Recent jobs (last 10)
-    recent_result = await db.execute(
-        select(ScrapingJob)
+    # Recent jobs (last 10) — plain column projection, no ORM hydration
+    recent_jobs = (await db.execute(
+        select(
+            ScrapingJob.id,
+            ScrapingJob.input_value,
+            ScrapingJob.status,
+            ScrapingJob.result_row_count,
+            ScrapingJob.credits_used,
+            ScrapingJob.created_at,
+            ScrapingJob.completed_at,
+        )
         .where(ScrapingJob.tenant_id == tid)
         .order_by(ScrapingJob.created_at.desc())
         .limit(10)
-    )
-    recent_jobs = recent_result.scalars().all()
+    )).mappings().all()
 
     return {
         "total_jobs": total_jobs,
@@ -104,13 +123,13 @@ async def tenant_stats(
         "jobs_this_week": jobs_this_week,
         "recent_jobs": [
             {
-                "id": str(j.id),
-                "input_value": j.input_value,
-                "status": j.status,
-                "result_row_count": j.result_row_count,
-                "credits_used": j.credits_used,
-                "created_at": j.created_at.isoformat(),
-                "completed_at": j.completed_at.isoformat() if j.completed_at else None,
+                "id": str(j["id"]),
+                "input_value": j["input_value"],
+                "status": j["status"],
+                "result_row_count": j["result_row_count"],
+                "credits_used": j["credits_used"],
+                "created_at": j["created_at"].isoformat(),
+                "completed_at": j["completed_at"].isoformat() if j["completed_at"] else None,
             }
             for j in recent_jobs
         ],
@@ -86,25 +86,26 @@ async def update_tenant_settings(
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
-    current = dict(tenant.settings or {})
+    # Merge only the sections present in the request into the existing JSONB;
+    # flag_modified below tells the ORM the dict changed in place.
+    settings = tenant.settings if tenant.settings is not None else {}
 
     if data.email is not None:
         email_dict = data.email.model_dump()
         # Preserve existing password if client sends the masked placeholder back
-        existing_email = current.get("email", {})
+        existing_email = settings.get("email") or {}
         if email_dict.get("smtp_password") == MASKED and existing_email.get("smtp_password"):
             email_dict["smtp_password"] = existing_email["smtp_password"]
-        current["email"] = email_dict
+        settings["email"] = email_dict
 
     if data.business is not None:
-        current["business"] = data.business.model_dump()
+        settings["business"] = data.business.model_dump()
 
     if data.ai_suggestions is not None:
-        current["ai_suggestions"] = data.ai_suggestions
+        settings["ai_suggestions"] = data.ai_suggestions
 
-    tenant.settings = current
+    tenant.settings = settings
     flag_modified(tenant, "settings")
     await db.commit()
-    await db.refresh(tenant)
 
-    return _mask_settings(tenant.settings)
+    return _mask_settings(settings)
@@ -1,17 +1,22 @@
 """Traffic Bot user-facing API routes."""
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import or_, select
 
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.models.user import User
 from app.models.traffic_bot import TrafficBotWalletDeposit
+from app.services import cache
 from app.services import traffic_bot_service as svc
-from app.services.whatsapp_notify import notify_traffic_bot_order, notify_wallet_deposit_request
-from app.services.telegram_notify import send_tb_order_notification
+from app.services.whatsapp_notify import notify_wallet_deposit_request
+from app.services.notification_tasks import (
+    notify_traffic_bot_order_task, send_tb_order_notification_task,
+)
 from app.schemas.traffic_bot import (
     OrderCreateRequest, OrderResponse, OrderListResponse,
     ServiceResponse, PriceCalcResponse,
@@ -30,8 +35,13 @@ async def list_services(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    services = await svc.list_services(db, enabled_only=True, category=category)
-    return services
+    async def _load() -> list[dict]:
+        services = await svc.list_services(db, enabled_only=True, category=category)
+        return [ServiceResponse.model_validate(s).model_dump(mode="json") for s in services]
+
+    return await cache.get_or_set(
+        svc.services_cache_key(category), _load, ttl=svc.SERVICES_CACHE_TTL,
+    )
 
 
 @router.get("/services/categories")
@@ -39,7 +49,9 @@ async def list_categories(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    return await svc.get_categories(db)
+    return await cache.get_or_set(
+        svc.CATEGORIES_CACHE_KEY, lambda: svc.get_categories(db), ttl=svc.SERVICES_CACHE_TTL,
+    )
 
 
 @router.get("/services/{service_id}/price", response_model=PriceCalcResponse)
@@ -70,18 +82,15 @@ async def create_order(
         )
     except ValueError as exc:
         raise HTTPException(400, str(exc))
-    # Service already loaded by place_order -> get_service
-    await db.refresh(order, attribute_names=["service"])
     resp = OrderResponse.model_validate(order)
     resp.service_name = order.service.name if order.service else None
-    await notify_traffic_bot_order(
-        user.email, resp.service_name or "Unknown",
-        body.quantity, float(order.total_cost), body.link, db,
-    )
+    # Commit before queueing so the workers can see the order row
+    await db.commit()
+    notify_traffic_bot_order_task.delay(str(order.id))
     # Telegram notification to the user if linked
     if user.telegram_chat_id:
-        await send_tb_order_notification(
-            user.telegram_chat_id, order, resp.service_name or "Unknown",
+        send_tb_order_notification_task.delay(
+            user.telegram_chat_id, str(order.id), resp.service_name or "Unknown",
         )
     return resp
 
@@ -200,15 +209,32 @@ async def submit_deposit_request(
 @router.get("/wallet/deposits", response_model=list[WalletDepositResponse])
 async def list_my_deposits(
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    before: datetime | None = Query(
+        None, description="Cursor: created_at of the last deposit from the previous page",
+    ),
+    before_id: UUID | None = Query(
+        None, description="Cursor: id of the last deposit from the previous page",
+    ),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    # Keyset pagination — seeks on (tenant_id, created_at) instead of
+    # scanning and discarding every earlier row like OFFSET does. id breaks
+    # created_at ties so deposits sharing a timestamp aren't skipped
+    q = select(TrafficBotWalletDeposit).where(TrafficBotWalletDeposit.tenant_id == user.tenant_id)
+    if before and before_id:
+        q = q.where(
+            TrafficBotWalletDeposit.created_at <= before,
+            or_(
+                TrafficBotWalletDeposit.created_at < before,
+                TrafficBotWalletDeposit.id < before_id,
+            ),
+        )
+    elif before:
+        q = q.where(TrafficBotWalletDeposit.created_at < before)
     result = await db.execute(
-        select(TrafficBotWalletDeposit)
-        .where(TrafficBotWalletDeposit.tenant_id == user.tenant_id)
-        .order_by(TrafficBotWalletDeposit.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+        q.order_by(
+            TrafficBotWalletDeposit.created_at.desc(), TrafficBotWalletDeposit.id.desc(),
+        ).limit(limit)
     )
     return result.scalars().all()
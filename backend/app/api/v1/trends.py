@@ -1,13 +1,12 @@
 """Trends API — viral post detection, content insights, Google Trends."""
 
 import logging
-import re
-from collections import Counter
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select, distinct, case, extract
+from sqlalchemy import Numeric, String, all_, bindparam, case, cast, distinct, extract, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -15,10 +14,13 @@ from app.dependencies import get_current_user
 from app.models.job import ScrapedPost, ScrapingJob
 from app.models.tenant import Tenant
 from app.models.user import User
+from app.services import cache
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+SOURCE_PAGES_CACHE_TTL = 60  # seconds
+
 # Common English stopwords to filter from keyword extraction
 _STOPWORDS = frozenset(
     "the a an is are was were be been being have has had do does did will would "
@@ -29,33 +31,15 @@ _STOPWORDS = frozenset(
     "again also any before below between down during further here if off once out over "
     "own re still then there through under until up http https www com facebook".split()
 )
+# Sent as a single array parameter rather than one bind per stopword
+_STOPWORD_LIST = sorted(_STOPWORDS)
 
-
-def _virality_score(
-    reactions: int, comments: int, shares: int, created_time: datetime | None,
-) -> float:
-    """Compute virality score with time decay."""
-    engagement = (shares * 10) + (reactions * 2) + (comments * 3)
-    if created_time:
-        age_hours = max(
-            (datetime.now(timezone.utc) - created_time).total_seconds() / 3600, 1,
-        )
-    else:
-        age_hours = 24 * 30  # assume 30 days old if unknown
-    return round(engagement / (age_hours ** 0.3), 1)
+# Keyword token pattern (Latin, Thai, CJK), evaluated by Postgres' regex engine
+_WORD_PATTERN = r"[a-zA-Z\u0E00-\u0E7F\u4e00-\u9fff]{3,}"
 
 
-def _extract_keywords(messages: list[str], top_n: int = 20) -> list[str]:
-    """Extract top keywords from post messages using simple word frequency."""
-    counter: Counter = Counter()
-    for msg in messages:
-        if not msg:
-            continue
-        words = re.findall(r"[a-zA-Z\u0E00-\u0E7F\u4e00-\u9fff]{3,}", msg.lower())
-        for w in words:
-            if w not in _STOPWORDS and len(w) <= 30:
-                counter[w] += 1
-    return [word for word, _ in counter.most_common(top_n)]
+def source_pages_cache_key(tenant_id: UUID) -> str:
+    return f"trends:source_pages:{tenant_id}"
 
 
 # ---------------------------------------------------------------------------
@@ -74,123 +58,129 @@ async def get_viral_posts(
     page_size: int = Query(30, ge=1, le=100),
     sort_by: str = Query("virality_score"),
 ):
-    """Analyze scraped posts and return them ranked by virality score."""
+    """Analyze scraped posts and return them ranked by virality score.
+
+    Deduplication, scoring, filtering, sorting and pagination all run in
+    Postgres so only ``page_size`` post rows leave the database.
+    """
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
-    # Find all post_discovery jobs for this tenant
-    job_filter = [
+    # Only posts from this tenant's post_discovery jobs
+    post_filter = [
         ScrapingJob.tenant_id == user.tenant_id,
         ScrapingJob.job_type == "post_discovery",
         ScrapingJob.status.in_(["completed", "running"]),
+        (ScrapedPost.created_time >= cutoff) | (ScrapedPost.created_time.is_(None)),
     ]
     if page_id:
-        job_filter.append(ScrapingJob.input_value == page_id)
-
-    job_result = await db.execute(
-        select(ScrapingJob.id, ScrapingJob.input_value).where(*job_filter)
-    )
-    jobs = job_result.all()
-    if not jobs:
-        return {"items": [], "total": 0, "page": page, "page_size": page_size, "page_averages": {}}
-
-    job_ids = [j[0] for j in jobs]
-    job_input_map = {j[0]: j[1] for j in jobs}
-
-    # Build base query
-    post_filter = [
-        ScrapedPost.job_id.in_(job_ids),
-    ]
-    if cutoff:
-        post_filter.append(
-            (ScrapedPost.created_time >= cutoff) | (ScrapedPost.created_time.is_(None))
-        )
+        post_filter.append(ScrapingJob.input_value == page_id)
     if content_type:
         post_filter.append(ScrapedPost.attachment_type == content_type)
 
-    # Deduplicate by post_id (keep first occurrence)
-    dedup_subq = (
+    # Deduplicate by post_id (keep most recent occurrence), tagging each post
+    # with the source page it was discovered from
+    dedup = (
         select(
             ScrapedPost.id,
-            ScrapedPost.job_id,
+            ScrapedPost.post_id,
+            ScrapedPost.message,
+            ScrapedPost.created_time,
+            ScrapedPost.from_name,
+            func.coalesce(ScrapedPost.comment_count, 0).label("comment_count"),
+            func.coalesce(ScrapedPost.reaction_count, 0).label("reaction_count"),
+            func.coalesce(ScrapedPost.share_count, 0).label("share_count"),
+            ScrapedPost.engagement_total,
+            ScrapedPost.attachment_type,
+            ScrapedPost.attachment_url,
+            ScrapedPost.post_url,
+            ScrapingJob.input_value.label("source_page"),
             func.row_number().over(
                 partition_by=ScrapedPost.post_id,
                 order_by=ScrapedPost.created_time.desc().nulls_last(),
             ).label("rn"),
         )
+        .join(ScrapingJob, ScrapingJob.id == ScrapedPost.job_id)
         .where(*post_filter)
-        .subquery()
+        .cte("dedup")
     )
 
-    result = await db.execute(
-        select(ScrapedPost)
-        .join(dedup_subq, ScrapedPost.id == dedup_subq.c.id)
-        .where(dedup_subq.c.rn == 1)
+    # Virality score with time decay; posts with unknown age count as 30 days old
+    age_hours = case(
+        (dedup.c.created_time.is_(None), 24 * 30),
+        else_=func.greatest(extract("epoch", func.now() - dedup.c.created_time) / 3600, 1),
+    )
+    weighted = dedup.c.share_count * 10 + dedup.c.reaction_count * 2 + dedup.c.comment_count * 3
+    # The per-page average engagement covers all deduplicated posts, so it is
+    # windowed here, before the min_score filter
+    scored = (
+        select(
+            dedup,
+            func.round(cast(weighted / func.power(age_hours, 0.3), Numeric), 1).label("virality_score"),
+            func.avg(dedup.c.engagement_total).over(partition_by=dedup.c.source_page).label("page_avg"),
+        )
+        .where(dedup.c.rn == 1)
+        .cte("scored")
     )
-    all_posts = result.scalars().all()
 
-    # Compute per-page average engagement
-    page_engagement: dict[str, list[int]] = {}
-    for p in all_posts:
-        src = job_input_map.get(p.job_id, "unknown")
-        eng = (p.reaction_count or 0) + (p.comment_count or 0) + (p.share_count or 0)
-        page_engagement.setdefault(src, []).append(eng)
+    # Sort
+    sort_map = {
+        "virality_score": scored.c.virality_score,
+        "reactions": scored.c.reaction_count,
+        "comments": scored.c.comment_count,
+        "shares": scored.c.share_count,
+        "recency": scored.c.created_time,
+        "engagement": scored.c.engagement_total,
+    }
+    sort_col = sort_map.get(sort_by, sort_map["virality_score"])
+    ranked_filter = [scored.c.virality_score >= min_score]
+    # One pass: the total rides along as a window over the filtered rows
+    result = await db.execute(
+        select(scored, func.count().over().label("total"))
+        .where(*ranked_filter)
+        .order_by(sort_col.desc().nulls_last(), scored.c.id)
+        .limit(page_size)
+        .offset((page - 1) * page_size)
+    )
+    rows = result.all()
+
+    if rows:
+        total = rows[0].total
+    elif page > 1:
+        # Past the last page there is no row to carry the total
+        total = (await db.execute(
+            select(func.count()).select_from(scored).where(*ranked_filter)
+        )).scalar() or 0
+    else:
+        total = 0
 
+    # Averages for the source pages shown on this page
     page_averages = {
-        src: round(sum(vals) / len(vals), 1) if vals else 0
-        for src, vals in page_engagement.items()
+        p.source_page: round(float(p.page_avg or 0), 1) for p in rows
     }
 
-    # Build scored items
     items = []
-    for p in all_posts:
-        src = job_input_map.get(p.job_id, "unknown")
-        score = _virality_score(
-            p.reaction_count or 0, p.comment_count or 0,
-            p.share_count or 0, p.created_time,
-        )
-        if score < min_score:
-            continue
-
-        eng_total = (p.reaction_count or 0) + (p.comment_count or 0) + (p.share_count or 0)
-        avg = page_averages.get(src, 0)
-        above_avg = round(eng_total / avg, 1) if avg > 0 else 0
-
+    for p in rows:
+        avg = page_averages.get(p.source_page, 0)
         items.append({
             "id": str(p.id),
             "post_id": p.post_id,
             "message": p.message,
             "created_time": p.created_time.isoformat() if p.created_time else None,
             "from_name": p.from_name,
-            "comment_count": p.comment_count or 0,
-            "reaction_count": p.reaction_count or 0,
-            "share_count": p.share_count or 0,
+            "comment_count": p.comment_count,
+            "reaction_count": p.reaction_count,
+            "share_count": p.share_count,
             "attachment_type": p.attachment_type,
             "attachment_url": p.attachment_url,
             "post_url": p.post_url,
-            "virality_score": score,
-            "engagement_total": eng_total,
-            "source_page": src,
-            "above_average": above_avg,
+            "virality_score": float(p.virality_score),
+            "engagement_total": p.engagement_total,
+            "source_page": p.source_page,
+            "above_average": round(p.engagement_total / avg, 1) if avg > 0 else 0,
         })
 
-    # Sort
-    sort_map = {
-        "virality_score": lambda x: x["virality_score"],
-        "reactions": lambda x: x["reaction_count"],
-        "comments": lambda x: x["comment_count"],
-        "shares": lambda x: x["share_count"],
-        "recency": lambda x: x["created_time"] or "",
-        "engagement": lambda x: x["engagement_total"],
-    }
-    sort_fn = sort_map.get(sort_by, sort_map["virality_score"])
-    items.sort(key=sort_fn, reverse=True)
-
-    total = len(items)
-    start = (page - 1) * page_size
-    paginated = items[start : start + page_size]
-
     return {
-        "items": paginated,
+        "items": items,
         "total": total,
         "page": page,
         "page_size": page_size,
@@ -221,35 +211,21 @@ async def get_content_insights(
     if page_id:
         job_filter.append(ScrapingJob.input_value == page_id)
 
-    job_result = await db.execute(select(ScrapingJob.id).where(*job_filter))
-    job_ids = [r[0] for r in job_result.all()]
-    if not job_ids:
-        return {
-            "total_posts": 0, "avg_engagement": 0,
-            "by_content_type": [], "by_day_of_week": [], "by_hour": [],
-            "top_keywords": [], "posting_frequency": 0,
-        }
-
     base_filter = [
-        ScrapedPost.job_id.in_(job_ids),
+        ScrapedPost.job_id.in_(select(ScrapingJob.id).where(*job_filter)),
         (ScrapedPost.created_time >= cutoff) | (ScrapedPost.created_time.is_(None)),
     ]
 
+    eng_sum = ScrapedPost.reaction_count + ScrapedPost.comment_count + ScrapedPost.share_count
+
     # Total posts + avg engagement
-    stats_result = await db.execute(
-        select(
-            func.count(distinct(ScrapedPost.post_id)).label("total"),
-            func.avg(
-                ScrapedPost.reaction_count + ScrapedPost.comment_count + ScrapedPost.share_count
-            ).label("avg_eng"),
-        ).where(*base_filter)
-    )
-    stats = stats_result.one()
-    total_posts = stats.total or 0
-    avg_engagement = round(float(stats.avg_eng or 0), 1)
+    stats_q = select(
+        func.count(distinct(ScrapedPost.post_id)).label("total"),
+        func.avg(eng_sum).label("avg_eng"),
+    ).where(*base_filter)
 
     # By content type
-    type_result = await db.execute(
+    type_q = (
         select(
             func.coalesce(ScrapedPost.attachment_type, "text").label("ctype"),
             func.count().label("cnt"),
@@ -261,72 +237,102 @@ async def get_content_insights(
         .group_by("ctype")
         .order_by(func.count().desc())
     )
-    by_content_type = [
-        {
-            "type": row.ctype or "text",
-            "count": row.cnt,
-            "avg_reactions": round(float(row.avg_reactions or 0), 1),
-            "avg_comments": round(float(row.avg_comments or 0), 1),
-            "avg_shares": round(float(row.avg_shares or 0), 1),
-        }
-        for row in type_result.all()
-    ]
 
     # By day of week
-    day_names = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-    dow_result = await db.execute(
+    dow_q = (
         select(
             extract("dow", ScrapedPost.created_time).label("dow"),
             func.count().label("cnt"),
-            func.avg(
-                ScrapedPost.reaction_count + ScrapedPost.comment_count + ScrapedPost.share_count
-            ).label("avg_eng"),
+            func.avg(eng_sum).label("avg_eng"),
         )
         .where(*base_filter, ScrapedPost.created_time.is_not(None))
         .group_by("dow")
         .order_by("dow")
     )
-    by_day = [
-        {
-            "day": day_names[int(row.dow)] if row.dow is not None else "Unknown",
-            "count": row.cnt,
-            "avg_engagement": round(float(row.avg_eng or 0), 1),
-        }
-        for row in dow_result.all()
-    ]
 
     # By hour
-    hour_result = await db.execute(
+    hour_q = (
         select(
             extract("hour", ScrapedPost.created_time).label("hr"),
             func.count().label("cnt"),
-            func.avg(
-                ScrapedPost.reaction_count + ScrapedPost.comment_count + ScrapedPost.share_count
-            ).label("avg_eng"),
+            func.avg(eng_sum).label("avg_eng"),
         )
         .where(*base_filter, ScrapedPost.created_time.is_not(None))
         .group_by("hr")
         .order_by("hr")
     )
+
+    # Top keywords — tokenized and counted in Postgres over a sample of up
+    # to 500 messages. Stopwords are dropped after grouping, so each distinct
+    # word is checked once rather than every token; only the top 15 come back
+    msgs = (
+        select(ScrapedPost.message)
+        .where(
+            *base_filter,
+            ScrapedPost.message.is_not(None),
+            ScrapedPost.message != "",
+        )
+        .limit(500)
+        .subquery()
+    )
+    words = select(
+        func.lower(
+            func.unnest(func.regexp_matches(msgs.c.message, _WORD_PATTERN, "g"))
+        ).label("word")
+    ).subquery()
+    keyword_q = (
+        select(words.c.word)
+        .group_by(words.c.word)
+        .having(
+            words.c.word != all_(bindparam("stopwords", _STOPWORD_LIST, type_=ARRAY(String))),
+            func.length(words.c.word) <= 30,
+        )
+        .order_by(func.count().desc(), words.c.word)
+        .limit(15)
+    )
+
+    # Run in turn on the request's session: fanning out would hold five pool
+    # connections for one request and bypass get_db
+    stats_rows, type_rows, dow_rows, hour_rows, keyword_rows = [
+        (await db.execute(q)).all()
+        for q in (stats_q, type_q, dow_q, hour_q, keyword_q)
+    ]
+
+    stats = stats_rows[0]
+    total_posts = stats.total or 0
+    avg_engagement = round(float(stats.avg_eng or 0), 1)
+
+    by_content_type = [
+        {
+            "type": row.ctype or "text",
+            "count": row.cnt,
+            "avg_reactions": round(float(row.avg_reactions or 0), 1),
+            "avg_comments": round(float(row.avg_comments or 0), 1),
+            "avg_shares": round(float(row.avg_shares or 0), 1),
+        }
+        for row in type_rows
+    ]
+
+    day_names = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+    by_day = [
+        {
+            "day": day_names[int(row.dow)] if row.dow is not None else "Unknown",
+            "count": row.cnt,
+            "avg_engagement": round(float(row.avg_eng or 0), 1),
+        }
+        for row in dow_rows
+    ]
+
     by_hour = [
         {
             "hour": int(row.hr),
             "count": row.cnt,
             "avg_engagement": round(float(row.avg_eng or 0), 1),
         }
-        for row in hour_result.all()
+        for row in hour_rows
     ]
 
-    # Top keywords from messages
-    msg_result = await db.execute(
-        select(ScrapedPost.message).where(
-            *base_filter,
-            ScrapedPost.message.is_not(None),
-            ScrapedPost.message != "",
-        ).limit(500)
-    )
-    messages = [r[0] for r in msg_result.all() if r[0]]
-    top_keywords = _extract_keywords(messages, top_n=15)
+    top_keywords = [r[0] for r in keyword_rows]
 
     # Posting frequency (posts per week)
     if total_posts > 0:
@@ -401,27 +407,33 @@ async def get_source_pages(
     db: AsyncSession = Depends(get_db),
 ):
     """List all unique source pages from post discovery jobs."""
-    result = await db.execute(
-        select(
-            ScrapingJob.input_value,
-            func.count(ScrapingJob.id).label("job_count"),
-            func.sum(ScrapingJob.result_row_count).label("total_posts"),
-        )
-        .where(
-            ScrapingJob.tenant_id == user.tenant_id,
-            ScrapingJob.job_type == "post_discovery",
-            ScrapingJob.status.in_(["completed", "running"]),
+
+    async def _load() -> dict:
+        result = await db.execute(
+            select(
+                ScrapingJob.input_value,
+                func.count(ScrapingJob.id).label("job_count"),
+                func.sum(ScrapingJob.result_row_count).label("total_posts"),
+            )
+            .where(
+                ScrapingJob.tenant_id == user.tenant_id,
+                ScrapingJob.job_type == "post_discovery",
+                ScrapingJob.status.in_(["completed", "running"]),
+            )
+            .group_by(ScrapingJob.input_value)
+            .order_by(func.sum(ScrapingJob.result_row_count).desc())
         )
-        .group_by(ScrapingJob.input_value)
-        .order_by(func.sum(ScrapingJob.result_row_count).desc())
+        return {
+            "pages": [
+                {
+                    "input_value": r.input_value,
+                    "job_count": r.job_count,
+                    "total_posts": r.total_posts or 0,
+                }
+                for r in result.all()
+            ]
+        }
+
+    return await cache.get_or_set(
+        source_pages_cache_key(user.tenant_id), _load, ttl=SOURCE_PAGES_CACHE_TTL,
     )
-    return {
-        "pages": [
-            {
-                "input_value": r.input_value,
-                "job_count": r.job_count,
-                "total_posts": r.total_posts or 0,
-            }
-            for r in result.all()
-        ]
-    }
@@ -1,8 +1,10 @@
+import asyncio
 import uuid
 import os
+from functools import partial
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File
 from app.dependencies import get_current_user
 from app.models.user import User
 from app.config import get_settings
@@ -11,14 +13,46 @@ router = APIRouter()
 
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".pdf", ".webp"}
 ALLOWED_MIME_TYPES = {"image/jpeg", "image/png", "image/webp", "application/pdf"}
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+# Content-Length covers the whole multipart body, not just the file
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+def _matches_signature(head: bytes, ext: str) -> bool:
+    """Check the file's leading magic bytes against its claimed extension."""
+    if ext in (".jpg", ".jpeg"):
+        return head.startswith(b"\xff\xd8\xff")
+    if ext == ".png":
+        return head.startswith(b"\x89PNG")
+    if ext == ".webp":
+        return head[:4] == b"RIFF" and head[8:12] == b"WEBP"
+    if ext == ".pdf":
+        return head.startswith(b"%PDF-")
+    return False
 
 
 @router.post("/proof")
 async def upload_proof(
+    request: Request,
     file: UploadFile = File(...),
     user: User = Depends(get_current_user),
 ):
     settings = get_settings()
+    max_bytes = settings.max_upload_size_mb * 1024 * 1024
+
+    # By now FastAPI has already spooled the body, so this only skips the
+    # disk copy; nginx's client_max_body_size is what rejects a large upload
+    # before it is received. The declared length includes multipart framing,
+    # hence the allowance; the exact limit is enforced while streaming below.
+    try:
+        content_length = int(request.headers.get("content-length", "0"))
+    except ValueError:
+        content_length = 0
+    if content_length > max_bytes + MULTIPART_OVERHEAD:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum {settings.max_upload_size_mb}MB",
+        )
 
     # Validate file extension
     ext = Path(file.filename).suffix.lower() if file.filename else ""
@@ -35,23 +69,45 @@ async def upload_proof(
             detail=f"Content type '{file.content_type}' not allowed",
         )
 
-    # Validate file size
-    contents = await file.read()
-    max_bytes = settings.max_upload_size_mb * 1024 * 1024
-    if len(contents) > max_bytes:
+    # Validate file signature — extension and Content-Type are client-supplied
+    head = await file.read(12)
+    await file.seek(0)
+    if not _matches_signature(head, ext):
         raise HTTPException(
             status_code=400,
-            detail=f"File too large. Maximum {settings.max_upload_size_mb}MB",
+            detail="File content does not match its type",
         )
 
     # Generate unique filename and save
     unique_name = f"{uuid.uuid4().hex}{ext}"
     proof_dir = os.path.join(settings.upload_dir, "proofs")
-    os.makedirs(proof_dir, exist_ok=True)
     file_path = os.path.join(proof_dir, unique_name)
 
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    # Filesystem calls run in the thread executor so a slow disk or network
+    # volume doesn't block the event loop
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, partial(os.makedirs, proof_dir, exist_ok=True))
+
+    # Stream to disk in chunks, enforcing the size limit as we go
+    written = 0
+    f = await loop.run_in_executor(None, open, file_path, "wb")
+    try:
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File too large. Maximum {settings.max_upload_size_mb}MB",
+                    )
+                await loop.run_in_executor(None, f.write, chunk)
+        finally:
+            await loop.run_in_executor(None, f.close)
+    except BaseException:
+        # Too large, client disconnect, read/write error — don't leave the
+        # partial file behind
+        await loop.run_in_executor(None, os.remove, file_path)
+        raise
 
     proof_url = f"{settings.backend_url}/uploads/proofs/{unique_name}"
     return {"proof_url": proof_url, "filename": unique_name}
@@ -1,5 +1,6 @@
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 from app.config import get_settings
 
 settings = get_settings()
@@ -25,10 +26,21 @@ celery_app.conf.update(
         "app.scraping.fb_action_tasks.*": {"queue": "scraping"},
         "app.scraping.fb_login_tasks.*": {"queue": "scraping"},
         "app.scraping.fb_live_engage_tasks.*": {"queue": "scraping"},
+        # FB sync, rollup refresh and partition upkeep: API/DB work, not scraping
+        "app.scraping.fb_sync_tasks.*": {"queue": "default"},
         "app.services.*": {"queue": "default"},
     },
 )
 
+
+@worker_process_init.connect
+def _init_worker_db(**kwargs):
+    """Give each forked worker its own non-pooled engine."""
+    from app.database import configure_for_worker
+
+    configure_for_worker()
+
+
 # Celery Beat schedule for periodic tasks
 celery_app.conf.beat_schedule = {
     "check-scheduled-jobs": {
@@ -39,14 +51,24 @@ celery_app.conf.beat_schedule = {
         "task": "app.scraping.fb_sync_tasks.sync_all_tenants",
         "schedule": crontab(minute=0),  # Every hour
     },
+    "refresh-fb-insight-rollups": {
+        "task": "app.scraping.fb_sync_tasks.refresh_insight_rollups",
+        "schedule": crontab(minute=30),  # Every hour, after the syncs land
+    },
+    "ensure-fb-insight-partitions": {
+        "task": "app.scraping.fb_sync_tasks.ensure_insight_partitions",
+        "schedule": crontab(hour=0, minute=15),  # Daily
+    },
 }
 
-# Auto-discover tasks
-celery_app.autodiscover_tasks([
+# Task modules, listed explicitly so workers import only these at boot
+# instead of autodiscover walking every package
+celery_app.conf.imports = (
     "app.scraping.tasks",
     "app.scraping.fb_sync_tasks",
     "app.scraping.fb_action_tasks",
     "app.scraping.fb_login_tasks",
     "app.scraping.fb_live_engage_tasks",
-    "app.services",
-])
+    "app.services.live_sell_tasks",
+    "app.services.notification_tasks",
+)
@@ -1,28 +1,65 @@
-import ssl
+import json
+import uuid
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 from app.config import get_settings
 
 settings = get_settings()
 
-# Railway Postgres requires SSL; asyncpg needs an ssl.SSLContext
-connect_args = {}
+# Larger server-side prepared statement caches so hot queries are parsed
+# and planned once per connection (asyncpg / SQLAlchemy defaults are 100)
+connect_args = {
+    "statement_cache_size": 1024,
+    "prepared_statement_cache_size": 1024,
+}
+
+# Railway Postgres requires SSL. Certificates aren't verified, so asyncpg's
+# "require" mode is enough — no need to load the system CA bundle
 db_url = settings.async_database_url
 if "localhost" not in db_url and "127.0.0.1" not in db_url:
-    ssl_ctx = ssl.create_default_context()
-    ssl_ctx.check_hostname = False
-    ssl_ctx.verify_mode = ssl.CERT_NONE
-    connect_args["ssl"] = ssl_ctx
-
-engine = create_async_engine(
-    db_url,
-    echo=settings.app_debug,
-    pool_size=20,
-    max_overflow=10,
-    pool_pre_ping=True,
-    connect_args=connect_args,
-)
+    connect_args["ssl"] = "require"
+
+# SQL echo only in local development — a stray APP_DEBUG=true elsewhere must
+# not route every statement through logging
+sql_echo = settings.app_env == "development" and settings.app_debug
+
+# Compiled-statement LRU; the default 500 thrashes across our ORM queries.
+# Workers need it too: their engine lives for the whole process even though
+# connections don't
+QUERY_CACHE_SIZE = 1200
+
+
+def create_engine_for(role: str = "web") -> AsyncEngine:
+    """Build the async engine for a process role.
+
+    The web process keeps a connection pool sized from settings. Celery
+    workers run each task in a fresh event loop, where pooled asyncpg
+    connections can't be reused, so they connect per session instead.
+    """
+    if role == "worker":
+        return create_async_engine(
+            db_url,
+            echo=sql_echo,
+            query_cache_size=QUERY_CACHE_SIZE,
+            poolclass=NullPool,
+            connect_args=connect_args,
+        )
+    return create_async_engine(
+        db_url,
+        echo=sql_echo,
+        query_cache_size=QUERY_CACHE_SIZE,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+        connect_args=connect_args,
+    )
+
+
+engine = create_engine_for("web")
 
 async_session = async_sessionmaker(
     engine,
@@ -30,11 +67,99 @@ async_session = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Autocommit sessions for read-only handlers: statements run outside a
+# transaction, so there's no BEGIN/COMMIT round trip around the reads
+readonly_session = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+
+def configure_for_worker() -> None:
+    """Swap the shared engine for the worker one after a Celery fork."""
+    global engine
+    # Drop connections inherited from the parent without closing its sockets
+    engine.sync_engine.dispose(close=False)
+    engine = create_engine_for("worker")
+    async_session.configure(bind=engine)
+    readonly_session.configure(bind=engine.execution_options(isolation_level="AUTOCOMMIT"))
+
 
 class Base(DeclarativeBase):
     pass
 
 
+class BulkSaveMixin:
+    """``bulk_save`` for models written many rows at a time.
+
+    A list of dicts through a single ``insert().returning()`` is sent as
+    multi-row ``INSERT ... VALUES`` pages (insertmanyvalues) and skips the
+    identity map, unlike a loop of ``session.add()``.
+    """
+
+    @classmethod
+    async def bulk_save(cls, session: AsyncSession, rows: list[dict]) -> list[uuid.UUID]:
+        """Insert ``rows`` and return their ids in input order."""
+        if not rows:
+            return []
+        result = await session.execute(
+            insert(cls).returning(cls.id, sort_by_parameter_order=True), rows
+        )
+        return list(result.scalars())
+
+    COPY_BATCH_SIZE = 10_000
+
+    @classmethod
+    async def bulk_copy(cls, session: AsyncSession, rows: list[dict]) -> int:
+        """Insert ``rows`` with asyncpg's binary COPY, in batches.
+
+        Rows are keyed by attribute name like ``bulk_save``; missing values
+        take the column's Python default and server-default columns are
+        left to the database. COPY does not handle conflicts or return
+        ids. Falls back to ``bulk_save`` on drivers other than asyncpg.
+        Returns the number of rows written.
+        """
+        if not rows:
+            return 0
+
+        conn = await session.connection()
+        if conn.dialect.driver != "asyncpg":
+            for i in range(0, len(rows), cls.COPY_BATCH_SIZE):
+                await cls.bulk_save(session, rows[i:i + cls.COPY_BATCH_SIZE])
+            return len(rows)
+
+        attrs = [
+            (attr.key, attr.columns[0])
+            for attr in cls.__mapper__.column_attrs
+            if attr.columns[0].computed is None and attr.columns[0].server_default is None
+        ]
+        columns = [col.name for _, col in attrs]
+        records = []
+        for row in rows:
+            record = []
+            for key, col in attrs:
+                if key in row:
+                    value = row[key]
+                elif col.default is None:
+                    value = None
+                elif col.default.is_callable:
+                    value = col.default.arg(None)
+                else:
+                    value = col.default.arg
+                if value is not None and isinstance(col.type, JSONB):
+                    value = json.dumps(value)
+                record.append(value)
+            records.append(tuple(record))
+
+        raw = (await conn.get_raw_connection()).driver_connection
+        for i in range(0, len(records), cls.COPY_BATCH_SIZE):
+            await raw.copy_records_to_table(
+                cls.__tablename__, records=records[i:i + cls.COPY_BATCH_SIZE], columns=columns,
+            )
+        return len(records)
+
+
 async def get_db() -> AsyncSession:
     async with async_session() as session:
         try:
@@ -45,3 +170,13 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+async def get_readonly_db() -> AsyncSession:
+    """Session for handlers that only read. Never commits.
+
+    Don't combine with get_current_user in the same route — that depends on
+    get_db, and the request would hold two connections.
+    """
+    async with readonly_session() as session:
+        yield session
@@ -3,7 +3,7 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
@@ -11,20 +11,66 @@ from slowapi.errors import RateLimitExceeded
 from app.config import get_settings
 from app.api.v1.router import api_router
 from app.database import engine, Base, async_session
+from app.utils.ids import uuid7
 import app.models  # noqa: F401 — ensure all models are registered
 from sqlalchemy import select, text
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Rate limiter (uses client IP)
-limiter = Limiter(key_func=get_remote_address, default_limits=["200/minute"])
+# Rate limiter (uses client IP). Counters live in Redis so limits hold across
+# uvicorn workers and restarts; falls back to memory if Redis is unreachable.
+limiter = Limiter(
+    key_func=get_remote_address,
+    default_limits=["200/minute"],
+    storage_uri=settings.redis_url,
+    strategy="moving-window",
+    in_memory_fallback_enabled=True,
+)
 
 # Ensure directories exist before StaticFiles mount
 os.makedirs(settings.upload_dir, exist_ok=True)
 os.makedirs(settings.export_dir, exist_ok=True)
 
 
+# Bump whenever the startup bootstrap in lifespan() changes (new tables or
+# ALTER columns). Once a process has applied version N and seeded, later
+# boots find the stamp in system_settings and skip the bootstrap entirely.
+SCHEMA_VERSION = 3
+SCHEMA_STATE_KEY = "schema_state"
+
+
+async def _schema_is_current() -> bool:
+    """One-row lookup: has this schema version already been applied and seeded?"""
+    from app.models.system import SystemSetting
+
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                select(SystemSetting.value).where(SystemSetting.key == SCHEMA_STATE_KEY)
+            )
+            state = result.scalar_one_or_none()
+    except Exception:
+        return False  # First boot — system_settings doesn't exist yet
+    return bool(
+        state
+        and state.get("schema_version") == SCHEMA_VERSION
+        and state.get("seeded")
+    )
+
+
+async def _stamp_schema_state():
+    from app.models.system import SystemSetting
+
+    async with async_session() as db:
+        await db.merge(SystemSetting(
+            key=SCHEMA_STATE_KEY,
+            value={"schema_version": SCHEMA_VERSION, "seeded": True},
+            description="Startup bootstrap marker (see app.main.SCHEMA_VERSION)",
+        ))
+        await db.commit()
+
+
 async def _seed_initial_data():
     """Create super admin, platforms, and credit packages if they don't exist."""
     from app.models.user import User
@@ -35,49 +81,58 @@ async def _seed_initial_data():
 
     async with async_session() as db:
         # Check if super admin already exists
-        result = await db.execute(select(User).where(User.email == settings.super_admin_email))
-        if result.scalar_one_or_none():
+        admin_id = await db.scalar(
+            select(User.id).where(User.email == settings.super_admin_email).limit(1)
+        )
+        if admin_id is not None:
             return  # Already seeded
 
         logger.info("Seeding initial data (first run)...")
 
-        # Platforms
-        facebook = Platform(
-            name="facebook", display_name="Facebook", is_enabled=True,
-            config={"base_url": settings.akng_base_url, "api_version": settings.akng_api_version},
-            credit_cost_per_profile=1, credit_cost_per_comment_page=1,
-        )
-        db.add(facebook)
-        db.add(Platform(
-            name="tiktok", display_name="TikTok", is_enabled=False, config={},
-            credit_cost_per_profile=1, credit_cost_per_comment_page=1,
-        ))
-
-        # Credit packages
-        for name, credits, price, bonus, order in [
-            ("Starter", 100, 999, 0, 1),
-            ("Growth", 500, 3999, 50, 2),
-            ("Professional", 2000, 12999, 300, 3),
-            ("Enterprise", 10000, 49999, 2000, 4),
-        ]:
-            db.add(CreditPackage(
+        # Everything is added up front and written in the single flush at
+        # commit, so SQLAlchemy can batch the INSERTs per table
+        db.add_all([
+            Platform(
+                name="facebook", display_name="Facebook", is_enabled=True,
+                config={"base_url": settings.akng_base_url, "api_version": settings.akng_api_version},
+                credit_cost_per_profile=1, credit_cost_per_comment_page=1,
+            ),
+            Platform(
+                name="tiktok", display_name="TikTok", is_enabled=False, config={},
+                credit_cost_per_profile=1, credit_cost_per_comment_page=1,
+            ),
+        ])
+        db.add_all([
+            CreditPackage(
                 name=name, credits=credits, price_cents=price,
                 currency="USD", bonus_credits=bonus, sort_order=order,
-            ))
-
-        # Super admin tenant + user
-        admin_tenant = Tenant(name="SocyBase Admin", slug="socybase-admin", plan="enterprise")
-        db.add(admin_tenant)
-        await db.flush()
-
-        admin_user = User(
-            tenant_id=admin_tenant.id, email=settings.super_admin_email,
-            password_hash=hash_password(settings.super_admin_password),
-            full_name="Super Admin", role="super_admin",
-            email_verified=True, language="en",
+            )
+            for name, credits, price, bonus, order in [
+                ("Starter", 100, 999, 0, 1),
+                ("Growth", 500, 3999, 50, 2),
+                ("Professional", 2000, 12999, 300, 3),
+                ("Enterprise", 10000, 49999, 2000, 4),
+            ]
+        ])
+
+        # Super admin tenant + user. The tenant id is assigned here rather than
+        # at flush so the dependent rows can reference it without a round-trip
+        admin_tenant = Tenant(
+            id=uuid7(), name="SocyBase Admin", slug="socybase-admin", plan="enterprise",
         )
-        db.add(admin_user)
-        db.add(CreditBalance(tenant_id=admin_tenant.id, balance=999999, lifetime_purchased=999999))
+        db.add_all([
+            admin_tenant,
+            User(
+                tenant_id=admin_tenant.id, email=settings.super_admin_email,
+                password_hash=(
+                    settings.super_admin_password_hash
+                    or hash_password(settings.super_admin_password)
+                ),
+                full_name="Super Admin", role="super_admin",
+                email_verified=True, language="en",
+            ),
+            CreditBalance(tenant_id=admin_tenant.id, balance=999999, lifetime_purchased=999999),
+        ])
 
         await db.commit()
         logger.info("Initial data seeded: super admin, platforms, credit packages")
@@ -85,50 +140,61 @@ async def _seed_initial_data():
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: create database tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-        # Add columns that were added to models after the table was first created.
-        # create_all only creates NEW tables; it won't alter existing ones.
-        missing_columns = [
-            # scraped_profiles — added after initial table creation
-            ("scraped_profiles", "birthday", "VARCHAR(100)"),
-            ("scraped_profiles", "relationship", "VARCHAR(255)"),
-            ("scraped_profiles", "website", "TEXT"),
-            ("scraped_profiles", "languages", "TEXT"),
-            ("scraped_profiles", "phone", "VARCHAR(100)"),
-            ("scraped_profiles", "picture_url", "TEXT"),
-            # scraped_posts — added after initial table creation
-            ("scraped_posts", "updated_time", "TIMESTAMPTZ"),
-            ("scraped_posts", "from_name", "VARCHAR(255)"),
-            ("scraped_posts", "from_id", "VARCHAR(255)"),
-            ("scraped_posts", "comment_count", "INTEGER DEFAULT 0"),
-            ("scraped_posts", "reaction_count", "INTEGER DEFAULT 0"),
-            ("scraped_posts", "share_count", "INTEGER DEFAULT 0"),
-            ("scraped_posts", "attachment_type", "VARCHAR(50)"),
-            ("scraped_posts", "attachment_url", "TEXT"),
-            ("scraped_posts", "post_url", "TEXT"),
-            # credit_balances — may have been added after initial table creation
-            ("credit_balances", "lifetime_used", "INTEGER DEFAULT 0"),
-            # credit_packages — billing_interval added after initial table creation
-            ("credit_packages", "billing_interval", "VARCHAR(20) DEFAULT 'one_time'"),
-            # payments — subscription/refund fields added after initial table creation
-            ("payments", "stripe_subscription_id", "VARCHAR(255)"),
-            ("payments", "refunded_at", "TIMESTAMPTZ"),
-        ]
-        for tbl, col, col_type in missing_columns:
-            await conn.execute(text(
-                f'ALTER TABLE {tbl} ADD COLUMN IF NOT EXISTS "{col}" {col_type}'
-            ))
-
-    logger.info("Database tables created/verified")
-
-    # Auto-seed on first run
-    try:
-        await _seed_initial_data()
-    except Exception as e:
-        logger.error("Failed to seed initial data: %s", e)
+    if await _schema_is_current():
+        logger.info("Schema v%d already bootstrapped, skipping create_all and seeding", SCHEMA_VERSION)
+    else:
+        # Startup: create database tables
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+            # Add columns that were added to models after the table was first created.
+            # create_all only creates NEW tables; it won't alter existing ones.
+            missing_columns = [
+                # scraped_profiles — added after initial table creation
+                ("scraped_profiles", "birthday", "VARCHAR(100)"),
+                ("scraped_profiles", "relationship", "VARCHAR(255)"),
+                ("scraped_profiles", "website", "TEXT"),
+                ("scraped_profiles", "languages", "TEXT"),
+                ("scraped_profiles", "phone", "VARCHAR(100)"),
+                ("scraped_profiles", "picture_url", "TEXT"),
+                # scraped_posts — added after initial table creation
+                ("scraped_posts", "updated_time", "TIMESTAMPTZ"),
+                ("scraped_posts", "from_name", "VARCHAR(255)"),
+                ("scraped_posts", "from_id", "VARCHAR(255)"),
+                ("scraped_posts", "comment_count", "INTEGER DEFAULT 0"),
+                ("scraped_posts", "reaction_count", "INTEGER DEFAULT 0"),
+                ("scraped_posts", "share_count", "INTEGER DEFAULT 0"),
+                ("scraped_posts", "attachment_type", "VARCHAR(50)"),
+                ("scraped_posts", "attachment_url", "TEXT"),
+                ("scraped_posts", "post_url", "TEXT"),
+                # credit_balances — may have been added after initial table creation
+                ("credit_balances", "lifetime_used", "INTEGER DEFAULT 0"),
+                # credit_packages — billing_interval added after initial table creation
+                ("credit_packages", "billing_interval", "VARCHAR(20) DEFAULT 'one_time'"),
+                # payments — subscription/refund fields added after initial table creation
+                ("payments", "stripe_subscription_id", "VARCHAR(255)"),
+                ("payments", "refunded_at", "TIMESTAMPTZ"),
+            ]
+            for tbl, col, col_type in missing_columns:
+                await conn.execute(text(
+                    f'ALTER TABLE {tbl} ADD COLUMN IF NOT EXISTS "{col}" {col_type}'
+                ))
+
+            # create_all builds fb_insights as a bare partitioned parent;
+            # inserts fail until partitions (and the default) exist. The
+            # rollups view isn't a table, so create_all skips it too
+            from app.models.fb_ads import FBInsight, FBInsightRollup
+            await FBInsight.ensure_partitions(conn)
+            await FBInsightRollup.ensure_view(conn)
+
+        logger.info("Database tables created/verified")
+
+        # Auto-seed on first run
+        try:
+            await _seed_initial_data()
+            await _stamp_schema_state()
+        except Exception as e:
+            logger.error("Failed to seed initial data: %s", e)
 
     yield
     # Shutdown
@@ -140,6 +206,7 @@ app = FastAPI(
     description="Social Media Data Extraction SaaS Platform",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.app_debug else None,
     redoc_url="/redoc" if settings.app_debug else None,
 )
@@ -158,19 +225,21 @@ async def global_exception_handler(request: Request, exc: Exception):
         str(exc),
         exc_info=True,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"},
     )
 
-# CORS
+# CORS — Starlette checks `origin in allow_origins` on every request, so a
+# frozenset makes that O(1). Methods/headers are the ones the frontend and
+# extension actually send.
 logger.info("CORS allowed origins: %s", settings.cors_origin_list)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origin_list,
+    allow_origins=frozenset(settings.cors_origin_list),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "Cache-Control", "Last-Event-ID", "X-Requested-With"],
 )
 
 # Visitor tracking (must be added after CORS)
@@ -180,8 +249,9 @@ app.add_middleware(VisitorTrackingMiddleware)
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
 
-# Serve uploaded files
-app.mount("/uploads", StaticFiles(directory=settings.upload_dir), name="uploads")
+# Serve uploaded files (unless a reverse proxy serves them directly)
+if settings.serve_uploads:
+    app.mount("/uploads", StaticFiles(directory=settings.upload_dir), name="uploads")
 
 
 @app.get("/health")
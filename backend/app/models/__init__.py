@@ -9,7 +9,7 @@ from app.models.system import SystemSetting, NotificationTemplate
 from app.models.fan_analysis import FanAnalysisCache
 from app.models.fb_ads import (
     FBConnection, FBAdAccount, FBPage, FBPixel,
-    FBCampaign, FBAdSet, FBAd, FBInsight,
+    FBCampaign, FBAdSet, FBAd, FBInsight, FBInsightRollup,
     FBInsightScore, FBWinningAd,
     AICampaign, AICampaignAdSet, AICampaignAd,
 )
@@ -55,6 +55,7 @@ __all__ = [
     "FBAdSet",
     "FBAd",
     "FBInsight",
+    "FBInsightRollup",
     "FBInsightScore",
     "FBWinningAd",
     "AICampaign",
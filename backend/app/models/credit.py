@@ -1,9 +1,10 @@
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import String, Integer, Boolean, DateTime, ForeignKey, Text, CheckConstraint
+from datetime import datetime
+from sqlalchemy import String, Integer, Boolean, DateTime, ForeignKey, Text, CheckConstraint, Index, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class CreditPackage(Base):
@@ -25,7 +26,7 @@ class CreditPackage(Base):
     daily_job_limit: Mapped[int] = mapped_column(Integer, default=0)       # 0 = unlimited
     monthly_credit_limit: Mapped[int] = mapped_column(Integer, default=0)  # 0 = unlimited
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
 
 
@@ -34,6 +35,8 @@ class CreditBalance(Base):
     __table_args__ = (
         CheckConstraint("balance >= 0", name="ck_credit_balance_non_negative"),
     )
+    # Read back the DB-generated updated_at via RETURNING on INSERT/UPDATE
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -45,9 +48,7 @@ class CreditBalance(Base):
     lifetime_purchased: Mapped[int] = mapped_column(Integer, default=0)
     lifetime_used: Mapped[int] = mapped_column(Integer, default=0)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
@@ -56,12 +57,16 @@ class CreditBalance(Base):
 
 class CreditTransaction(Base):
     __tablename__ = "credit_transactions"
+    __table_args__ = (
+        # Per-tenant ledger reads filter by tenant and range/sort on time
+        Index("ix_credit_tx_tenant_created", "tenant_id", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     tenant_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
     )
     user_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=True
@@ -73,7 +78,7 @@ class CreditTransaction(Base):
     reference_type: Mapped[str | None] = mapped_column(String(50))
     reference_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True
+        DateTime(timezone=True), server_default=func.now()
     )
 
     # Relationships
@@ -1,25 +1,36 @@
 """Facebook Ads integration models — connections, ad accounts, pages, pixels,
 campaigns, ad sets, ads, insights, scoring, winning ads, and AI campaigns."""
 
+import enum
+import json
 import uuid
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
+    Column,
     Date,
     DateTime,
+    Enum,
     ForeignKey,
+    Index,
     Integer,
-    Numeric,
+    MetaData,
     String,
+    Table,
     Text,
     UniqueConstraint,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID, insert as pg_insert
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, BulkSaveMixin
+from app.models.types import Micros, to_micros
+from app.utils.ids import uuid7
 
 
 # ---------------------------------------------------------------------------
@@ -30,8 +41,9 @@ class FBConnection(Base):
     """Stores encrypted OAuth tokens for a tenant's Facebook connection."""
 
     __tablename__ = "fb_connections"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -44,24 +56,25 @@ class FBConnection(Base):
     scopes: Mapped[dict] = mapped_column(JSONB, default=list)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
-    connected_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    connected_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     last_synced_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     # relationships
-    ad_accounts = relationship("FBAdAccount", back_populates="connection", cascade="all, delete-orphan")
-    pages = relationship("FBPage", back_populates="connection", cascade="all, delete-orphan")
+    ad_accounts = relationship("FBAdAccount", back_populates="connection", cascade="all, delete-orphan", passive_deletes=True)
+    pages = relationship("FBPage", back_populates="connection", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class FBAdAccount(Base):
     """A Facebook Ad Account linked to a connection."""
 
     __tablename__ = "fb_ad_accounts"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -75,15 +88,15 @@ class FBAdAccount(Base):
     status: Mapped[str] = mapped_column(String(30), default="ACTIVE")
     is_selected: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     # relationships
     connection = relationship("FBConnection", back_populates="ad_accounts")
-    pixels = relationship("FBPixel", back_populates="ad_account", cascade="all, delete-orphan")
-    campaigns = relationship("FBCampaign", back_populates="ad_account", cascade="all, delete-orphan")
+    pixels = relationship("FBPixel", back_populates="ad_account", cascade="all, delete-orphan", passive_deletes=True)
+    campaigns = relationship("FBCampaign", back_populates="ad_account", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class FBPage(Base):
@@ -91,7 +104,7 @@ class FBPage(Base):
 
     __tablename__ = "fb_pages"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -105,7 +118,7 @@ class FBPage(Base):
     picture_url: Mapped[str | None] = mapped_column(Text)
     is_selected: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # relationships
     connection = relationship("FBConnection", back_populates="pages")
@@ -116,7 +129,7 @@ class FBPixel(Base):
 
     __tablename__ = "fb_pixels"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -127,7 +140,7 @@ class FBPixel(Base):
     name: Mapped[str] = mapped_column(String(300), nullable=False)
     is_selected: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # relationships
     ad_account = relationship("FBAdAccount", back_populates="pixels")
@@ -137,15 +150,94 @@ class FBPixel(Base):
 # Phase 2: Campaigns, Ad Sets, Ads, Insights
 # ---------------------------------------------------------------------------
 
-class FBCampaign(Base):
+# asyncpg caps a single statement at 32767 bind parameters
+_MAX_BIND_PARAMS = 32767
+
+
+def _rows_per_statement(table, values: list[dict]) -> int:
+    """How many rows fit in one multi-row INSERT under ``_MAX_BIND_PARAMS``.
+
+    Each row binds every column named in any of the dicts, plus every
+    column with a Python-side default, which SQLAlchemy fills in per row.
+    """
+    keys = set().union(*values)
+    width = sum(1 for c in table.columns if c.key in keys or c.default is not None)
+    return max(1, _MAX_BIND_PARAMS // width)
+
+
+class FBObjectType(enum.StrEnum):
+    """Level an insight row belongs to (PostgreSQL enum ``fb_object_type``)."""
+
+    CAMPAIGN = "campaign"
+    ADSET = "adset"
+    AD = "ad"
+
+
+def _fb_object_type() -> Enum:
+    return Enum(
+        FBObjectType,
+        name="fb_object_type",
+        values_callable=lambda members: [m.value for m in members],
+    )
+
+
+class _ExternalIdUpsertMixin:
+    """Bulk upsert for entities keyed by a unique Meta-side id column."""
+
+    EXTERNAL_ID_COLUMN: str
+
+    @classmethod
+    async def bulk_upsert_by_external_id(
+        cls, session, rows: list[dict], conflict_col: str | None = None
+    ) -> dict[str, uuid.UUID]:
+        """Insert or refresh rows in one ``INSERT ... ON CONFLICT DO UPDATE`` per batch.
+
+        Only the columns present in ``rows`` are overwritten on conflict
+        (``tenant_id`` and ``created_at`` are left alone), and only when the
+        existing row belongs to the same tenant: an external id owned by
+        another tenant is left untouched and missing from the result.
+        Repeated external ids in ``rows`` collapse to the last one.
+        Returns a map of external id to primary key so children can be
+        linked without a re-query.
+        """
+        if not rows:
+            return {}
+
+        conflict_col = conflict_col or cls.EXTERNAL_ID_COLUMN
+        now = datetime.now(timezone.utc)
+        # ON CONFLICT can't update the same row twice in one statement
+        latest = {row[conflict_col]: row for row in rows}
+        values = [{"id": uuid7(), **row, "synced_at": now, "created_at": now} for row in latest.values()]
+        update_cols = [
+            c for c in values[0]
+            if c not in ("id", "tenant_id", "created_at", conflict_col)
+        ]
+        external_id = getattr(cls, conflict_col)
+
+        ids: dict[str, uuid.UUID] = {}
+        batch_size = _rows_per_statement(cls.__table__, values)
+        for i in range(0, len(values), batch_size):
+            stmt = pg_insert(cls).values(values[i:i + batch_size])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[conflict_col],
+                set_={c: stmt.excluded[c] for c in update_cols},
+                where=cls.tenant_id == stmt.excluded.tenant_id,
+            ).returning(external_id, cls.id)
+            result = await session.execute(stmt)
+            ids.update(dict(result.all()))
+        return ids
+
+
+class FBCampaign(_ExternalIdUpsertMixin, Base):
     __tablename__ = "fb_campaigns"
+    EXTERNAL_ID_COLUMN = "campaign_id"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
     )
     ad_account_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("fb_ad_accounts.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True), ForeignKey("fb_ad_accounts.id", ondelete="CASCADE"), nullable=False, index=True
     )
     campaign_id: Mapped[str] = mapped_column(String(50), nullable=False, unique=True, index=True)
     name: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -156,23 +248,24 @@ class FBCampaign(Base):
     buying_type: Mapped[str | None] = mapped_column(String(30))
     created_time: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     updated_time: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
-    raw_data: Mapped[dict] = mapped_column(JSONB, default=dict)
-    synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    raw_data: Mapped[dict] = mapped_column(JSONB, default=dict, deferred=True)
+    synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     ad_account = relationship("FBAdAccount", back_populates="campaigns")
-    adsets = relationship("FBAdSet", back_populates="campaign", cascade="all, delete-orphan")
+    adsets = relationship("FBAdSet", back_populates="campaign", cascade="all, delete-orphan", passive_deletes=True)
 
 
-class FBAdSet(Base):
+class FBAdSet(_ExternalIdUpsertMixin, Base):
     __tablename__ = "fb_adsets"
+    EXTERNAL_ID_COLUMN = "adset_id"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
     )
     campaign_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("fb_campaigns.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True), ForeignKey("fb_campaigns.id", ondelete="CASCADE"), nullable=False, index=True
     )
     adset_id: Mapped[str] = mapped_column(String(50), nullable=False, unique=True, index=True)
     name: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -184,66 +277,268 @@ class FBAdSet(Base):
     bid_strategy: Mapped[str | None] = mapped_column(String(50))
     start_time: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     end_time: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
-    raw_data: Mapped[dict] = mapped_column(JSONB, default=dict)
-    synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    raw_data: Mapped[dict] = mapped_column(JSONB, default=dict, deferred=True)
+    synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     campaign = relationship("FBCampaign", back_populates="adsets")
-    ads = relationship("FBAd", back_populates="adset", cascade="all, delete-orphan")
+    ads = relationship("FBAd", back_populates="adset", cascade="all, delete-orphan", passive_deletes=True)
 
 
-class FBAd(Base):
+class FBAd(_ExternalIdUpsertMixin, Base):
     __tablename__ = "fb_ads"
+    EXTERNAL_ID_COLUMN = "ad_id"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
     )
     adset_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("fb_adsets.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True), ForeignKey("fb_adsets.id", ondelete="CASCADE"), nullable=False, index=True
     )
     ad_id: Mapped[str] = mapped_column(String(50), nullable=False, unique=True, index=True)
     name: Mapped[str] = mapped_column(String(500), nullable=False)
     status: Mapped[str] = mapped_column(String(30), default="ACTIVE")
     creative_id: Mapped[str | None] = mapped_column(String(50))
     creative_data: Mapped[dict] = mapped_column(JSONB, default=dict)
-    raw_data: Mapped[dict] = mapped_column(JSONB, default=dict)
-    synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    raw_data: Mapped[dict] = mapped_column(JSONB, default=dict, deferred=True)
+    synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     adset = relationship("FBAdSet", back_populates="ads")
 
 
-class FBInsight(Base):
+class FBInsight(BulkSaveMixin, Base):
     """Daily performance metrics per campaign/adset/ad."""
 
     __tablename__ = "fb_insights"
     __table_args__ = (
         UniqueConstraint("object_type", "object_id", "date", name="uq_fb_insight_object_date"),
+        # Every read filters tenant + object type + object ids over a date
+        # range; INCLUDE lets the metric sums run as index-only scans
+        Index(
+            "ix_fb_insights_tenant_obj_date",
+            "tenant_id", "object_type", "object_id", "date",
+            postgresql_include=["spend", "impressions", "clicks", "results", "purchase_value"],
+        ),
+        # Monthly range partitions (see ensure_partitions); the partition key
+        # has to be part of the primary key and every unique constraint
+        {"postgresql_partition_by": "RANGE (date)"},
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
     )
-    object_type: Mapped[str] = mapped_column(String(20), nullable=False)  # campaign, adset, ad
-    object_id: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
-    date: Mapped[datetime] = mapped_column(Date, nullable=False, index=True)
+    object_type: Mapped[FBObjectType] = mapped_column(_fb_object_type(), nullable=False)
+    object_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    date: Mapped[datetime] = mapped_column(Date, primary_key=True)
 
-    spend: Mapped[int] = mapped_column(Integer, default=0)
+    spend: Mapped[int] = mapped_column(BigInteger, default=0)
     impressions: Mapped[int] = mapped_column(Integer, default=0)
     clicks: Mapped[int] = mapped_column(Integer, default=0)
-    ctr: Mapped[Decimal] = mapped_column(Numeric(8, 4), default=0)
+    ctr: Mapped[Decimal] = mapped_column(Micros, default=0)
     cpc: Mapped[int] = mapped_column(Integer, default=0)
     cpm: Mapped[int] = mapped_column(Integer, default=0)
     results: Mapped[int] = mapped_column(Integer, default=0)
     cost_per_result: Mapped[int] = mapped_column(Integer, default=0)
-    purchase_value: Mapped[int] = mapped_column(Integer, default=0)
-    roas: Mapped[Decimal] = mapped_column(Numeric(8, 4), default=0)
-    actions: Mapped[dict] = mapped_column(JSONB, default=dict)
+    purchase_value: Mapped[int] = mapped_column(BigInteger, default=0)
+    roas: Mapped[Decimal] = mapped_column(Micros, default=0)
+    actions: Mapped[dict] = mapped_column(JSONB, default=dict, deferred=True)
+
+    synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    COPY_COLUMNS = (
+        "id", "tenant_id", "object_type", "object_id", "date",
+        "spend", "impressions", "clicks", "ctr", "cpc", "cpm", "results",
+        "cost_per_result", "purchase_value", "roas", "actions",
+        "synced_at", "created_at",
+    )
+
+    @classmethod
+    async def bulk_copy_upsert(cls, session, rows: list[dict]) -> int:
+        """Insert or refresh insight rows through COPY into a staging table.
+
+        Rows use the same keys as ``MetaAPIService.get_insights`` plus
+        ``tenant_id``. COPY itself cannot handle conflicts, so rows land in
+        a per-connection temp table and are merged with one
+        ``INSERT ... SELECT ... ON CONFLICT DO UPDATE``, so rows already
+        stored (including ones a concurrent sync just wrote) are refreshed
+        instead of failing the transaction. Returns the number of rows written.
+        """
+        if not rows:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        # A repeated key keeps its last row; ON CONFLICT cannot touch the
+        # same target row twice in one statement
+        records = {}
+        for row in rows:
+            day = row["date"]
+            if isinstance(day, str):
+                day = date.fromisoformat(day)
+            records[(row["object_type"], row["object_id"], day)] = (
+                row.get("id") or uuid7(),
+                uuid.UUID(str(row["tenant_id"])),
+                row["object_type"],
+                row["object_id"],
+                day,
+                row.get("spend", 0),
+                row.get("impressions", 0),
+                row.get("clicks", 0),
+                to_micros(row.get("ctr", 0)),
+                row.get("cpc", 0),
+                row.get("cpm", 0),
+                row.get("results", 0),
+                row.get("cost_per_result", 0),
+                row.get("purchase_value", 0),
+                to_micros(row.get("roas", 0)),
+                json.dumps(row.get("actions") or {}),
+                now,
+                now,
+            )
+
+        stage = f"_{cls.__tablename__}_stage"
+        columns = ", ".join(cls.COPY_COLUMNS)
+        await session.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {stage} "
+            f"(LIKE {cls.__tablename__} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+        ))
+        await session.execute(text(f"TRUNCATE {stage}"))
+
+        conn = await session.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            stage, records=list(records.values()), columns=cls.COPY_COLUMNS,
+        )
+
+        updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in cls.UPSERT_COLUMNS)
+        await session.execute(text(
+            f"INSERT INTO {cls.__tablename__} ({columns}) "
+            f"SELECT {columns} FROM {stage} "
+            f"ON CONFLICT (object_type, object_id, date) DO UPDATE SET {updates}"
+        ))
+        return len(records)
+
+    UPSERT_COLUMNS = (
+        "spend", "impressions", "clicks", "ctr", "cpc", "cpm", "results",
+        "cost_per_result", "purchase_value", "roas", "actions", "synced_at",
+    )
+
+    @classmethod
+    async def bulk_upsert(cls, session, rows: list[dict]) -> int:
+        """Insert or refresh insight rows keyed on (object_type, object_id, date).
+
+        Issues one ``INSERT ... ON CONFLICT DO UPDATE`` per batch instead of a
+        SELECT and INSERT/UPDATE per row. Returns the number of rows written.
+        """
+        now = datetime.now(timezone.utc)
+        values = []
+        for row in rows:
+            day = row["date"]
+            if isinstance(day, str):
+                day = date.fromisoformat(day)
+            values.append({
+                "id": row.get("id") or uuid7(),
+                "tenant_id": row["tenant_id"],
+                "object_type": row["object_type"],
+                "object_id": row["object_id"],
+                "date": day,
+                **{c: row[c] for c in cls.UPSERT_COLUMNS if c in row},
+                "actions": row.get("actions") or {},
+                "synced_at": now,
+                "created_at": now,
+            })
+
+        if not values:
+            return 0
+
+        batch_size = _rows_per_statement(cls.__table__, values)
+        for i in range(0, len(values), batch_size):
+            stmt = pg_insert(cls).values(values[i:i + batch_size])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["object_type", "object_id", "date"],
+                set_={c: stmt.excluded[c] for c in cls.UPSERT_COLUMNS},
+            )
+            await session.execute(stmt)
+        return len(values)
+
+    @classmethod
+    async def ensure_partitions(cls, session, months_ahead: int = 3, months_back: int = 3) -> None:
+        """Create the monthly partitions from ``months_back`` months ago through ``months_ahead``.
+
+        The default of three months back covers the 90-day back-fill of a
+        manual sync. Rows outside every range land in ``fb_insights_default``
+        (created here too, for databases built by create_all); creating
+        partitions ahead of time keeps that empty. ``session`` may also be
+        an AsyncConnection.
+        """
+        start = date.today().replace(day=1)
+        for _ in range(months_back):
+            start = (start - timedelta(days=1)).replace(day=1)
+        for _ in range(months_back + months_ahead + 1):
+            end = (start + timedelta(days=32)).replace(day=1)
+            # A month whose rows already sit in the default partition can't
+            # be split out (check_violation); those rows stay in the default
+            await session.execute(text(
+                "DO $$ BEGIN "
+                f"CREATE TABLE IF NOT EXISTS {cls.__tablename__}_p{start:%Y%m} "
+                f"PARTITION OF {cls.__tablename__} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}'); "
+                "EXCEPTION WHEN check_violation THEN NULL; END $$"
+            ))
+            start = end
+        await session.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {cls.__tablename__}_default "
+            f"PARTITION OF {cls.__tablename__} DEFAULT"
+        ))
+
+
+# Materialized views live in their own MetaData so create_all never tries to
+# build them as tables; they are created and refreshed in SQL (migration 052
+# or ensure_view at bootstrap, fb_sync_tasks.refresh_insight_rollups).
+_view_metadata = MetaData()
+
+
+class FBInsightRollup(Base):
+    """Read-only per-object insight totals from the fb_insight_rollups materialized view."""
+
+    __table__ = Table(
+        "fb_insight_rollups",
+        _view_metadata,
+        Column("tenant_id", UUID(as_uuid=True), primary_key=True),
+        Column("object_type", _fb_object_type(), primary_key=True),
+        Column("object_id", String(50), primary_key=True),
+        Column("spend", BigInteger),
+        Column("impressions", BigInteger),
+        Column("clicks", BigInteger),
+        Column("results", BigInteger),
+        Column("purchase_value", BigInteger),
+    )
 
-    synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    @classmethod
+    async def ensure_view(cls, conn) -> None:
+        """Create the view and its unique index if missing (create_all bootstrap).
+
+        Same definition as migration 052; the unique index is what lets
+        REFRESH ... CONCURRENTLY run.
+        """
+        await conn.execute(text(
+            "CREATE MATERIALIZED VIEW IF NOT EXISTS fb_insight_rollups AS "
+            "SELECT tenant_id, object_type, object_id, "
+            "SUM(spend)::bigint AS spend, "
+            "SUM(impressions)::bigint AS impressions, "
+            "SUM(clicks)::bigint AS clicks, "
+            "SUM(results)::bigint AS results, "
+            "SUM(purchase_value)::bigint AS purchase_value "
+            "FROM fb_insights "
+            "GROUP BY tenant_id, object_type, object_id"
+        ))
+        await conn.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ux_fb_insight_rollups_object "
+            "ON fb_insight_rollups (tenant_id, object_type, object_id)"
+        ))
 
 
 # ---------------------------------------------------------------------------
@@ -253,7 +548,7 @@ class FBInsight(Base):
 class FBInsightScore(Base):
     __tablename__ = "fb_insight_scores"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -262,12 +557,12 @@ class FBInsightScore(Base):
     )
     group_type: Mapped[str] = mapped_column(String(30), nullable=False)
     group_value: Mapped[str] = mapped_column(Text, nullable=False)
-    score: Mapped[Decimal] = mapped_column(Numeric(4, 2), default=0)
+    score: Mapped[Decimal] = mapped_column(Micros, default=0)
     metrics: Mapped[dict] = mapped_column(JSONB, default=dict)
     date_range_start: Mapped[datetime] = mapped_column(Date, nullable=False)
     date_range_end: Mapped[datetime] = mapped_column(Date, nullable=False)
-    scored_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    scored_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
 # ---------------------------------------------------------------------------
@@ -277,7 +572,7 @@ class FBInsightScore(Base):
 class FBWinningAd(Base):
     __tablename__ = "fb_winning_ads"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -285,15 +580,15 @@ class FBWinningAd(Base):
         UUID(as_uuid=True), ForeignKey("fb_ads.id", ondelete="CASCADE"), nullable=False
     )
     rank: Mapped[int] = mapped_column(Integer, nullable=False)
-    score: Mapped[Decimal] = mapped_column(Numeric(4, 2), default=0)
-    total_spend: Mapped[int] = mapped_column(Integer, default=0)
+    score: Mapped[Decimal] = mapped_column(Micros, default=0)
+    total_spend: Mapped[int] = mapped_column(BigInteger, default=0)
     total_results: Mapped[int] = mapped_column(Integer, default=0)
     cost_per_result: Mapped[int] = mapped_column(Integer, default=0)
-    roas: Mapped[Decimal] = mapped_column(Numeric(8, 4), default=0)
-    ctr: Mapped[Decimal] = mapped_column(Numeric(8, 4), default=0)
-    detected_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    roas: Mapped[Decimal] = mapped_column(Micros, default=0)
+    ctr: Mapped[Decimal] = mapped_column(Micros, default=0)
+    detected_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     criteria: Mapped[dict] = mapped_column(JSONB, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     ad = relationship("FBAd")
 
@@ -304,8 +599,9 @@ class FBWinningAd(Base):
 
 class AICampaign(Base):
     __tablename__ = "ai_campaigns"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -339,18 +635,18 @@ class AICampaign(Base):
     custom_audience_id: Mapped[str | None] = mapped_column(String(100))
     boost_goal: Mapped[str | None] = mapped_column(String(50))  # GET_MORE_MESSAGES, GET_MORE_VIDEO_VIEWS, etc.
     audience_type: Mapped[str | None] = mapped_column(String(50))  # ADVANTAGE_PLUS, CUSTOM_AUDIENCE, etc.
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
-    adsets = relationship("AICampaignAdSet", back_populates="campaign", cascade="all, delete-orphan")
+    adsets = relationship("AICampaignAdSet", back_populates="campaign", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class AICampaignAdSet(Base):
     __tablename__ = "ai_campaign_adsets"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     campaign_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("ai_campaigns.id", ondelete="CASCADE"), nullable=False
     )
@@ -358,16 +654,16 @@ class AICampaignAdSet(Base):
     targeting: Mapped[dict] = mapped_column(JSONB, default=dict)
     daily_budget: Mapped[int] = mapped_column(Integer, nullable=False)
     meta_adset_id: Mapped[str | None] = mapped_column(String(50))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     campaign = relationship("AICampaign", back_populates="adsets")
-    ads = relationship("AICampaignAd", back_populates="adset", cascade="all, delete-orphan")
+    ads = relationship("AICampaignAd", back_populates="adset", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class AICampaignAd(Base):
     __tablename__ = "ai_campaign_ads"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     adset_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("ai_campaign_adsets.id", ondelete="CASCADE"), nullable=False
     )
@@ -381,6 +677,6 @@ class AICampaignAd(Base):
     cta_type: Mapped[str] = mapped_column(String(50), default="LEARN_MORE")
     destination_url: Mapped[str | None] = mapped_column(Text)
     meta_ad_id: Mapped[str | None] = mapped_column(String(50))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     adset = relationship("AICampaignAdSet", back_populates="ads")
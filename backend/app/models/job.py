@@ -1,17 +1,34 @@
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import String, Integer, Boolean, DateTime, Float, ForeignKey, Text, Numeric
+from sqlalchemy import String, Integer, Boolean, DateTime, Float, ForeignKey, Text, Computed, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.database import Base
+from app.database import Base, BulkSaveMixin
+from app.models.types import BasisPoints
+from app.utils.ids import uuid7
 
 
 class ScrapingJob(Base):
     __tablename__ = "scraping_jobs"
+    __table_args__ = (
+        # Only jobs still in flight are polled and counted by status, so the
+        # index covers just those instead of the whole job history
+        Index(
+            "ix_scraping_jobs_active",
+            "status", "scheduled_at",
+            postgresql_where=text("status IN ('pending', 'scheduled', 'queued', 'running')"),
+        ),
+        Index(
+            "ix_scraping_jobs_celery_active",
+            "celery_task_id",
+            postgresql_where=text("celery_task_id IS NOT NULL"),
+        ),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
@@ -23,7 +40,7 @@ class ScrapingJob(Base):
         UUID(as_uuid=True), ForeignKey("platforms.id"), nullable=False
     )
     job_type: Mapped[str] = mapped_column(String(50), nullable=False)
-    status: Mapped[str] = mapped_column(String(30), default="pending", index=True)
+    status: Mapped[str] = mapped_column(String(30), default="pending")
 
     # Input
     input_type: Mapped[str] = mapped_column(String(30), nullable=False)
@@ -31,7 +48,7 @@ class ScrapingJob(Base):
     input_metadata: Mapped[dict] = mapped_column(JSONB, default=dict)
 
     # Scheduling
-    scheduled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), index=True)
+    scheduled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
@@ -39,7 +56,7 @@ class ScrapingJob(Base):
     total_items: Mapped[int] = mapped_column(Integer, default=0)
     processed_items: Mapped[int] = mapped_column(Integer, default=0)
     failed_items: Mapped[int] = mapped_column(Integer, default=0)
-    progress_pct: Mapped[Decimal] = mapped_column(Numeric(5, 2), default=0)
+    progress_pct: Mapped[Decimal] = mapped_column(BasisPoints, default=0)
 
     # Cost
     credits_estimated: Mapped[int] = mapped_column(Integer, default=0)
@@ -52,35 +69,35 @@ class ScrapingJob(Base):
     error_details: Mapped[dict | None] = mapped_column(JSONB)
 
     # Celery
-    celery_task_id: Mapped[str | None] = mapped_column(String(255), index=True)
+    celery_task_id: Mapped[str | None] = mapped_column(String(255))
 
     # Settings
     settings: Mapped[dict] = mapped_column(JSONB, default=dict)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
     # Relationships
     tenant = relationship("Tenant", back_populates="scraping_jobs")
     user = relationship("User", back_populates="scraping_jobs")
     platform = relationship("Platform")
-    scraped_profiles = relationship("ScrapedProfile", back_populates="job", cascade="all, delete-orphan")
-    extracted_comments = relationship("ExtractedComment", back_populates="job", cascade="all, delete-orphan")
-    scraped_posts = relationship("ScrapedPost", back_populates="job", cascade="all, delete-orphan")
-    page_author_profile = relationship("PageAuthorProfile", back_populates="job", uselist=False, cascade="all, delete-orphan")
+    scraped_profiles = relationship("ScrapedProfile", back_populates="job", cascade="all, delete-orphan", passive_deletes=True)
+    extracted_comments = relationship("ExtractedComment", back_populates="job", cascade="all, delete-orphan", passive_deletes=True)
+    scraped_posts = relationship("ScrapedPost", back_populates="job", cascade="all, delete-orphan", passive_deletes=True)
+    page_author_profile = relationship("PageAuthorProfile", back_populates="job", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
 
 
-class ScrapedProfile(Base):
+class ScrapedProfile(BulkSaveMixin, Base):
     __tablename__ = "scraped_profiles"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     job_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("scraping_jobs.id", ondelete="CASCADE"), nullable=False, index=True
@@ -116,18 +133,18 @@ class ScrapedProfile(Base):
     error_message: Mapped[str | None] = mapped_column(Text)
     scraped_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
 
     # Relationships
     job = relationship("ScrapingJob", back_populates="scraped_profiles")
 
 
-class ExtractedComment(Base):
+class ExtractedComment(BulkSaveMixin, Base):
     __tablename__ = "extracted_comments"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     job_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("scraping_jobs.id", ondelete="CASCADE"), nullable=False, index=True
@@ -139,21 +156,25 @@ class ExtractedComment(Base):
     comment_text: Mapped[str | None] = mapped_column(Text)
     comment_time: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
 
     # Relationships
     job = relationship("ScrapingJob", back_populates="extracted_comments")
 
 
-class ScrapedPost(Base):
+class ScrapedPost(BulkSaveMixin, Base):
     __tablename__ = "scraped_posts"
+    __table_args__ = (
+        Index("ix_scraped_posts_job_engagement", "job_id", text("engagement_total DESC")),
+        Index("ix_scraped_posts_tenant_created", "tenant_id", "created_time"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     job_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("scraping_jobs.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("scraping_jobs.id", ondelete="CASCADE"), nullable=False
     )
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
@@ -173,6 +194,13 @@ class ScrapedPost(Base):
     comment_count: Mapped[int] = mapped_column(Integer, default=0)
     reaction_count: Mapped[int] = mapped_column(Integer, default=0)
     share_count: Mapped[int] = mapped_column(Integer, default=0)
+    engagement_total: Mapped[int] = mapped_column(
+        Integer,
+        Computed(
+            "COALESCE(reaction_count, 0) + COALESCE(comment_count, 0) + COALESCE(share_count, 0)",
+            persisted=True,
+        ),
+    )
 
     # Attachments
     attachment_type: Mapped[str | None] = mapped_column(String(50))
@@ -191,7 +219,7 @@ class ScrapedPost(Base):
     raw_data: Mapped[dict | None] = mapped_column(JSONB)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
 
     # Relationships
@@ -202,7 +230,7 @@ class PageAuthorProfile(Base):
     __tablename__ = "page_author_profiles"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     job_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("scraping_jobs.id", ondelete="CASCADE"), nullable=False, index=True
@@ -225,7 +253,7 @@ class PageAuthorProfile(Base):
     fetched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
 
     # Relationships
@@ -1,19 +1,49 @@
+import enum
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import String, Integer, Boolean, DateTime, ForeignKey, Text
+from datetime import datetime
+from sqlalchemy import String, Integer, Boolean, DateTime, Enum, ForeignKey, Text, Index, text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
+from app.utils.ids import uuid7
+
+
+class PaymentMethod(enum.StrEnum):
+    """How a payment was made (PostgreSQL enum ``payment_method``)."""
+
+    STRIPE = "stripe"
+    BANK_TRANSFER = "bank_transfer"
+
+
+class PaymentStatus(enum.StrEnum):
+    """Lifecycle of a payment (PostgreSQL enum ``payment_status``)."""
+
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    REFUNDED = "refunded"
 
 
 class Payment(Base):
     __tablename__ = "payments"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Admin payment list filters by status and sorts newest first
+        Index("ix_payments_status_created", "status", "created_at"),
+        # Tenant billing history: completed payments, newest first
+        Index("ix_payments_tenant_status_created", "tenant_id", "status", "created_at"),
+        # Admin revenue total sums completed payments only
+        Index(
+            "ix_payments_completed_amount", "amount_cents",
+            postgresql_where=text("status = 'completed'"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     tenant_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
@@ -23,8 +53,22 @@ class Payment(Base):
     )
     amount_cents: Mapped[int] = mapped_column(Integer, nullable=False)
     currency: Mapped[str] = mapped_column(String(3), default="USD")
-    method: Mapped[str] = mapped_column(String(30), nullable=False)  # stripe, bank_transfer
-    status: Mapped[str] = mapped_column(String(30), default="pending")
+    method: Mapped[PaymentMethod] = mapped_column(
+        Enum(
+            PaymentMethod,
+            name="payment_method",
+            values_callable=lambda members: [m.value for m in members],
+        ),
+        nullable=False,
+    )
+    status: Mapped[PaymentStatus] = mapped_column(
+        Enum(
+            PaymentStatus,
+            name="payment_status",
+            values_callable=lambda members: [m.value for m in members],
+        ),
+        default=PaymentStatus.PENDING,
+    )
     stripe_payment_intent_id: Mapped[str | None] = mapped_column(String(255), index=True)
     stripe_checkout_session_id: Mapped[str | None] = mapped_column(String(255))
     bank_transfer_proof_url: Mapped[str | None] = mapped_column(Text)
@@ -34,15 +78,10 @@ class Payment(Base):
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     refunded_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        DateTime(timezone=True), server_default=func.now()
     )
 
     # Relationships
-    tenant = relationship("Tenant", back_populates="payments")
-    user = relationship("User", back_populates="payments")
-    credit_package = relationship("CreditPackage")
+    tenant = relationship("Tenant", back_populates="payments", lazy="raise_on_sql")
+    user = relationship("User", back_populates="payments", lazy="raise_on_sql")
+    credit_package = relationship("CreditPackage", lazy="raise_on_sql")
@@ -1,16 +1,17 @@
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import String, Integer, Boolean, DateTime
+from datetime import datetime
+from sqlalchemy import String, Integer, Boolean, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class Platform(Base):
     __tablename__ = "platforms"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
     display_name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -23,5 +24,5 @@ class Platform(Base):
     credit_cost_per_page: Mapped[int] = mapped_column("credit_cost_per_post", Integer, default=1)
     credit_cost_per_action: Mapped[int] = mapped_column(Integer, default=3, server_default="3")
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
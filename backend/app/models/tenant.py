@@ -1,34 +1,51 @@
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import String, Boolean, DateTime, Text
+from datetime import datetime
+from sqlalchemy import String, Integer, Boolean, DateTime, Text, Computed, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class Tenant(Base):
     __tablename__ = "tenants"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     slug: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     plan: Mapped[str] = mapped_column(String(50), default="free")
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     settings: Mapped[dict] = mapped_column(JSONB, default=dict)
+
+    # Job limits from settings, resolved by the database on every write so
+    # job submission reads three integers instead of the whole settings blob
+    max_concurrent_jobs: Mapped[int] = mapped_column(
+        Integer,
+        Computed("COALESCE(CAST(settings ->> 'max_concurrent_jobs' AS INTEGER), 3)", persisted=True),
+    )
+    daily_job_limit: Mapped[int] = mapped_column(
+        Integer,
+        Computed("COALESCE(CAST(settings ->> 'daily_job_limit' AS INTEGER), 0)", persisted=True),
+    )
+    monthly_credit_limit: Mapped[int] = mapped_column(
+        Integer,
+        Computed("COALESCE(CAST(settings ->> 'monthly_credit_limit' AS INTEGER), 0)", persisted=True),
+    )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
     # Relationships
-    users = relationship("User", back_populates="tenant", cascade="all, delete-orphan")
-    credit_balance = relationship("CreditBalance", back_populates="tenant", uselist=False)
-    credit_transactions = relationship("CreditTransaction", back_populates="tenant")
-    payments = relationship("Payment", back_populates="tenant")
-    scraping_jobs = relationship("ScrapingJob", back_populates="tenant")
+    users = relationship("User", back_populates="tenant", cascade="all, delete-orphan", lazy="raise_on_sql")
+    credit_balance = relationship("CreditBalance", back_populates="tenant", uselist=False, lazy="raise_on_sql")
+    credit_transactions = relationship("CreditTransaction", back_populates="tenant", lazy="raise_on_sql")
+    payments = relationship("Payment", back_populates="tenant", lazy="raise_on_sql")
+    scraping_jobs = relationship("ScrapingJob", back_populates="tenant", lazy="raise_on_sql")
@@ -1,61 +1,82 @@
+import enum
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import String, Integer, Boolean, DateTime, ForeignKey, Text, Numeric, CheckConstraint, Index
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import String, Integer, Boolean, DateTime, Enum, ForeignKey, Text, Numeric, CheckConstraint, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
+from app.models.types import Money
+from app.utils.ids import uuid7
 
 
 class TrafficBotWallet(Base):
     __tablename__ = "traffic_bot_wallets"
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         CheckConstraint("balance >= 0", name="ck_tb_wallet_non_negative"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"),
         unique=True, nullable=False,
     )
-    balance: Mapped[float] = mapped_column(Numeric(12, 4), default=0)
+    balance: Mapped[Decimal] = mapped_column(Money, default=0)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
-    tenant = relationship("Tenant")
+    tenant = relationship("Tenant", lazy="raise_on_sql")
+
+
+class TrafficBotTransactionType(enum.StrEnum):
+    """Kind of wallet movement (PostgreSQL enum ``tb_transaction_type``)."""
+
+    DEPOSIT = "deposit"
+    ORDER_PAYMENT = "order_payment"
+    REFUND = "refund"
 
 
 class TrafficBotTransaction(Base):
     __tablename__ = "traffic_bot_transactions"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False, index=True,
     )
-    type: Mapped[str] = mapped_column(String(30), nullable=False)  # deposit, order_payment, refund
-    amount: Mapped[float] = mapped_column(Numeric(12, 4), nullable=False)
-    balance_after: Mapped[float] = mapped_column(Numeric(12, 4), nullable=False)
+    type: Mapped[TrafficBotTransactionType] = mapped_column(
+        Enum(
+            TrafficBotTransactionType,
+            name="tb_transaction_type",
+            values_callable=lambda members: [m.value for m in members],
+        ),
+        nullable=False,
+    )
+    amount: Mapped[Decimal] = mapped_column(Money, nullable=False)
+    balance_after: Mapped[Decimal] = mapped_column(Money, nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
     reference_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True
+        DateTime(timezone=True), server_default=func.now(), index=True
     )
 
-    tenant = relationship("Tenant")
+    tenant = relationship("Tenant", lazy="raise_on_sql")
 
 
 class TrafficBotService(Base):
     __tablename__ = "traffic_bot_services"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     external_service_id: Mapped[int] = mapped_column(Integer, unique=True, nullable=False)
     name: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -68,25 +89,27 @@ class TrafficBotService(Base):
     fee_pct: Mapped[float] = mapped_column(Numeric(5, 2), default=30)  # markup percentage
     sort_order: Mapped[int] = mapped_column(Integer, default=0)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
-    orders = relationship("TrafficBotOrder", back_populates="service")
+    orders = relationship("TrafficBotOrder", back_populates="service", lazy="raise_on_sql")
 
 
 class TrafficBotOrder(Base):
     __tablename__ = "traffic_bot_orders"
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         Index("ix_tb_orders_tenant_status", "tenant_id", "status"),
+        Index("ix_tb_orders_status_created", "status", "created_at"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"),
@@ -111,28 +134,31 @@ class TrafficBotOrder(Base):
     remains: Mapped[int | None] = mapped_column(Integer)
     error_message: Mapped[str | None] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True
+        DateTime(timezone=True), server_default=func.now(), index=True
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
-    tenant = relationship("Tenant")
-    user = relationship("User")
-    service = relationship("TrafficBotService", back_populates="orders")
+    tenant = relationship("Tenant", lazy="raise_on_sql")
+    user = relationship("User", lazy="raise_on_sql")
+    service = relationship("TrafficBotService", back_populates="orders", lazy="selectin")
 
 
 class TrafficBotWalletDeposit(Base):
     __tablename__ = "traffic_bot_wallet_deposits"
+    __table_args__ = (
+        Index("ix_tb_wallet_deposits_tenant_created", "tenant_id", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"),
-        nullable=False, index=True,
+        nullable=False,
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False,
@@ -145,9 +171,9 @@ class TrafficBotWalletDeposit(Base):
     proof_url: Mapped[str | None] = mapped_column(String(500))
     admin_notes: Mapped[str | None] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True
+        DateTime(timezone=True), server_default=func.now(), index=True
     )
     reviewed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
-    tenant = relationship("Tenant")
-    user = relationship("User")
+    tenant = relationship("Tenant", lazy="raise_on_sql")
+    user = relationship("User", lazy="raise_on_sql")
@@ -0,0 +1,55 @@
+"""Column types shared across models."""
+
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, SmallInteger, TypeDecorator
+
+MICROS = 1_000_000
+# Four decimal places, the precision of the Numeric(12, 4) wallet columns
+MONEY_SCALE = 10_000
+
+
+def to_micros(value) -> int:
+    """Encode a ratio/score as an integer count of millionths."""
+    return int((Decimal(str(value)) * MICROS).to_integral_value())
+
+
+class _ScaledInteger(TypeDecorator):
+    """Fixed-point decimal stored as an integer multiple of ``1 / scale``.
+
+    Python code keeps reading and writing ``Decimal``/``float`` values;
+    the database sees a fixed-width integer instead of variable-length
+    numeric.
+    """
+
+    cache_ok = True
+    scale: int
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int((Decimal(str(value)) * self.scale).to_integral_value())
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else Decimal(value) / self.scale
+
+
+class Micros(_ScaledInteger):
+    """BIGINT millionths, for ratios and scores."""
+
+    impl = BigInteger
+    scale = MICROS
+
+
+class BasisPoints(_ScaledInteger):
+    """SMALLINT hundredths, for 0-100 percentages (0-10000)."""
+
+    impl = SmallInteger
+    scale = 100
+
+
+class Money(_ScaledInteger):
+    """BIGINT ten-thousandths, for wallet balances and ledger amounts."""
+
+    impl = BigInteger
+    scale = MONEY_SCALE
@@ -1,21 +1,23 @@
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import String, Boolean, DateTime, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+from sqlalchemy import DDL, String, Boolean, DateTime, ForeignKey, Text, event, func
+from sqlalchemy.dialects.postgresql import CITEXT, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class User(Base):
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    email: Mapped[str] = mapped_column(CITEXT, unique=True, nullable=False, index=True)
     password_hash: Mapped[str | None] = mapped_column(String(255), nullable=True)
     full_name: Mapped[str | None] = mapped_column(String(255))
     avatar_url: Mapped[str | None] = mapped_column(Text)
@@ -28,16 +30,25 @@ class User(Base):
     telegram_chat_id: Mapped[str | None] = mapped_column(String(50), unique=True, index=True)
     last_login_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
     # Relationships
-    tenant = relationship("Tenant", back_populates="users")
-    payments = relationship("Payment", back_populates="user")
-    scraping_jobs = relationship("ScrapingJob", back_populates="user")
-    credit_transactions = relationship("CreditTransaction", back_populates="user")
+    tenant = relationship("Tenant", back_populates="users", lazy="raise_on_sql")
+    payments = relationship("Payment", back_populates="user", lazy="raise_on_sql")
+    scraping_jobs = relationship("ScrapingJob", back_populates="user", lazy="raise_on_sql")
+    credit_transactions = relationship("CreditTransaction", back_populates="user", lazy="raise_on_sql")
+
+
+# email is citext, an extension type. Databases bootstrapped by create_all
+# (app startup) rather than migration 065 need the extension first
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS citext").execute_if(dialect="postgresql"),
+)
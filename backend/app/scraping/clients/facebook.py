@@ -6,11 +6,31 @@ from app.config import get_settings
 
 settings = get_settings()
 
+# URL patterns for parse_post_url / parse_page_input, compiled once
+_URL_ID_RE = re.compile(r"[?&]id=(\d+)")
+_GROUP_POST_RE = re.compile(r"groups/(\d+)/(?:posts|permalink)/(\d+)")
+_POST_RE = re.compile(r"/posts/(pfbid\w+|\w+)")
+_PAGE_POSTS_RE = re.compile(r"facebook\.com/([^/]+)/posts/")
+_VIDEO_RE = re.compile(r"/videos/(\d+)")
+_PAGE_VIDEOS_RE = re.compile(r"facebook\.com/([^/]+)/videos/")
+_REEL_RE = re.compile(r"/reels?/(\d+)")
+_STORY_FBID_RE = re.compile(r"story_fbid=(\d+)")
+_PFBID_RE = re.compile(r"(pfbid\w+)")
+_FBID_RE = re.compile(r"fbid=(\d+)")
+_WATCH_V_RE = re.compile(r"[?&]v=(\d+)")
+_GROUP_ID_RE = re.compile(r"groups/([^/?]+)")
+_PAGE_CONTENT_RE = re.compile(r"facebook\.com/([^/]+)/(?:posts|videos|reels?)/")
+_FB_PATH_RE = re.compile(r"facebook\.com/([^/?]+)")
+_CONTENT_ID_RE = re.compile(r"/(?:reel|reels|watch|video|videos|stories|story)/(\d+)")
+
+# A %XX escape: the cookie value is already URL-encoded
+_PERCENT_ENCODED_RE = re.compile(r"%[0-9A-Fa-f]{2}")
+
 
 def _resolve_page_id(page_segment: str, full_url: str) -> str:
     """If page segment is 'profile.php', extract numeric ID from ?id= param."""
     if page_segment and page_segment.startswith("profile.php"):
-        id_match = re.search(r"[?&]id=(\d+)", full_url)
+        id_match = _URL_ID_RE.search(full_url)
         if id_match:
             return id_match.group(1)
     return page_segment
@@ -36,7 +56,6 @@ class FacebookGraphClient(AbstractSocialClient):
         if not cookie:
             return cookie
 
-        import re as _re
         parts = []
         for pair in cookie.split(";"):
             pair = pair.strip()
@@ -45,7 +64,7 @@ class FacebookGraphClient(AbstractSocialClient):
             if "=" in pair:
                 key, value = pair.split("=", 1)
                 # Check if this specific value is already URL-encoded
-                if _re.search(r'%[0-9A-Fa-f]{2}', value):
+                if _PERCENT_ENCODED_RE.search(value):
                     parts.append(f"{key.strip()}={value}")
                 else:
                     parts.append(f"{key.strip()}={quote(value, safe='')}")
@@ -91,8 +110,11 @@ class FacebookGraphClient(AbstractSocialClient):
                 result["page_id"] = parts[0]
             return result
 
+        # Each pattern is only tried when the URL contains a literal it
+        # requires, so most URLs skip most of the regex searches
+
         # Group post
-        group_match = re.search(r"groups/(\d+)/(?:posts|permalink)/(\d+)", url)
+        group_match = "groups/" in url and _GROUP_POST_RE.search(url)
         if group_match:
             result["group_id"] = group_match.group(1)
             result["page_id"] = group_match.group(1)
@@ -101,11 +123,11 @@ class FacebookGraphClient(AbstractSocialClient):
             return result
 
         # Page/profile post - /posts/{id} or /posts/pfbid...
-        post_match = re.search(r"/posts/(pfbid\w+|\w+)", url)
+        post_match = "/posts/" in url and _POST_RE.search(url)
         if post_match:
             result["post_id"] = post_match.group(1)
             # Extract page name from URL: facebook.com/{page}/posts/...
-            page_match = re.search(r"facebook\.com/([^/]+)/posts/", url)
+            page_match = _PAGE_POSTS_RE.search(url)
             if page_match:
                 result["page_id"] = _resolve_page_id(page_match.group(1), url)
             return result
@@ -114,17 +136,17 @@ class FacebookGraphClient(AbstractSocialClient):
         # Use the SHORT video ID as post_id — the AKNG nested field expansion
         # API returns pagination cursors only for short IDs, not compound ones.
         # page_id is stored separately for the fallback chain if needed.
-        video_match = re.search(r"/videos/(\d+)", url)
+        video_match = "/videos/" in url and _VIDEO_RE.search(url)
         if video_match:
             video_id = video_match.group(1)
             result["post_id"] = video_id
-            page_match = re.search(r"facebook\.com/([^/]+)/videos/", url)
+            page_match = _PAGE_VIDEOS_RE.search(url)
             if page_match:
                 result["page_id"] = _resolve_page_id(page_match.group(1), url)
             return result
 
         # Reel post - /reel/{id} or /reels/{id}
-        reel_match = re.search(r"/reels?/(\d+)", url)
+        reel_match = "/reel" in url and _REEL_RE.search(url)
         if reel_match:
             result["post_id"] = reel_match.group(1)
             return result
@@ -133,29 +155,29 @@ class FacebookGraphClient(AbstractSocialClient):
         # Use the SHORT story_fbid as post_id — the AKNG nested field expansion
         # API returns pagination cursors only for short IDs, not compound ones.
         # page_id is stored separately for the fallback chain if needed.
-        story_match = re.search(r"story_fbid=(\d+)", url)
+        story_match = "story_fbid=" in url and _STORY_FBID_RE.search(url)
         if story_match:
             story_fbid = story_match.group(1)
             result["post_id"] = story_fbid
-            id_match = re.search(r"[?&]id=(\d+)", url)
+            id_match = _URL_ID_RE.search(url)
             if id_match:
                 result["page_id"] = id_match.group(1)
             return result
 
         # pfbid format in URL
-        pfbid_match = re.search(r"(pfbid\w+)", url)
+        pfbid_match = "pfbid" in url and _PFBID_RE.search(url)
         if pfbid_match:
             result["post_id"] = pfbid_match.group(1)
             return result
 
         # photo.php?fbid=...
-        photo_match = re.search(r"fbid=(\d+)", url)
+        photo_match = "fbid=" in url and _FBID_RE.search(url)
         if photo_match:
             result["post_id"] = photo_match.group(1)
             return result
 
         # watch/?v=... — short video ID works directly with AKNG
-        watch_match = re.search(r"[?&]v=(\d+)", url)
+        watch_match = "v=" in url and _WATCH_V_RE.search(url)
         if watch_match:
             result["post_id"] = watch_match.group(1)
             return result
@@ -277,7 +299,7 @@ class FacebookGraphClient(AbstractSocialClient):
             return result
 
         # Group URL
-        group_match = re.search(r"groups/([^/?]+)", value)
+        group_match = _GROUP_ID_RE.search(value)
         if group_match:
             result["page_id"] = group_match.group(1)
             result["is_group"] = True
@@ -285,11 +307,11 @@ class FacebookGraphClient(AbstractSocialClient):
 
         # Reel/video URL: /reel/{id}, /reels/{id}, /videos/{id}
         # These are content IDs, not page IDs — extract the numeric ID
-        reel_match = re.search(r"/reels?/(\d+)", value)
+        reel_match = _REEL_RE.search(value)
         if reel_match:
             result["page_id"] = reel_match.group(1)
             return result
-        video_match = re.search(r"/videos/(\d+)", value)
+        video_match = _VIDEO_RE.search(value)
         if video_match:
             result["page_id"] = video_match.group(1)
             return result
@@ -297,20 +319,20 @@ class FacebookGraphClient(AbstractSocialClient):
         # Page/profile URL — skip known non-page path segments
         if value.startswith("http"):
             # Try /{page}/posts/, /{page}/videos/, /{page}/reels/ first (page is before content type)
-            page_content_match = re.search(r"facebook\.com/([^/]+)/(?:posts|videos|reels?)/", value)
+            page_content_match = _PAGE_CONTENT_RE.search(value)
             if page_content_match:
                 page_segment = page_content_match.group(1)
                 if page_segment not in ("www", "m", "web", "l"):
                     result["page_id"] = _resolve_page_id(page_segment, value)
                     return result
 
-            username_match = re.search(r"facebook\.com/([^/?]+)", value)
+            username_match = _FB_PATH_RE.search(value)
             if username_match:
                 captured = username_match.group(1)
                 # Skip known content-type path segments
                 if captured in ("reel", "reels", "watch", "stories", "story", "photo", "video", "videos", "events", "marketplace"):
                     # Try to get a numeric ID from the URL path
-                    id_match = re.search(r"/(?:reel|reels|watch|video|videos|stories|story)/(\d+)", value)
+                    id_match = _CONTENT_ID_RE.search(value)
                     if id_match:
                         result["page_id"] = id_match.group(1)
                         return result
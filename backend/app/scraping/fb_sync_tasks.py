@@ -5,8 +5,9 @@ import json
 import logging
 from datetime import datetime, timedelta, timezone, date
 
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.celery_app import celery_app
@@ -68,98 +69,61 @@ async def _sync_fb_data(tenant_id: str) -> dict:
             # 1. Sync campaigns
             campaigns = await meta.list_campaigns(token, account.account_id)
             logger.info("[celery-sync] Fetched %d campaigns from Meta", len(campaigns))
+            campaign_ids = await FBCampaign.bulk_upsert_by_external_id(db, [
+                {
+                    "tenant_id": tenant_id,
+                    "ad_account_id": account.id,
+                    "campaign_id": c["campaign_id"],
+                    "name": c["name"],
+                    "objective": c["objective"],
+                    "status": c["status"],
+                    "daily_budget": c["daily_budget"],
+                    "lifetime_budget": c["lifetime_budget"],
+                    "buying_type": c["buying_type"],
+                    "raw_data": c["raw_data"],
+                }
+                for c in campaigns
+            ])
+            stats["campaigns"] = len(campaign_ids)
+
+            # 2. Sync ad sets for each campaign
+            adset_rows = []
             for c in campaigns:
-                existing = await db.execute(
-                    select(FBCampaign).where(FBCampaign.campaign_id == c["campaign_id"])
-                )
-                camp = existing.scalar_one_or_none()
-                if camp:
-                    camp.name = c["name"]
-                    camp.objective = c["objective"]
-                    camp.status = c["status"]
-                    camp.daily_budget = c["daily_budget"]
-                    camp.lifetime_budget = c["lifetime_budget"]
-                    camp.buying_type = c["buying_type"]
-                    camp.raw_data = c["raw_data"]
-                    camp.synced_at = datetime.now(timezone.utc)
-                else:
-                    camp = FBCampaign(
-                        tenant_id=tenant_id,
-                        ad_account_id=account.id,
-                        campaign_id=c["campaign_id"],
-                        name=c["name"],
-                        objective=c["objective"],
-                        status=c["status"],
-                        daily_budget=c["daily_budget"],
-                        lifetime_budget=c["lifetime_budget"],
-                        buying_type=c["buying_type"],
-                        raw_data=c["raw_data"],
-                    )
-                    db.add(camp)
-                    await db.flush()
-                stats["campaigns"] += 1
-
-                # 2. Sync ad sets for each campaign
-                adsets = await meta.list_adsets(token, c["campaign_id"])
-                for a in adsets:
-                    existing = await db.execute(
-                        select(FBAdSet).where(FBAdSet.adset_id == a["adset_id"])
-                    )
-                    adset = existing.scalar_one_or_none()
-                    if adset:
-                        adset.name = a["name"]
-                        adset.status = a["status"]
-                        adset.daily_budget = a["daily_budget"]
-                        adset.targeting = a["targeting"]
-                        adset.optimization_goal = a["optimization_goal"]
-                        adset.billing_event = a["billing_event"]
-                        adset.bid_strategy = a["bid_strategy"]
-                        adset.raw_data = a["raw_data"]
-                        adset.synced_at = datetime.now(timezone.utc)
-                    else:
-                        adset = FBAdSet(
-                            tenant_id=tenant_id,
-                            campaign_id=camp.id,
-                            adset_id=a["adset_id"],
-                            name=a["name"],
-                            status=a["status"],
-                            daily_budget=a["daily_budget"],
-                            targeting=a["targeting"],
-                            optimization_goal=a["optimization_goal"],
-                            billing_event=a["billing_event"],
-                            bid_strategy=a["bid_strategy"],
-                            raw_data=a["raw_data"],
-                        )
-                        db.add(adset)
-                        await db.flush()
-                    stats["adsets"] += 1
-
-                    # 3. Sync ads for each ad set
-                    ads = await meta.list_ads(token, a["adset_id"])
-                    for ad_data in ads:
-                        existing = await db.execute(
-                            select(FBAd).where(FBAd.ad_id == ad_data["ad_id"])
-                        )
-                        ad = existing.scalar_one_or_none()
-                        if ad:
-                            ad.name = ad_data["name"]
-                            ad.status = ad_data["status"]
-                            ad.creative_id = ad_data["creative_id"]
-                            ad.creative_data = ad_data["creative_data"]
-                            ad.raw_data = ad_data["raw_data"]
-                            ad.synced_at = datetime.now(timezone.utc)
-                        else:
-                            db.add(FBAd(
-                                tenant_id=tenant_id,
-                                adset_id=adset.id,
-                                ad_id=ad_data["ad_id"],
-                                name=ad_data["name"],
-                                status=ad_data["status"],
-                                creative_id=ad_data["creative_id"],
-                                creative_data=ad_data["creative_data"],
-                                raw_data=ad_data["raw_data"],
-                            ))
-                        stats["ads"] += 1
+                camp_pk = campaign_ids.get(c["campaign_id"])
+                if not camp_pk:
+                    continue
+                for a in await meta.list_adsets(token, c["campaign_id"]):
+                    adset_rows.append({
+                        "tenant_id": tenant_id,
+                        "campaign_id": camp_pk,
+                        "adset_id": a["adset_id"],
+                        "name": a["name"],
+                        "status": a["status"],
+                        "daily_budget": a["daily_budget"],
+                        "targeting": a["targeting"],
+                        "optimization_goal": a["optimization_goal"],
+                        "billing_event": a["billing_event"],
+                        "bid_strategy": a["bid_strategy"],
+                        "raw_data": a["raw_data"],
+                    })
+            adset_ids = await FBAdSet.bulk_upsert_by_external_id(db, adset_rows)
+            stats["adsets"] = len(adset_ids)
+
+            # 3. Sync ads for each ad set
+            ad_rows = []
+            for adset_id, adset_pk in adset_ids.items():
+                for ad_data in await meta.list_ads(token, adset_id):
+                    ad_rows.append({
+                        "tenant_id": tenant_id,
+                        "adset_id": adset_pk,
+                        "ad_id": ad_data["ad_id"],
+                        "name": ad_data["name"],
+                        "status": ad_data["status"],
+                        "creative_id": ad_data["creative_id"],
+                        "creative_data": ad_data["creative_data"],
+                        "raw_data": ad_data["raw_data"],
+                    })
+            stats["ads"] = len(await FBAd.bulk_upsert_by_external_id(db, ad_rows))
 
             # 4. Sync insights (last 28 days) for all levels
             date_to = date.today().isoformat()
@@ -169,48 +133,14 @@ async def _sync_fb_data(tenant_id: str) -> dict:
                 rows = await meta.get_insights(
                     token, account.account_id, date_from, date_to, level=level
                 )
-                for row in rows:
-                    # Upsert insight
-                    existing = await db.execute(
-                        select(FBInsight).where(
-                            FBInsight.object_type == row["object_type"],
-                            FBInsight.object_id == row["object_id"],
-                            FBInsight.date == row["date"],
-                        )
-                    )
-                    insight = existing.scalar_one_or_none()
-                    if insight:
-                        insight.spend = row["spend"]
-                        insight.impressions = row["impressions"]
-                        insight.clicks = row["clicks"]
-                        insight.ctr = row["ctr"]
-                        insight.cpc = row["cpc"]
-                        insight.cpm = row["cpm"]
-                        insight.results = row["results"]
-                        insight.cost_per_result = row["cost_per_result"]
-                        insight.purchase_value = row["purchase_value"]
-                        insight.roas = row["roas"]
-                        insight.actions = row["actions"]
-                        insight.synced_at = datetime.now(timezone.utc)
-                    else:
-                        db.add(FBInsight(
-                            tenant_id=tenant_id,
-                            object_type=row["object_type"],
-                            object_id=row["object_id"],
-                            date=row["date"],
-                            spend=row["spend"],
-                            impressions=row["impressions"],
-                            clicks=row["clicks"],
-                            ctr=row["ctr"],
-                            cpc=row["cpc"],
-                            cpm=row["cpm"],
-                            results=row["results"],
-                            cost_per_result=row["cost_per_result"],
-                            purchase_value=row["purchase_value"],
-                            roas=row["roas"],
-                            actions=row["actions"],
-                        ))
-                    stats["insights"] += 1
+                if not rows:
+                    continue
+
+                # One COPY plus merge per level; it upserts, so rows a
+                # concurrent manual /sync wrote meanwhile are just refreshed
+                stats["insights"] += await FBInsight.bulk_copy_upsert(
+                    db, [{**row, "tenant_id": tenant_id} for row in rows]
+                )
 
             logger.info("[celery-sync] Synced structure: %d campaigns, %d adsets, %d ads, %d insights for tenant %s",
                         stats["campaigns"], stats["adsets"], stats["ads"], stats["insights"], tenant_id)
@@ -263,6 +193,62 @@ def sync_all_tenants():
     return {"tenants_dispatched": len(tenant_ids)}
 
 
+@celery_app.task(name="app.scraping.fb_sync_tasks.refresh_insight_rollups")
+def refresh_insight_rollups():
+    """Celery task: rebuild the fb_insight_rollups materialized view.
+
+    CONCURRENTLY keeps the view readable while it refreshes (needs the
+    unique index from migration 052).
+    """
+    async def _refresh():
+        async with async_session() as db:
+            await db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY fb_insight_rollups"))
+            await db.commit()
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_refresh())
+        logger.info("Refreshed fb_insight_rollups")
+    finally:
+        loop.close()
+
+
+# Manual syncs ask for a rollup refresh; ones landing within this window
+# share a single queued refresh instead of each re-aggregating the view
+ROLLUP_REFRESH_DEBOUNCE = 60  # seconds
+ROLLUP_REFRESH_PENDING_KEY = "fb:rollups:refresh_pending"
+
+
+def schedule_rollup_refresh() -> None:
+    """Queue refresh_insight_rollups unless one is already pending."""
+    import redis
+    from app.config import get_settings
+
+    r = redis.from_url(get_settings().redis_url)
+    try:
+        if r.set(ROLLUP_REFRESH_PENDING_KEY, 1, nx=True, ex=ROLLUP_REFRESH_DEBOUNCE):
+            refresh_insight_rollups.apply_async(countdown=ROLLUP_REFRESH_DEBOUNCE)
+    except Exception:
+        logger.warning("Failed to schedule fb_insight_rollups refresh", exc_info=True)
+    finally:
+        r.close()
+
+
+@celery_app.task(name="app.scraping.fb_sync_tasks.ensure_insight_partitions")
+def ensure_insight_partitions():
+    """Celery beat task: pre-create upcoming monthly fb_insights partitions."""
+    async def _ensure():
+        async with async_session() as db:
+            await FBInsight.ensure_partitions(db)
+            await db.commit()
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_ensure())
+    finally:
+        loop.close()
+
+
 # ---------------------------------------------------------------------------
 # Phase 5: AI Campaign Generation & Publishing
 # ---------------------------------------------------------------------------
@@ -290,7 +276,7 @@ async def _run_publish(campaign_id: str) -> dict:
     import httpx
     from app.services.meta_api import MetaAPIService, GRAPH_BASE
     from app.models.fb_ads import (
-        AICampaign, AICampaignAdSet, AICampaignAd,
+        AICampaign, AICampaignAdSet,
         FBConnection, FBAdAccount, FBPage,
     )
 
@@ -407,7 +393,9 @@ async def _run_publish(campaign_id: str) -> dict:
 
                 # 2. Create ad sets
                 adsets_r = await db.execute(
-                    select(AICampaignAdSet).where(AICampaignAdSet.campaign_id == campaign.id)
+                    select(AICampaignAdSet)
+                    .where(AICampaignAdSet.campaign_id == campaign.id)
+                    .options(selectinload(AICampaignAdSet.ads))
                 )
                 for adset in adsets_r.scalars().all():
                     # Clean targeting: remove non-spec keys that Meta rejects
@@ -452,10 +440,7 @@ async def _run_publish(campaign_id: str) -> dict:
                     adset.meta_adset_id = meta_adset_id
 
                     # 3. Create ads for this ad set
-                    ads_r = await db.execute(
-                        select(AICampaignAd).where(AICampaignAd.adset_id == adset.id)
-                    )
-                    for ad in ads_r.scalars().all():
+                    for ad in adset.ads:
                         creative_data = {
                             "name": ad.name,
                             "object_story_spec": json.dumps({
@@ -417,17 +417,19 @@ async def _execute_pipeline(job_id: str, celery_task):
                     )
                     existing_comments = existing_result.scalars().all()
 
+                    await ExtractedComment.bulk_copy(db, [
+                        {
+                            "job_id": job.id,
+                            "post_id": ec.post_id,
+                            "comment_id": ec.comment_id,
+                            "commenter_user_id": ec.commenter_user_id,
+                            "commenter_name": ec.commenter_name,
+                            "comment_text": ec.comment_text,
+                            "comment_time": ec.comment_time,
+                        }
+                        for ec in existing_comments
+                    ])
                     for ec in existing_comments:
-                        new_comment = ExtractedComment(
-                            job_id=job.id,
-                            post_id=ec.post_id,
-                            comment_id=ec.comment_id,
-                            commenter_user_id=ec.commenter_user_id,
-                            commenter_name=ec.commenter_name,
-                            comment_text=ec.comment_text,
-                            comment_time=ec.comment_time,
-                        )
-                        db.add(new_comment)
                         all_comments.append({
                             "user_id": ec.commenter_user_id,
                             "user_name": ec.commenter_name,
@@ -729,17 +731,18 @@ async def _execute_pipeline(job_id: str, celery_task):
                         page_count += 1
 
                         # Store comments in DB (only new ones)
-                        for c in new_comments:
-                            comment = ExtractedComment(
-                                job_id=job.id,
-                                post_id=post_id,
-                                comment_id=c["comment_id"],
-                                commenter_user_id=c["user_id"],
-                                commenter_name=c["user_name"],
-                                comment_text=c["message"],
-                                comment_time=_parse_comment_time(c.get("created_time")),
-                            )
-                            db.add(comment)
+                        await ExtractedComment.bulk_save(db, [
+                            {
+                                "job_id": job.id,
+                                "post_id": post_id,
+                                "comment_id": c["comment_id"],
+                                "commenter_user_id": c["user_id"],
+                                "commenter_name": c["user_name"],
+                                "comment_text": c["message"],
+                                "comment_time": _parse_comment_time(c.get("created_time")),
+                            }
+                            for c in new_comments
+                        ])
 
                         # Save cursor after each page
                         next_cursor = extracted.get("next_cursor")
@@ -1011,16 +1014,17 @@ async def _execute_pipeline(job_id: str, celery_task):
 
                 logger.info(f"[Job {job_id}] Step: credit check passed, creating {len(unique_users)} ScrapedProfile rows")
                 # Create ScrapedProfile rows for ALL unique users
-                for uid, uname in unique_users.items():
-                    profile = ScrapedProfile(
-                        job_id=job.id,
-                        tenant_id=job.tenant_id,
-                        platform_user_id=uid,
-                        name=uname,
-                        comment_message=user_comments.get(uid, ""),
-                        scrape_status="pending",
-                    )
-                    db.add(profile)
+                await ScrapedProfile.bulk_copy(db, [
+                    {
+                        "job_id": job.id,
+                        "tenant_id": job.tenant_id,
+                        "platform_user_id": uid,
+                        "name": uname,
+                        "comment_message": user_comments.get(uid, ""),
+                        "scrape_status": "pending",
+                    }
+                    for uid, uname in unique_users.items()
+                ])
                 await db.commit()
                 logger.info(f"[Job {job_id}] Step: ScrapedProfile rows committed OK")
 
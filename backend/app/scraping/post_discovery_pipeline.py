@@ -696,6 +696,7 @@ async def _execute_post_discovery(job_id: str, celery_task):
 
                     # Process each post in this page (skip duplicates)
                     new_posts_this_page = 0
+                    page_rows = []
                     for item in posts_data:
                         fields = _extract_post_fields(item)
                         if fields is None:
@@ -706,30 +707,30 @@ async def _execute_post_discovery(job_id: str, celery_task):
                             continue
                         seen_post_ids.add(pid)
 
-                        scraped_post = ScrapedPost(
-                            job_id=job.id,
-                            tenant_id=job.tenant_id,
-                            post_id=pid,
-                            message=fields["message"],
-                            created_time=fields["created_time"],
-                            updated_time=fields["updated_time"],
-                            from_name=fields["from_name"],
-                            from_id=fields["from_id"],
-                            comment_count=fields["comment_count"],
-                            reaction_count=fields["reaction_count"],
-                            share_count=fields["share_count"],
-                            attachment_type=fields["attachment_type"],
-                            attachment_url=fields["attachment_url"],
-                            post_url=fields["post_url"],
-                            is_livestream=fields.get("is_livestream", False),
-                            video_views=fields.get("video_views"),
-                            live_views=fields.get("live_views"),
-                            video_length=fields.get("video_length"),
-                            raw_data=fields["raw_data"],
-                        )
-                        db.add(scraped_post)
+                        page_rows.append({
+                            "job_id": job.id,
+                            "tenant_id": job.tenant_id,
+                            "post_id": pid,
+                            "message": fields["message"],
+                            "created_time": fields["created_time"],
+                            "updated_time": fields["updated_time"],
+                            "from_name": fields["from_name"],
+                            "from_id": fields["from_id"],
+                            "comment_count": fields["comment_count"],
+                            "reaction_count": fields["reaction_count"],
+                            "share_count": fields["share_count"],
+                            "attachment_type": fields["attachment_type"],
+                            "attachment_url": fields["attachment_url"],
+                            "post_url": fields["post_url"],
+                            "is_livestream": fields.get("is_livestream", False),
+                            "video_views": fields.get("video_views"),
+                            "live_views": fields.get("live_views"),
+                            "video_length": fields.get("video_length"),
+                            "raw_data": fields["raw_data"],
+                        })
                         total_posts_fetched += 1
                         new_posts_this_page += 1
+                    await ScrapedPost.bulk_save(db, page_rows)
 
                     # Track consecutive empty pages to stop early
                     if new_posts_this_page > 0:
@@ -922,30 +923,30 @@ async def _execute_post_discovery(job_id: str, celery_task):
                             await _append_log(db, job, "info", "fetch_posts",
                                 "API failed, switched to browser extension fallback")
                             # Process extension posts through the normal flow
+                            pw_rows = []
                             for item in pw_result["data"]:
                                 fields = _extract_post_fields(item)
                                 pid = fields["post_id"]
                                 if pid in seen_post_ids:
                                     continue
                                 seen_post_ids.add(pid)
-                                scraped_post = ScrapedPost(
-                                    job_id=job.id, tenant_id=job.tenant_id,
-                                    post_id=pid, message=fields["message"],
-                                    created_time=fields["created_time"],
-                                    updated_time=fields["updated_time"],
-                                    from_name=fields["from_name"], from_id=fields["from_id"],
-                                    comment_count=fields["comment_count"],
-                                    reaction_count=fields["reaction_count"],
-                                    share_count=fields["share_count"],
-                                    attachment_type=fields["attachment_type"],
-                                    attachment_url=fields["attachment_url"],
-                                    post_url=fields["post_url"],
-                                    raw_data=fields["raw_data"],
-                                )
-                                db.add(scraped_post)
+                                pw_rows.append({
+                                    "job_id": job.id, "tenant_id": job.tenant_id,
+                                    "post_id": pid, "message": fields["message"],
+                                    "created_time": fields["created_time"],
+                                    "updated_time": fields["updated_time"],
+                                    "from_name": fields["from_name"], "from_id": fields["from_id"],
+                                    "comment_count": fields["comment_count"],
+                                    "reaction_count": fields["reaction_count"],
+                                    "share_count": fields["share_count"],
+                                    "attachment_type": fields["attachment_type"],
+                                    "attachment_url": fields["attachment_url"],
+                                    "post_url": fields["post_url"],
+                                    "raw_data": fields["raw_data"],
+                                })
                                 total_posts_fetched += 1
+                            await ScrapedPost.bulk_save(db, pw_rows)
                             if total_posts_fetched > 0:
-                                await db.flush()
                                 pw_recovered = True
                 except NameError:
                     pass  # Variables not yet defined
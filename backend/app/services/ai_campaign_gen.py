@@ -5,7 +5,7 @@ import logging
 from datetime import datetime, timezone
 
 from openai import AsyncOpenAI
-from sqlalchemy import select, func
+from sqlalchemy import delete, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
@@ -59,12 +59,10 @@ async def generate_campaign(db: AsyncSession, campaign_id: str, *, access_token:
         raise ValueError(f"Campaign {campaign_id} not found")
 
     # Delete any existing ad sets/ads from previous failed generation
-    old_adsets_r = await db.execute(
-        select(AICampaignAdSet).where(AICampaignAdSet.campaign_id == campaign.id)
+    # (ads go with them via ON DELETE CASCADE)
+    await db.execute(
+        delete(AICampaignAdSet).where(AICampaignAdSet.campaign_id == campaign.id)
     )
-    for old_adset in old_adsets_r.scalars().all():
-        await db.delete(old_adset)
-    await db.flush()
 
     campaign.status = "generating"
     campaign.generation_progress = {"stage": "analyze", "pct": 0}
@@ -0,0 +1,62 @@
+"""Read-through Redis cache for hot, rarely-changing API reads.
+
+Cache failures are never fatal: if Redis is unavailable the loader is
+called directly, so callers behave exactly as they would uncached.
+"""
+
+import json
+import logging
+from typing import Any, Awaitable, Callable
+
+import redis.asyncio as aioredis
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_redis: aioredis.Redis | None = None
+
+
+def _get_redis() -> aioredis.Redis:
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(get_settings().redis_url, decode_responses=True)
+    return _redis
+
+
+async def get_or_set(key: str, loader: Callable[[], Awaitable[Any]], ttl: int) -> Any:
+    """Return the JSON value cached at ``key``, or call ``loader`` and cache it for ``ttl`` seconds."""
+    try:
+        cached = await _get_redis().get(key)
+        if cached is not None:
+            return json.loads(cached)
+    except Exception as e:
+        logger.debug("Cache read failed for %s: %s", key, e)
+
+    value = await loader()
+
+    try:
+        await _get_redis().setex(key, ttl, json.dumps(value, default=str))
+    except Exception as e:
+        logger.debug("Cache write failed for %s: %s", key, e)
+
+    return value
+
+
+async def invalidate(*keys: str) -> None:
+    """Drop the given keys from the cache."""
+    try:
+        await _get_redis().delete(*keys)
+    except Exception as e:
+        logger.debug("Cache invalidate failed for %s: %s", keys, e)
+
+
+async def invalidate_prefix(prefix: str) -> None:
+    """Drop every cached key starting with ``prefix``."""
+    try:
+        r = _get_redis()
+        keys = [k async for k in r.scan_iter(match=f"{prefix}*")]
+        if keys:
+            await r.delete(*keys)
+    except Exception as e:
+        logger.debug("Cache invalidate failed for prefix %s: %s", prefix, e)
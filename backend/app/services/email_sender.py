@@ -109,19 +109,22 @@ async def _resolve_smtp_config() -> dict | None:
         from app.database import async_session
         from app.models.tenant import Tenant
 
+        email = Tenant.settings["email"]
         async with async_session() as db:
-            result = await db.execute(select(Tenant))
-            tenants = result.scalars().all()
-            for tenant in tenants:
-                email_cfg = (tenant.settings or {}).get("email", {})
-                if email_cfg.get("smtp_host") and email_cfg.get("smtp_user"):
-                    return {
-                        "hostname": email_cfg["smtp_host"],
-                        "port": email_cfg.get("smtp_port", 587),
-                        "username": email_cfg["smtp_user"],
-                        "password": email_cfg.get("smtp_password", ""),
-                        "email_from": email_cfg.get("email_from", settings.email_from),
-                    }
+            result = await db.execute(
+                select(email)
+                .where(email["smtp_host"].astext != "", email["smtp_user"].astext != "")
+                .limit(1)
+            )
+            email_cfg = result.scalar_one_or_none()
+            if email_cfg:
+                return {
+                    "hostname": email_cfg["smtp_host"],
+                    "port": email_cfg.get("smtp_port", 587),
+                    "username": email_cfg["smtp_user"],
+                    "password": email_cfg.get("smtp_password", ""),
+                    "email_from": email_cfg.get("email_from", settings.email_from),
+                }
     except Exception:
         logger.warning("Failed to load tenant SMTP config from DB", exc_info=True)
 
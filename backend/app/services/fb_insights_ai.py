@@ -16,6 +16,7 @@ from app.models.fb_ads import (
     FBAdSet,
     FBCampaign,
     FBInsight,
+    FBInsightRollup,
     FBInsightScore,
     FBWinningAd,
 )
@@ -456,26 +457,29 @@ async def detect_winning_ads(db: AsyncSession, tenant_id, ad_account_id) -> list
     - Minimum $50 spend
     - Weighted formula: 0.4*roas_percentile + 0.3*cpr_inverse_percentile + 0.3*ctr_percentile
     """
-    # Get all ads with sufficient spend, scoped to the selected ad account
+    # Get all ads with sufficient spend, scoped to the selected ad account.
+    # Totals come from the fb_insight_rollups materialized view instead of
+    # re-aggregating fb_insights on every run. The view is refreshed about a
+    # minute after a manual sync (debounced) and hourly after Celery syncs,
+    # so results lag newly synced insights by up to that much.
     ads_r = await db.execute(
         select(
             FBAd,
-            func.sum(FBInsight.spend).label("spend"),
-            func.sum(FBInsight.impressions).label("impressions"),
-            func.sum(FBInsight.clicks).label("clicks"),
-            func.sum(FBInsight.results).label("results"),
-            func.sum(FBInsight.purchase_value).label("purchase_value"),
+            FBInsightRollup.spend,
+            FBInsightRollup.impressions,
+            FBInsightRollup.clicks,
+            FBInsightRollup.results,
+            FBInsightRollup.purchase_value,
         )
         .join(FBAdSet, FBAd.adset_id == FBAdSet.id)
         .join(FBCampaign, FBAdSet.campaign_id == FBCampaign.id)
-        .join(FBInsight, FBInsight.object_id == FBAd.ad_id)
+        .join(FBInsightRollup, FBInsightRollup.object_id == FBAd.ad_id)
         .where(
             FBCampaign.tenant_id == tenant_id,
             FBCampaign.ad_account_id == ad_account_id,
-            FBInsight.tenant_id == tenant_id,
-            FBInsight.object_type == "ad",
-        ).group_by(FBAd.id).having(
-            func.sum(FBInsight.spend) >= 5000  # $50 minimum
+            FBInsightRollup.tenant_id == tenant_id,
+            FBInsightRollup.object_type == "ad",
+            FBInsightRollup.spend >= 5000,  # $50 minimum
         )
     )
     rows = ads_r.all()
@@ -0,0 +1,76 @@
+"""Celery tasks for outbound order notifications (Telegram + WhatsApp).
+
+Queued from the API so request handlers return as soon as the order is
+committed instead of waiting on third-party HTTP round-trips.
+"""
+
+import asyncio
+import logging
+from uuid import UUID
+
+from app.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+async def _with_order(order_id: str, callback) -> None:
+    """Re-fetch an order with its service and owner, then run ``callback(order, db)``."""
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+    from sqlalchemy.orm import selectinload
+    from app.config import get_settings
+    from app.models.traffic_bot import TrafficBotOrder
+
+    # Fresh engine per invocation to avoid stale event loop issues
+    engine = create_async_engine(get_settings().async_database_url, echo=False)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as db:
+            result = await db.execute(
+                select(TrafficBotOrder)
+                .options(selectinload(TrafficBotOrder.user))
+                .where(TrafficBotOrder.id == UUID(order_id))
+            )
+            order = result.scalar_one_or_none()
+            if not order:
+                logger.warning("Order %s not found, skipping notification", order_id)
+                return
+            await callback(order, db)
+    finally:
+        await engine.dispose()
+
+
+async def _notify_order_admin(order, db) -> None:
+    from app.services.whatsapp_notify import notify_traffic_bot_order
+
+    await notify_traffic_bot_order(
+        order.user.email if order.user else "Unknown",
+        order.service.name if order.service else "Unknown",
+        order.quantity, float(order.total_cost), order.link, db,
+    )
+
+
+def _run(coro) -> None:
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@celery_app.task(name="app.services.notification_tasks.notify_traffic_bot_order_task")
+def notify_traffic_bot_order_task(order_id: str):
+    """Send the admin WhatsApp alert for a newly placed traffic bot order."""
+    _run(_with_order(order_id, _notify_order_admin))
+
+
+@celery_app.task(name="app.services.notification_tasks.send_tb_order_notification_task")
+def send_tb_order_notification_task(chat_id: str, order_id: str, service_name: str):
+    """Send the user's Telegram confirmation for a newly placed traffic bot order."""
+    from app.services.telegram_notify import send_tb_order_notification
+
+    async def _send(order, db):
+        await send_tb_order_notification(chat_id, order, service_name)
+
+    _run(_with_order(order_id, _send))
@@ -0,0 +1,26 @@
+"""Cached reads of global SystemSetting rows."""
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.system import SystemSetting
+from app.services import cache
+
+# Setting values are cached per key (see app.services.cache); admin writes
+# invalidate the key they change.
+SETTINGS_CACHE_PREFIX = "system_setting:"
+SETTINGS_CACHE_TTL = 60  # seconds
+
+
+def setting_cache_key(key: str) -> str:
+    return f"{SETTINGS_CACHE_PREFIX}{key}"
+
+
+async def get_system_setting(db: AsyncSession, key: str) -> dict | None:
+    """Return the stored value for ``key``, or None if it has never been set."""
+    async def _load():
+        result = await db.execute(
+            select(SystemSetting.value).where(SystemSetting.key == key)
+        )
+        return result.scalar_one_or_none()
+
+    return await cache.get_or_set(setting_cache_key(key), _load, ttl=SETTINGS_CACHE_TTL)
@@ -2571,7 +2571,7 @@ async def message_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         # Look up user by email
         async with async_session() as db:
             result = await db.execute(
-                select(User).where(func.lower(User.email) == email)
+                select(User).where(User.email == email)
             )
             user = result.scalar_one_or_none()
 
@@ -2588,7 +2588,7 @@ async def message_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         chat_id = str(update.effective_chat.id)
         async with async_session() as db:
             result = await db.execute(
-                select(User).where(func.lower(User.email) == email)
+                select(User).where(User.email == email)
             )
             u = result.scalar_one_or_none()
             if u:
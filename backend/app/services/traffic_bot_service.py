@@ -3,9 +3,8 @@ import logging
 import uuid
 from decimal import Decimal
 from datetime import datetime, timezone
-from sqlalchemy import select, update, func
+from sqlalchemy import RowMapping, select, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.traffic_bot import (
@@ -16,6 +15,16 @@ from app.services import traffic_bot_api
 
 logger = logging.getLogger(__name__)
 
+# Enabled-service listings are cached (see app.services.cache); admin
+# writes invalidate everything under this prefix.
+SERVICES_CACHE_PREFIX = "tb:services:"
+SERVICES_CACHE_TTL = 300  # seconds
+CATEGORIES_CACHE_KEY = f"{SERVICES_CACHE_PREFIX}categories"
+
+
+def services_cache_key(category: str | None) -> str:
+    return f"{SERVICES_CACHE_PREFIX}list:{category or '_'}"
+
 
 # ── Wallet ──────────────────────────────────────────────────
 
@@ -91,15 +100,23 @@ async def _refund(
 
 async def get_transactions(
     db: AsyncSession, tenant_id: uuid.UUID, limit: int = 50, offset: int = 0
-) -> list[TrafficBotTransaction]:
+) -> list[RowMapping]:
     result = await db.execute(
-        select(TrafficBotTransaction)
+        select(
+            TrafficBotTransaction.id,
+            TrafficBotTransaction.type,
+            TrafficBotTransaction.amount,
+            TrafficBotTransaction.balance_after,
+            TrafficBotTransaction.description,
+            TrafficBotTransaction.reference_id,
+            TrafficBotTransaction.created_at,
+        )
         .where(TrafficBotTransaction.tenant_id == tenant_id)
         .order_by(TrafficBotTransaction.created_at.desc())
         .limit(limit)
         .offset(offset)
     )
-    return list(result.scalars().all())
+    return list(result.mappings().all())
 
 
 # ── Services ────────────────────────────────────────────────
@@ -224,6 +241,9 @@ async def place_order(
         total_cost=total_cost,
         status="pending",
     )
+    # Attach the already-loaded service so callers can read order.service
+    # without another round-trip
+    order.service = service
     db.add(order)
     await db.flush()
 
@@ -288,7 +308,9 @@ async def list_orders(
     status: str | None = None,
     limit: int = 50, offset: int = 0,
 ) -> tuple[list[TrafficBotOrder], int]:
-    q = select(TrafficBotOrder).where(TrafficBotOrder.tenant_id == tenant_id).options(selectinload(TrafficBotOrder.service))
+    # No loader options needed: the mapper selectin-loads ``service`` and
+    # raises on every other relationship
+    q = select(TrafficBotOrder).where(TrafficBotOrder.tenant_id == tenant_id)
     count_q = select(func.count()).select_from(TrafficBotOrder).where(TrafficBotOrder.tenant_id == tenant_id)
     if status:
         q = q.where(TrafficBotOrder.status == status)
@@ -302,11 +324,7 @@ async def list_orders(
 
 
 async def get_order(db: AsyncSession, order_id: uuid.UUID) -> TrafficBotOrder | None:
-    result = await db.execute(
-        select(TrafficBotOrder)
-        .where(TrafficBotOrder.id == order_id)
-        .options(selectinload(TrafficBotOrder.service))
-    )
+    result = await db.execute(select(TrafficBotOrder).where(TrafficBotOrder.id == order_id))
     return result.scalar_one_or_none()
 
 
@@ -329,9 +347,32 @@ async def refill_order(db: AsyncSession, order: TrafficBotOrder) -> dict:
 async def list_all_orders(
     db: AsyncSession, status: str | None = None,
     limit: int = 50, offset: int = 0,
-) -> tuple[list[TrafficBotOrder], int]:
-    """Admin: list orders across all tenants."""
-    q = select(TrafficBotOrder).options(selectinload(TrafficBotOrder.service))
+) -> tuple[list[RowMapping], int]:
+    """Admin: list orders across all tenants.
+
+    Returns plain rows of the listed columns plus ``service_name`` rather
+    than ORM instances.
+    """
+    q = (
+        select(
+            TrafficBotOrder.id,
+            TrafficBotOrder.service_id,
+            TrafficBotService.name.label("service_name"),
+            TrafficBotOrder.external_order_id,
+            TrafficBotOrder.link,
+            TrafficBotOrder.quantity,
+            TrafficBotOrder.base_cost,
+            TrafficBotOrder.fee_amount,
+            TrafficBotOrder.total_cost,
+            TrafficBotOrder.status,
+            TrafficBotOrder.start_count,
+            TrafficBotOrder.remains,
+            TrafficBotOrder.error_message,
+            TrafficBotOrder.created_at,
+            TrafficBotOrder.updated_at,
+        )
+        .outerjoin(TrafficBotService, TrafficBotOrder.service_id == TrafficBotService.id)
+    )
     count_q = select(func.count()).select_from(TrafficBotOrder)
     if status:
         q = q.where(TrafficBotOrder.status == status)
@@ -339,6 +380,6 @@ async def list_all_orders(
     q = q.order_by(TrafficBotOrder.created_at.desc()).limit(limit).offset(offset)
 
     result = await db.execute(q)
-    orders = list(result.scalars().all())
+    orders = list(result.mappings().all())
     total = (await db.execute(count_q)).scalar() or 0
     return orders, total
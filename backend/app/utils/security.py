@@ -1,19 +1,24 @@
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
-from passlib.context import CryptContext
+import bcrypt
 from jose import jwt, JWTError
 from app.config import get_settings
 
 settings = get_settings()
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    except ValueError:
+        # Not a bcrypt hash (e.g. empty for OAuth-only accounts)
+        return False
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
@@ -38,3 +43,47 @@ def decode_token(token: str) -> dict | None:
         return payload
     except JWTError:
         return None
+
+
+# Verified access tokens -> (monotonic expiry, user id). Skips the JWT
+# signature check for tokens seen within the last minute; callers still
+# load the user row, so deactivation takes effect immediately.
+_TOKEN_CACHE_TTL = 60  # seconds
+_TOKEN_CACHE_MAX = 10_000
+_token_cache: dict[bytes, tuple[float, uuid.UUID]] = {}
+
+
+def _cache_token(key: bytes, user_id: uuid.UUID, exp: float) -> None:
+    now = time.monotonic()
+    ttl = min(_TOKEN_CACHE_TTL, exp - time.time())
+    if ttl <= 0:
+        return
+    if len(_token_cache) >= _TOKEN_CACHE_MAX:
+        for k in [k for k, (expires, _) in _token_cache.items() if expires <= now]:
+            del _token_cache[k]
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            _token_cache.clear()
+    _token_cache[key] = (now + ttl, user_id)
+
+
+def validate_access_token(token: str) -> uuid.UUID | None:
+    """Return the user id of a valid access token, or None."""
+    # Key by digest so raw bearer tokens aren't retained in memory
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    try:
+        payload = jwt.decode(
+            token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm],
+            options={"require_exp": True, "require_sub": True},
+        )
+        if payload.get("type") != "access":
+            return None
+        user_id = uuid.UUID(payload["sub"])
+    except (JWTError, ValueError):
+        return None
+
+    _cache_token(key, user_id, payload["exp"])
+    return user_id
@@ -13,6 +13,7 @@ It is already declared in ``pyproject.toml`` under ``[project.optional-dependenc
 from __future__ import annotations
 
 import uuid
+from fnmatch import fnmatchcase
 from typing import AsyncGenerator
 
 import pytest
@@ -20,7 +21,7 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import event, JSON
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB, INET
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, CITEXT, JSONB, INET
 
 # ---------------------------------------------------------------------------
 # Patch PostgreSQL-specific column types *before* importing any model so that
@@ -32,8 +33,9 @@ from sqlalchemy import String
 # UUID(as_uuid=True) -> CHAR(32)  (SQLAlchemy stores UUIDs as hex strings)
 # JSONB             -> JSON       (SQLite has built-in JSON1 via json type)
 # INET              -> VARCHAR    (not used in queries, just storage)
+# CITEXT            -> VARCHAR COLLATE NOCASE (case-insensitive like citext)
 
-from app.database import Base, get_db  # noqa: E402  (after type patches)
+from app.database import Base, get_db, get_readonly_db  # noqa: E402  (after type patches)
 from app.models.user import User  # noqa: E402
 from app.models.tenant import Tenant  # noqa: E402
 from app.models.credit import CreditBalance  # noqa: E402
@@ -90,6 +92,10 @@ def _compile_jsonb_sqlite(type_, compiler, **kw):
 def _compile_inet_sqlite(type_, compiler, **kw):
     return "VARCHAR"
 
+@compiles(CITEXT, "sqlite")
+def _compile_citext_sqlite(type_, compiler, **kw):
+    return "VARCHAR COLLATE NOCASE"
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -127,8 +133,8 @@ async def db_session(setup_database) -> AsyncGenerator[AsyncSession, None]:
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """
     FastAPI test client that uses ``httpx.AsyncClient`` with ``ASGITransport``.
-    The ``get_db`` dependency is overridden to inject the test session so all
-    requests share the same transactional session.
+    The ``get_db`` and ``get_readonly_db`` dependencies are overridden to inject
+    the test session so all requests share the same transactional session.
     """
     from app.main import app
 
@@ -136,6 +142,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_readonly_db] = _override_get_db
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
@@ -200,3 +207,32 @@ async def auth_headers(test_user: User) -> dict[str, str]:
         }
     )
     return {"Authorization": f"Bearer {token}"}
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis client behind ``app.services.cache``."""
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self.store[key] = value
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.store.pop(k, None) is not None for k in keys)
+
+    async def scan_iter(self, match: str = "*"):
+        for key in list(self.store):
+            if fnmatchcase(key, match):
+                yield key
+
+
+@pytest.fixture()
+def fake_redis(monkeypatch) -> FakeRedis:
+    """Back ``app.services.cache`` with an in-memory ``FakeRedis``."""
+    fake = FakeRedis()
+    monkeypatch.setattr("app.services.cache._get_redis", lambda: fake)
+    return fake
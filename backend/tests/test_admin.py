@@ -0,0 +1,46 @@
+"""
+Tests for the platform admin endpoints: /api/v1/admin/*
+"""
+
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.v1.admin import DASHBOARD_CACHE_KEY
+
+
+# ---------------------------------------------------------------------------
+# GET /api/v1/admin/dashboard
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_dashboard_totals_cached(client: AsyncClient, auth_headers, db_session, test_user, fake_redis):
+    """Totals come from one aggregate query and are then served from the cache."""
+    test_user.role = "super_admin"
+    await db_session.flush()
+
+    response = await client.get("/api/v1/admin/dashboard", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_users"] == 1
+    assert data["total_tenants"] == 1
+    assert data["total_credits_sold"] == 100
+    assert data["total_jobs"] == 0
+    assert DASHBOARD_CACHE_KEY in fake_redis.store
+
+    fake_redis.store[DASHBOARD_CACHE_KEY] = fake_redis.store[DASHBOARD_CACHE_KEY].replace(
+        '"total_users": 1', '"total_users": 7'
+    )
+    response = await client.get("/api/v1/admin/dashboard", headers=auth_headers)
+    assert response.json()["total_users"] == 7
+
+
+@pytest.mark.asyncio
+async def test_dashboard_requires_super_admin(client: AsyncClient, auth_headers):
+    """Tenant admins cannot see platform totals."""
+    response = await client.get("/api/v1/admin/dashboard", headers=auth_headers)
+
+    assert response.status_code == 403
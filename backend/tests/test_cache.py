@@ -0,0 +1,87 @@
+"""
+Tests for the Redis read-through cache helpers and their cached readers.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.models.system import SystemSetting
+from app.services import cache
+from app.services.system_settings import get_system_setting, setting_cache_key
+
+
+class _BrokenRedis:
+    """Redis client whose every call fails, like an unreachable server."""
+
+    async def get(self, key):
+        raise ConnectionError("redis down")
+
+    async def setex(self, key, ttl, value):
+        raise ConnectionError("redis down")
+
+    async def delete(self, *keys):
+        raise ConnectionError("redis down")
+
+
+# ---------------------------------------------------------------------------
+# cache.get_or_set / invalidate
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_loads_once(fake_redis):
+    """A miss calls the loader and caches it; a hit skips the loader."""
+    calls = []
+
+    async def _load():
+        calls.append(1)
+        return {"value": len(calls)}
+
+    assert await cache.get_or_set("k", _load, ttl=60) == {"value": 1}
+    assert await cache.get_or_set("k", _load, ttl=60) == {"value": 1}
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_prefix_drops_matching_keys(fake_redis):
+    """Only keys under the prefix are removed."""
+    fake_redis.store.update({"tb:services:list:_": "[]", "tb:services:categories": "[]", "other": "1"})
+
+    await cache.invalidate_prefix("tb:services:")
+
+    assert list(fake_redis.store) == ["other"]
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_fails_open(monkeypatch):
+    """With Redis unreachable the loader result is returned uncached."""
+    monkeypatch.setattr("app.services.cache._get_redis", lambda: _BrokenRedis())
+
+    async def _load():
+        return [1, 2, 3]
+
+    assert await cache.get_or_set("k", _load, ttl=60) == [1, 2, 3]
+    await cache.invalidate("k")
+
+
+# ---------------------------------------------------------------------------
+# system_settings.get_system_setting
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_system_setting_cached_until_invalidated(db_session, fake_redis):
+    """Reads are served from the cache until the key is invalidated."""
+    setting = SystemSetting(key="feature_flags", value={"post_discovery": True})
+    db_session.add(setting)
+    await db_session.flush()
+
+    assert await get_system_setting(db_session, "feature_flags") == {"post_discovery": True}
+
+    setting.value = {"post_discovery": False}
+    await db_session.flush()
+    assert await get_system_setting(db_session, "feature_flags") == {"post_discovery": True}
+
+    await cache.invalidate(setting_cache_key("feature_flags"))
+    assert await get_system_setting(db_session, "feature_flags") == {"post_discovery": False}
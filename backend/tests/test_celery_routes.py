@@ -0,0 +1,23 @@
+"""
+Tests for Celery task routing: scheduled tasks must land on a queue a worker consumes.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.celery_app import celery_app
+
+# Queues the Procfile / docker-compose / DEPLOY.md workers are started with
+CONSUMED_QUEUES = {"scraping", "default"}
+
+
+@pytest.mark.parametrize(
+    "task_name",
+    sorted({entry["task"] for entry in celery_app.conf.beat_schedule.values()}),
+)
+def test_beat_tasks_route_to_consumed_queue(task_name: str):
+    """Every beat task resolves to a queue some worker listens on."""
+    route = celery_app.amqp.router.route({}, task_name)
+
+    assert route["queue"].name in CONSUMED_QUEUES
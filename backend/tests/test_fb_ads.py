@@ -0,0 +1,138 @@
+"""
+Tests for the FB Ads model bulk-write helpers.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.fb_ads import FBCampaign, FBInsight, _MAX_BIND_PARAMS
+
+
+class _EmptyResult:
+    def all(self):
+        return []
+
+
+class _RecordingSession:
+    """Collects executed statements instead of running them."""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt, *args, **kwargs):
+        self.statements.append(stmt)
+        return _EmptyResult()
+
+
+def _insight_rows(count: int, sparse: bool = False) -> list[dict]:
+    """Insight rows shaped like MetaAPIService.get_insights output.
+
+    ``sparse`` rows carry only the key columns, so every metric comes from
+    its Python-side column default.
+    """
+    tenant_id = uuid.uuid4()
+    start = date(2026, 1, 1)
+    rows = []
+    for i in range(count):
+        row = {
+            "tenant_id": tenant_id,
+            "object_type": "ad",
+            "object_id": str(100 + i // 28),
+            "date": start + timedelta(days=i % 28),
+        }
+        if not sparse:
+            row.update({
+                "spend": 100, "impressions": 1000, "clicks": 10,
+                "ctr": 1.5, "cpc": 10, "cpm": 100, "results": 1,
+                "cost_per_result": 100, "purchase_value": 0, "roas": 0,
+                "actions": {},
+            })
+        rows.append(row)
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# FBInsight.bulk_upsert
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sparse", [False, True])
+async def test_bulk_upsert_batches_stay_under_bind_limit(sparse: bool):
+    """Large upserts are split so no statement exceeds asyncpg's bind parameter cap.
+
+    Sparse rows still bind every defaulted column, so they must not be
+    batched by their dict width alone.
+    """
+    session = _RecordingSession()
+    rows = _insight_rows(5000, sparse=sparse)
+
+    written = await FBInsight.bulk_upsert(session, rows)
+
+    assert written == 5000
+    assert len(session.statements) > 1
+    dialect = postgresql.asyncpg.dialect()
+    total = 0
+    for stmt in session.statements:
+        compiled = stmt.compile(dialect=dialect)
+        assert len(compiled.positiontup) <= _MAX_BIND_PARAMS
+        total += len(stmt._multi_values[0])
+    assert total == 5000
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_empty():
+    """No rows means no statements."""
+    session = _RecordingSession()
+
+    assert await FBInsight.bulk_upsert(session, []) == 0
+    assert session.statements == []
+
+
+# ---------------------------------------------------------------------------
+# _ExternalIdUpsertMixin.bulk_upsert_by_external_id
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_external_id_upsert_collapses_duplicates_and_guards_tenant():
+    """Repeated external ids are sent once, and conflicts only update the same tenant's row."""
+    session = _RecordingSession()
+    tenant_id, account_id = uuid.uuid4(), uuid.uuid4()
+    rows = [
+        {"tenant_id": tenant_id, "ad_account_id": account_id, "campaign_id": "1", "name": "old"},
+        {"tenant_id": tenant_id, "ad_account_id": account_id, "campaign_id": "2", "name": "other"},
+        {"tenant_id": tenant_id, "ad_account_id": account_id, "campaign_id": "1", "name": "new"},
+    ]
+
+    await FBCampaign.bulk_upsert_by_external_id(session, rows)
+
+    (stmt,) = session.statements
+    compiled = stmt.compile(dialect=postgresql.asyncpg.dialect())
+    assert [compiled.params[f"campaign_id_m{i}"] for i in range(2)] == ["1", "2"]
+    assert "campaign_id_m2" not in compiled.params
+    assert compiled.params["name_m0"] == "new"
+    assert "WHERE fb_campaigns.tenant_id = excluded.tenant_id" in str(compiled)
+
+
+@pytest.mark.asyncio
+async def test_external_id_upsert_sparse_rows_stay_under_bind_limit():
+    """Column defaults (id, status, ...) count towards each row's bind parameters."""
+    session = _RecordingSession()
+    tenant_id, account_id = uuid.uuid4(), uuid.uuid4()
+    rows = [
+        {"tenant_id": tenant_id, "ad_account_id": account_id, "campaign_id": str(i), "name": "c"}
+        for i in range(10000)
+    ]
+
+    await FBCampaign.bulk_upsert_by_external_id(session, rows)
+
+    assert len(session.statements) > 1
+    dialect = postgresql.asyncpg.dialect()
+    for stmt in session.statements:
+        assert len(stmt.compile(dialect=dialect).positiontup) <= _MAX_BIND_PARAMS
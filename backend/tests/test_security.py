@@ -0,0 +1,72 @@
+"""
+Tests for access-token validation and its in-process cache.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import timedelta
+
+import pytest
+from httpx import AsyncClient
+
+from app.utils import security
+from app.utils.security import create_access_token, create_refresh_token, validate_access_token
+
+
+@pytest.fixture(autouse=True)
+def _empty_token_cache(monkeypatch):
+    monkeypatch.setattr(security, "_token_cache", {})
+
+
+# ---------------------------------------------------------------------------
+# validate_access_token
+# ---------------------------------------------------------------------------
+
+
+def test_validated_token_skips_signature_check(monkeypatch):
+    """A token seen once is answered from the cache without decoding it again."""
+    user_id = uuid.uuid4()
+    token = create_access_token({"sub": str(user_id)})
+    assert validate_access_token(token) == user_id
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("token decoded twice")
+
+    monkeypatch.setattr(security.jwt, "decode", _fail)
+    assert validate_access_token(token) == user_id
+
+
+def test_rejected_tokens_not_cached():
+    """Refresh tokens and garbage are refused and leave no cache entry."""
+    refresh = create_refresh_token({"sub": str(uuid.uuid4())})
+
+    assert validate_access_token(refresh) is None
+    assert validate_access_token("not-a-jwt") is None
+    assert security._token_cache == {}
+
+
+def test_cache_entry_never_outlives_token():
+    """An already-expired token is neither accepted nor cached."""
+    token = create_access_token({"sub": str(uuid.uuid4())}, expires_delta=timedelta(seconds=-1))
+
+    assert validate_access_token(token) is None
+    assert security._token_cache == {}
+
+
+# ---------------------------------------------------------------------------
+# get_current_user
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_cached_token_still_checks_user_is_active(client: AsyncClient, auth_headers, db_session, test_user):
+    """Deactivation applies immediately even while the token is cached."""
+    response = await client.get("/api/v1/auth/me", headers=auth_headers)
+    assert response.status_code == 200
+
+    test_user.is_active = False
+    await db_session.flush()
+
+    response = await client.get("/api/v1/auth/me", headers=auth_headers)
+    assert response.status_code == 401
@@ -0,0 +1,145 @@
+"""
+Tests for the user-facing Traffic Bot endpoints: /api/v1/traffic-bot/*
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+
+from app.models.traffic_bot import TrafficBotService, TrafficBotWalletDeposit
+from app.services import cache
+from app.services import traffic_bot_service as svc
+
+
+async def _add_service(db_session, **overrides) -> TrafficBotService:
+    service = TrafficBotService(
+        external_service_id=overrides.pop("external_service_id", 1001),
+        name=overrides.pop("name", "Page Likes"),
+        category=overrides.pop("category", "Facebook"),
+        rate=overrides.pop("rate", 2),
+        **overrides,
+    )
+    db_session.add(service)
+    await db_session.flush()
+    return service
+
+
+# ---------------------------------------------------------------------------
+# GET /api/v1/traffic-bot/services
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_list_services_served_from_cache(client: AsyncClient, auth_headers, db_session, fake_redis):
+    """The listing is cached until the services prefix is invalidated."""
+    service = await _add_service(db_session)
+
+    response = await client.get("/api/v1/traffic-bot/services", headers=auth_headers)
+    assert response.status_code == 200
+    assert [s["name"] for s in response.json()] == ["Page Likes"]
+    assert svc.services_cache_key(None) in fake_redis.store
+
+    service.name = "Page Followers"
+    await db_session.flush()
+    response = await client.get("/api/v1/traffic-bot/services", headers=auth_headers)
+    assert [s["name"] for s in response.json()] == ["Page Likes"]
+
+    await cache.invalidate_prefix(svc.SERVICES_CACHE_PREFIX)
+    response = await client.get("/api/v1/traffic-bot/services", headers=auth_headers)
+    assert [s["name"] for s in response.json()] == ["Page Followers"]
+
+
+@pytest.mark.asyncio
+async def test_list_categories_skips_disabled(client: AsyncClient, auth_headers, db_session, fake_redis):
+    """Categories list only enabled services and are cached under their own key."""
+    await _add_service(db_session, external_service_id=1, category="Facebook")
+    await _add_service(db_session, external_service_id=2, category="TikTok", is_enabled=False)
+
+    response = await client.get("/api/v1/traffic-bot/services/categories", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json() == ["Facebook"]
+    assert svc.CATEGORIES_CACHE_KEY in fake_redis.store
+
+
+# ---------------------------------------------------------------------------
+# POST /api/v1/traffic-bot/orders
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_create_order_queues_notifications(client: AsyncClient, auth_headers, db_session, test_user, monkeypatch):
+    """Placing an order queues the admin alert and, for linked users, the Telegram confirmation."""
+    from app.api.v1 import traffic_bot as tb_api
+
+    queued = []
+    monkeypatch.setattr(tb_api.notify_traffic_bot_order_task, "delay", lambda *a: queued.append(("admin", a)))
+    monkeypatch.setattr(tb_api.send_tb_order_notification_task, "delay", lambda *a: queued.append(("telegram", a)))
+
+    async def _add_order(**kwargs):
+        return {"order": 555}
+
+    monkeypatch.setattr(svc.traffic_bot_api, "add_order", _add_order)
+
+    service = await _add_service(db_session)
+    await svc.deposit(db_session, test_user.tenant_id, 100)
+    test_user.telegram_chat_id = "12345"
+    await db_session.flush()
+
+    response = await client.post(
+        "/api/v1/traffic-bot/orders",
+        json={"service_id": str(service.id), "link": "https://facebook.com/p/1", "quantity": 1000},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    order_id = response.json()["id"]
+    assert response.json()["status"] == "processing"
+    assert queued == [
+        ("admin", (order_id,)),
+        ("telegram", ("12345", order_id, "Page Likes")),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# GET /api/v1/traffic-bot/wallet/deposits
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_list_deposits_keyset_pages_through_ties(client: AsyncClient, auth_headers, db_session, test_user):
+    """Paging with (before, before_id) visits every deposit once, even when created_at ties."""
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    stamps = [base, base + timedelta(minutes=1), base + timedelta(minutes=1), base + timedelta(minutes=1), base + timedelta(minutes=2)]
+    for stamp in stamps:
+        db_session.add(TrafficBotWalletDeposit(
+            id=uuid.uuid4(),
+            tenant_id=test_user.tenant_id,
+            user_id=test_user.id,
+            amount=Decimal("10"),
+            status="pending",
+            bank_reference="REF",
+            created_at=stamp,
+        ))
+    await db_session.flush()
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = await client.get("/api/v1/traffic-bot/wallet/deposits", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        page = response.json()
+        if not page:
+            break
+        seen.extend(page)
+        params = {"limit": 2, "before": page[-1]["created_at"], "before_id": page[-1]["id"]}
+
+    assert len(seen) == 5
+    assert len({d["id"] for d in seen}) == 5
+    keys = [(d["created_at"], d["id"]) for d in seen]
+    assert keys == sorted(keys, reverse=True)
@@ -0,0 +1,91 @@
+"""
+Tests for the trends endpoints: /api/v1/trends/*
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.v1.trends import source_pages_cache_key
+from app.models.job import ScrapingJob
+from app.models.platform import Platform
+
+
+async def _add_platform(db_session) -> Platform:
+    platform = Platform(id=uuid.uuid4(), name="facebook", display_name="Facebook")
+    db_session.add(platform)
+    await db_session.flush()
+    return platform
+
+
+async def _add_discovery_job(db_session, user, platform, page: str, rows: int) -> ScrapingJob:
+    job = ScrapingJob(
+        tenant_id=user.tenant_id,
+        user_id=user.id,
+        platform_id=platform.id,
+        job_type="post_discovery",
+        input_type="page_id",
+        input_value=page,
+        status="completed",
+        result_row_count=rows,
+    )
+    db_session.add(job)
+    await db_session.flush()
+    return job
+
+
+# ---------------------------------------------------------------------------
+# GET /api/v1/trends/source-pages
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_source_pages_cached_per_tenant(client: AsyncClient, auth_headers, db_session, test_user, fake_redis):
+    """Pages are aggregated per input and then served from the tenant's cache key."""
+    platform = await _add_platform(db_session)
+    await _add_discovery_job(db_session, test_user, platform, "page-a", 10)
+    await _add_discovery_job(db_session, test_user, platform, "page-a", 5)
+    await _add_discovery_job(db_session, test_user, platform, "page-b", 30)
+
+    response = await client.get("/api/v1/trends/source-pages", headers=auth_headers)
+
+    assert response.status_code == 200
+    expected = {
+        "pages": [
+            {"input_value": "page-b", "job_count": 1, "total_posts": 30},
+            {"input_value": "page-a", "job_count": 2, "total_posts": 15},
+        ]
+    }
+    assert response.json() == expected
+    assert source_pages_cache_key(test_user.tenant_id) in fake_redis.store
+
+    # A job that bypasses the API is invisible until the key expires
+    await _add_discovery_job(db_session, test_user, platform, "page-c", 99)
+    response = await client.get("/api/v1/trends/source-pages", headers=auth_headers)
+    assert response.json() == expected
+
+
+@pytest.mark.asyncio
+async def test_create_post_discovery_job_invalidates_source_pages(client: AsyncClient, auth_headers, db_session, test_user, fake_redis):
+    """Creating a post_discovery job drops the tenant's cached source pages."""
+    await _add_platform(db_session)
+    key = source_pages_cache_key(test_user.tenant_id)
+    fake_redis.store[key] = '{"pages": []}'
+
+    response = await client.post(
+        "/api/v1/jobs",
+        json={
+            "job_type": "post_discovery",
+            "input_type": "page_id",
+            "input_value": "page-a",
+            "scheduled_at": (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat(),
+        },
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 201
+    assert key not in fake_redis.store
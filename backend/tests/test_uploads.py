@@ -0,0 +1,90 @@
+"""
+Tests for the payment proof upload endpoint: /api/v1/uploads/proof
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+from httpx import AsyncClient
+
+from app.config import get_settings
+
+PNG_HEAD = b"\x89PNG\r\n\x1a\n"
+
+
+@pytest.fixture()
+def upload_settings(tmp_path, monkeypatch):
+    """Point uploads at a temp dir with a 1MB limit."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "upload_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "max_upload_size_mb", 1)
+    return settings
+
+
+def _proof_files(tmp_path) -> list[str]:
+    proof_dir = tmp_path / "proofs"
+    return os.listdir(proof_dir) if proof_dir.exists() else []
+
+
+# ---------------------------------------------------------------------------
+# POST /api/v1/uploads/proof
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_upload_proof_success(client: AsyncClient, auth_headers, upload_settings, tmp_path):
+    """A valid PNG is stored under proofs/ and its URL returned."""
+    body = PNG_HEAD + b"\x00" * 1024
+    response = await client.post(
+        "/api/v1/uploads/proof",
+        files={"file": ("proof.png", body, "image/png")},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["filename"].endswith(".png")
+    assert data["proof_url"].endswith(f"/uploads/proofs/{data['filename']}")
+    assert (tmp_path / "proofs" / data["filename"]).read_bytes() == body
+
+
+@pytest.mark.asyncio
+async def test_upload_proof_declared_length_too_large(client: AsyncClient, auth_headers, upload_settings, tmp_path):
+    """A body well over the limit is rejected from Content-Length with 413."""
+    body = PNG_HEAD + b"\x00" * (2 * 1024 * 1024)
+    response = await client.post(
+        "/api/v1/uploads/proof",
+        files={"file": ("proof.png", body, "image/png")},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 413
+    assert _proof_files(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_upload_proof_streamed_too_large(client: AsyncClient, auth_headers, upload_settings, tmp_path):
+    """A file just over the limit passes the header allowance, fails while streaming with 413, and leaves no partial file."""
+    body = PNG_HEAD + b"\x00" * (1024 * 1024)
+    response = await client.post(
+        "/api/v1/uploads/proof",
+        files={"file": ("proof.png", body, "image/png")},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 413
+    assert _proof_files(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_upload_proof_signature_mismatch(client: AsyncClient, auth_headers, upload_settings):
+    """Content that doesn't match the claimed type is rejected."""
+    response = await client.post(
+        "/api/v1/uploads/proof",
+        files={"file": ("proof.png", b"not really a png", "image/png")},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 400